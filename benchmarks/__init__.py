@@ -0,0 +1 @@
+"""Benchmarks for rss-feed-tui. Run modules with ``python -m benchmarks.<name>``."""
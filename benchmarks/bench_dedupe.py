@@ -0,0 +1,164 @@
+"""Near-duplicate detection: throughput, accuracy and index size.
+
+A synthetic stream of ``--entries`` stories is built from a Zipf-like
+vocabulary. About ``--dup-rate`` of them repeat an earlier story, half as a
+syndicated copy (new headline, a few words edited, a byline appended) and
+half as an aggregator re-post of the same link with tracking parameters.
+
+The stories are merged into a temporary ``AsyncArticleStore``, ``--batch``
+at a time as a feed refresh would, which runs the full pipeline: canonical
+links, a MinHash signature, an indexed lookup and the insert. The benchmark
+reports the cost of the pure stages, store throughput, and recall and false
+matches against the known repeats. A brute-force scan over all earlier
+signatures is timed on a sample to show what the band index saves.
+
+Usage: python -m benchmarks.bench_dedupe [--entries 100000] [--dup-rate 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from itertools import accumulate
+from pathlib import Path
+from typing import List, Tuple
+
+from src.dedupe import THRESHOLD, link_keys, signature, similarity
+from src.models import Entry
+from src.store import AsyncArticleStore
+
+# (guid, link, title, summary, index of the story it repeats or -1)
+Story = Tuple[str, str, str, str, int]
+
+
+def _stories(count: int, dup_rate: float, seed: int = 19) -> List[Story]:
+    rng = random.Random(seed)
+    vocabulary = [f"w{n}x" for n in range(20_000)]
+    # Zipf-like, minus the very top: stop words never reach the signature.
+    cumulative = list(accumulate(1 / (rank + 50) for rank in range(20_000)))
+
+    def words(n: int) -> List[str]:
+        return rng.choices(vocabulary, cum_weights=cumulative, k=n)
+
+    stories: List[Story] = []
+    originals: List[int] = []
+    for n in range(count):
+        if originals and rng.random() < dup_rate:
+            source = rng.choice(originals)
+            guid, link, title, summary, _ = stories[source]
+            if rng.random() < 0.5:
+                text = summary.split()
+                for _ in range(3):
+                    text[rng.randrange(len(text))] = rng.choice(vocabulary)
+                stories.append(
+                    (
+                        f"https://wire.example/{n}",
+                        f"https://wire.example/{n}",
+                        " ".join(words(8)),
+                        " ".join(text + ["Reporting", "by", "Wire", "staff"]),
+                        source,
+                    )
+                )
+            else:
+                repost = link.replace("https://www.", "http://") + "?utm_source=hn"
+                stories.append((f"hn-{n}", repost, title, "Comments", source))
+            continue
+        originals.append(n)
+        stories.append(
+            (
+                f"https://www.site{n % 50}.example/{n}",
+                f"https://www.site{n % 50}.example/{n}",
+                " ".join(words(8)),
+                " ".join(words(rng.randint(40, 80))),
+                -1,
+            )
+        )
+    return stories
+
+
+async def _store(stories: List[Story], batch: int) -> Tuple[float, List[int | None]]:
+    """Merge the stories ``batch`` at a time; return the time and dup_of."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AsyncArticleStore(Path(tmp) / "articles.db")
+        try:
+            start = time.perf_counter()
+            for first in range(0, len(stories), batch):
+                chunk = stories[first : first + batch]
+                await store.merge(
+                    f"https://feed{first // batch % 500}.example/rss",
+                    [
+                        Entry(guid, title=title, link=link, summary=summary)
+                        for guid, link, title, summary, _ in chunk
+                    ],
+                )
+            elapsed = time.perf_counter() - start
+
+            def _dup_of() -> List[int | None]:
+                rows = store._connect().execute(
+                    "SELECT dup_of FROM articles ORDER BY id"
+                )
+                # Row ids count from 1 in story order.
+                return [None if r[0] is None else r[0] - 1 for r in rows]
+
+            return elapsed, await store._run(_dup_of)
+        finally:
+            await store.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--dup-rate", type=float, default=0.2)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--brute-sample", type=int, default=20)
+    args = parser.parse_args()
+
+    stories = _stories(args.entries, args.dup_rate)
+    print(f"{len(stories)} stories, {sum(s[4] >= 0 for s in stories)} repeats")
+
+    start = time.perf_counter()
+    for guid, link, _, _, _ in stories:
+        link_keys(guid, link)
+    links_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sigs = [signature(title, summary) for _, _, title, summary, _ in stories]
+    sig_time = time.perf_counter() - start
+
+    store_time, found = asyncio.run(_store(stories, args.batch))
+
+    repeats = [n for n, story in enumerate(stories) if story[4] >= 0]
+    caught = sum(found[n] == stories[n][4] for n in repeats)
+    false = sum(
+        original is not None and stories[n][4] != original
+        for n, original in enumerate(found)
+    )
+
+    # Brute force: compare the last stories against every original before them.
+    sample = range(len(stories) - args.brute_sample, len(stories))
+    start = time.perf_counter()
+    for n in sample:
+        if sigs[n] is None:
+            continue
+        for m in range(n):
+            if found[m] is None and sigs[m] is not None:
+                if similarity(sigs[m], sigs[n]) >= THRESHOLD:
+                    break
+    brute = (time.perf_counter() - start) / len(sample)
+
+    print(f"  canonical links          {links_time * 1000:8.0f} ms")
+    print(f"  signatures               {sig_time * 1000:8.0f} ms")
+    print(
+        f"  store merge with dedupe  {store_time:8.2f} s "
+        f" ({len(stories) / store_time:,.0f} articles/s, batches of {args.batch})"
+    )
+    print(f"  recall                   {caught / len(repeats):8.1%}")
+    print(f"  false matches            {false:8d}")
+    print(f"  brute-force lookup at the end of the stream {brute * 1000:,.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Memory retained per entry: feedparser dicts vs plain dicts vs ``Entry``.
+
+Parses ``--entries`` synthetic entries spread over ``--feeds`` feeds with a
+handful of rotating authors, and measures with tracemalloc what stays alive
+once only the entry list is kept:
+
+* ``feedparser``: the raw ``FeedParserDict`` entries (``*_detail``, ``links``,
+  parsed dates, ...), as the article list used to hold them.
+* ``dict``: the normalised per-entry dicts the parser returned before.
+* ``Entry``: the slotted model with interned authors.
+
+tracemalloc slows feedparser down a lot; the default run takes minutes.
+
+Usage: python -m benchmarks.bench_entry_memory [--entries 50000] [--feeds 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import feedparser
+
+from benchmarks.feedserver import make_rss
+from src.parsing import _entry_content, _timestamp, parse_feed_bytes
+
+
+def _feedparser_entries(body: bytes) -> List[Any]:
+    return feedparser.parse(body).entries
+
+
+def _dict_entries(body: bytes) -> List[Dict[str, Any]]:
+    # The dict shape parse_feed_bytes produced before Entry existed.
+    entries = []
+    for entry in feedparser.parse(body).entries:
+        link = entry.get("link", "")
+        entries.append(
+            {
+                "id": entry.get("id") or link,
+                "title": entry.get("title", "Untitled"),
+                "link": link,
+                "summary": _entry_content(entry),
+                "author": entry.get("author", ""),
+                "published": entry.get("published") or entry.get("updated", ""),
+                "published_ts": _timestamp(entry),
+            }
+        )
+    return entries
+
+
+def _model_entries(body: bytes) -> List[Any]:
+    return parse_feed_bytes(body)["entries"]
+
+
+def _measure(
+    name: str, build: Callable[[bytes], List[Any]], bodies: List[bytes]
+) -> int:
+    gc.collect()
+    tracemalloc.start()
+    retained = [build(body) for body in bodies]
+    gc.collect()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = sum(len(entries) for entries in retained)
+    print(
+        f"{name:<10} {size / 1e6:8.1f} MB retained   {size / count:7.0f} B/entry"
+        f"   peak {peak / 1e6:8.1f} MB"
+    )
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=50_000)
+    parser.add_argument("--feeds", type=int, default=50)
+    parser.add_argument("--summary-size", type=int, default=400)
+    args = parser.parse_args()
+
+    per_feed = max(1, args.entries // args.feeds)
+    bodies = [
+        make_rss(f"feed{i}", per_feed, args.summary_size, authors=8)
+        for i in range(args.feeds)
+    ]
+    print(f"{args.feeds} feeds x {per_feed} entries")
+    raw = _measure("feedparser", _feedparser_entries, bodies)
+    plain = _measure("dict", _dict_entries, bodies)
+    model = _measure("Entry", _model_entries, bodies)
+    print(
+        f"Entry is {plain / model:.2f}x smaller than dict, "
+        f"{raw / model:.2f}x smaller than feedparser"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Full-article opens: fetched on demand against prefetched, and the disk cache.
+
+Serves ``--articles`` article pages with ``--latency`` per response, then:
+
+* times extraction of one page in a loop;
+* opens every article cold (download, extract, store) and again after
+  prefetching them, which should cost a disk read;
+* fills an article cache well past its byte limit and checks the directory
+  stays within it.
+
+Usage: python -m benchmarks.bench_fulltext [--articles 40] [--latency 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from benchmarks.feedserver import FeedServer, make_page
+from src.async_feed import AsyncFeedLoader
+from src.fulltext import ArticleCache, FullTextFetcher, extract_article
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _extraction(rounds: int) -> float:
+    """Milliseconds to extract one page."""
+    page = make_page("benchmark").decode("utf-8")
+    start = time.perf_counter()
+    for _ in range(rounds):
+        extract_article(page)
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+async def _opens(fetcher: FullTextFetcher, links: List[str]) -> List[float]:
+    times = []
+    for link in links:
+        start = time.perf_counter()
+        await fetcher.get(link)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+async def _open_latency(articles: int, latency: float, cache_dir: Path) -> None:
+    async with FeedServer(latency=latency) as server:
+        async with AsyncFeedLoader() as loader:
+            cold_links = [server.url(f"cold{i}", route="page") for i in range(articles)]
+            warm_links = [server.url(f"warm{i}", route="page") for i in range(articles)]
+            fetcher = FullTextFetcher(loader, ArticleCache(cache_dir))
+            cold = await _opens(fetcher, cold_links)
+
+            start = time.perf_counter()
+            fetcher.prefetch(warm_links)
+            while fetcher._workers:
+                await asyncio.sleep(0.01)
+            prefetch = time.perf_counter() - start
+            requests = server.pages
+            warm = await _opens(fetcher, warm_links)
+            await fetcher.close()
+
+    print(f"{'open':<12} {'p50 ms':>8} {'p95 ms':>8}")
+    for name, times in (("cold", cold), ("prefetched", warm)):
+        p50 = _percentile(times, 0.5) * 1000
+        p95 = _percentile(times, 0.95) * 1000
+        print(f"{name:<12} {p50:8.2f} {p95:8.2f}")
+    print(
+        f"prefetched {articles} articles in {prefetch:.2f}s "
+        f"({fetcher.concurrency} at a time); opening them made "
+        f"{server.pages - requests} requests"
+    )
+
+
+async def _eviction(cache_dir: Path, limit: int, articles: int) -> None:
+    cache = ArticleCache(cache_dir, max_bytes=limit)
+    content = extract_article(make_page("benchmark").decode("utf-8"))[1]
+    for i in range(articles):
+        await cache.put(f"https://example.com/{i}", content + str(i))
+    on_disk = sum(path.stat().st_size for path in cache_dir.iterdir())
+    kept = len(list(cache_dir.iterdir()))
+    print(
+        f"stored {articles} articles under a {limit / 1024:.0f} KiB limit: "
+        f"{kept} kept, {on_disk / 1024:.0f} KiB on disk"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--limit-kib", type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"extraction: {_extraction(args.rounds):.2f} ms per page")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_open_latency(args.articles, args.latency, Path(tmp) / "opens"))
+        asyncio.run(_eviction(Path(tmp) / "evict", args.limit_kib * 1024, 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Compare per-fetch ClientSession vs the shared pooled session.
+
+Usage: python -m benchmarks.bench_http_pool [--fetches 200] [--hosts 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import aiohttp
+
+from benchmarks.feedserver import FeedServer
+from src.async_feed import AsyncFeedLoader
+
+
+async def _fresh_session_fetch(url: str) -> None:
+    """The old code path: new session, connector and socket per fetch."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as resp:
+            await resp.text()
+
+
+async def _run(fetches: int, hosts: int) -> None:
+    async with FeedServer() as server:
+        urls = [server.url(f"feed{i % hosts}") for i in range(fetches)]
+
+        fresh: List[float] = []
+        for url in urls:
+            start = time.perf_counter()
+            await _fresh_session_fetch(url)
+            fresh.append(time.perf_counter() - start)
+
+        pooled: List[float] = []
+        async with AsyncFeedLoader() as loader:
+            for url in urls:
+                start = time.perf_counter()
+                await loader.load_feed(url)
+                pooled.append(time.perf_counter() - start)
+
+        # Parsing is identical in both paths; time the raw fetch too.
+        raw: List[float] = []
+        async with AsyncFeedLoader() as loader:
+            session = loader._get_session()
+            for url in urls:
+                start = time.perf_counter()
+                async with session.get(url) as resp:
+                    await resp.text()
+                raw.append(time.perf_counter() - start)
+
+    def _report(name: str, samples: List[float]) -> None:
+        samples = sorted(samples)
+        p95 = samples[int(len(samples) * 0.95) - 1]
+        print(
+            f"{name:<28} mean {statistics.mean(samples) * 1000:7.2f} ms"
+            f"   p50 {statistics.median(samples) * 1000:7.2f} ms"
+            f"   p95 {p95 * 1000:7.2f} ms"
+        )
+
+    print(f"{fetches} fetches across {hosts} feed(s) on 127.0.0.1")
+    _report("fresh session (fetch only)", fresh)
+    _report("pooled session (fetch only)", raw)
+    _report("pooled load_feed (+parse)", pooled)
+    saved = statistics.mean(fresh) - statistics.mean(raw)
+    print(f"Connection reuse saves {saved * 1000:.2f} ms per fetch on loopback")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fetches", type=int, default=200)
+    parser.add_argument("--hosts", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(_run(args.fetches, args.hosts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Cost of the metrics hooks, with collection off and on.
+
+Times one instrumented call (``span`` around an empty block, ``count`` and
+``record``) in a tight loop, then a refresh of ``--feeds`` local feeds with
+collection off and on. Off, a hook should cost about as much as calling an
+empty function; on, the refresh should not get measurably slower.
+
+Usage: python -m benchmarks.bench_metrics [--calls 1000000] [--feeds 300]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Dict
+
+from benchmarks.feedserver import FeedServer
+from src import metrics
+from src.async_feed import AsyncFeedLoader
+from src.refresh import FeedRefresher
+
+
+def _empty() -> None:
+    pass
+
+
+def _per_call(calls: int) -> Dict[str, float]:
+    """Nanoseconds per call of each hook."""
+    timings = {}
+    start = time.perf_counter()
+    for _ in range(calls):
+        _empty()
+    timings["empty function"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(calls):
+        with metrics.span("stage", "feed"):
+            pass
+    timings["span"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(calls):
+        metrics.count("counter", feed="feed")
+    timings["count"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(calls):
+        metrics.record("stage", 0.001, "feed")
+    timings["record"] = time.perf_counter() - start
+    return {name: seconds / calls * 1e9 for name, seconds in timings.items()}
+
+
+async def _refresh(feeds: int, rounds: int) -> float:
+    """Median wall time of ``rounds`` refreshes of every feed."""
+    async with FeedServer(entries=20, hosts=4) as server:
+        table = {f"feed{i}": server.url(f"feed{i}", host=i) for i in range(feeds)}
+        times = []
+        # A new loader per round, so tracing follows the current setting.
+        for _ in range(rounds):
+            async with AsyncFeedLoader() as loader:
+                refresher = FeedRefresher(loader, concurrency=64, per_host=16)
+                start = time.perf_counter()
+                await refresher.refresh_all(table)
+                times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--feeds", type=int, default=300)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    metrics.disable()
+    off = _per_call(args.calls)
+    off_refresh = asyncio.run(_refresh(args.feeds, args.rounds))
+    metrics.enable()
+    on = _per_call(args.calls)
+    on_refresh = asyncio.run(_refresh(args.feeds, args.rounds))
+
+    print(f"{'per call':<16} {'off':>8} {'on':>8}")
+    for name in off:
+        print(f"  {name:<14} {off[name]:6.0f}ns {on[name]:6.0f}ns")
+    print(f"refresh of {args.feeds} feeds (median of {args.rounds})")
+    print(f"  collection off {off_refresh * 1000:8.0f} ms")
+    print(f"  collection on  {on_refresh * 1000:8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
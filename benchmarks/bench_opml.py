@@ -0,0 +1,77 @@
+"""OPML import of a large subscription list against a slow local server.
+
+``--feeds`` outlines are spread over ``--hosts`` loopback hosts, each
+response delayed by ``--latency`` seconds. One in ``--moved-every`` points
+at a permanent redirect and one in ``--broken-every`` at a missing page;
+a few repeat an earlier URL. The import validates every feed, so checking
+them one at a time would cost about ``feeds * latency``.
+
+The feed list is written to a temporary home directory, never to yours.
+
+Usage: python -m benchmarks.bench_opml [--feeds 2000] [--hosts 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from benchmarks.feedserver import FeedServer
+from src.async_feed import AsyncFeedLoader, AsyncFileHandler
+from src.opml import build_opml, import_opml, parse_opml
+
+
+async def _run(args: argparse.Namespace) -> None:
+    async with FeedServer(entries=20, latency=args.latency, hosts=args.hosts) as server:
+        outlines = {}
+        for i in range(args.feeds):
+            route = "feed"
+            if i % args.moved_every == 1:
+                route = "moved"
+            elif i % args.broken_every == 2:
+                route = "missing"
+            outlines[f"Feed {i}"] = server.url(f"feed{i}", host=i, route=route)
+        # Exports from other readers often list a feed in two folders.
+        for i in range(0, args.feeds, 100):
+            outlines[f"Copy of feed {i}"] = outlines[f"Feed {i}"]
+        data = build_opml(outlines)
+
+        start = time.perf_counter()
+        parse_opml(data)
+        parse_time = time.perf_counter() - start
+
+        async with AsyncFeedLoader() as loader:
+            start = time.perf_counter()
+            report = await import_opml(data, loader, concurrency=args.concurrency)
+            await AsyncFileHandler.flush()
+            elapsed = time.perf_counter() - start
+        saved = await AsyncFileHandler.load_feeds()
+
+    print(f"{len(outlines)} outlines on {args.hosts} hosts, ", end="")
+    print(f"{args.latency * 1000:.0f} ms per response")
+    print(f"  parse OPML           {parse_time * 1000:8.1f} ms")
+    print(f"  sequential estimate  {args.feeds * args.latency:8.2f} s")
+    print(f"  import               {elapsed:8.2f} s   ({report.summary()})")
+    print(f"  server requests      {server.requests:8d}")
+    print(f"  saved feeds          {len(saved):8d}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--feeds", type=int, default=2000)
+    parser.add_argument("--hosts", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--moved-every", type=int, default=10)
+    parser.add_argument("--broken-every", type=int, default=25)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["HOME"] = home
+        asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Event-loop frame latency while many large feeds are parsed.
+
+A ticker coroutine asks to wake every 1/60 s (one UI frame) and records how
+late it actually ran while ``--feeds`` large feeds are loaded concurrently.
+Inline parsing (the old behaviour) blocks the loop for each parse; the
+thread and process executors keep frame lag flat. Inline parsing starves
+the other downloads, so loaders get 5 minutes instead of the usual 15 s,
+and a mode that fails anyway is reported rather than ending the run.
+
+Usage: python -m benchmarks.bench_parse_offloop [--feeds 50] [--entries 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from benchmarks.feedserver import FeedServer
+from src.async_feed import AsyncFeedLoader
+
+FRAME = 1 / 60
+
+
+async def _ticker(lags: List[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(FRAME)
+        lags.append(time.perf_counter() - start - FRAME)
+
+
+async def _measure(server: FeedServer, mode: str | None, feeds: int) -> None:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    async with AsyncFeedLoader(parse_executor=mode, timeout=300) as loader:
+        ticker = asyncio.create_task(_ticker(lags, stop))
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(
+                *(loader.load_feed(server.url(f"big{i}")) for i in range(feeds))
+            )
+        except Exception as exc:
+            print(f"{str(mode or 'inline'):<8} failed: {type(exc).__name__}: {exc}")
+            return
+        finally:
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await ticker
+
+    lags.sort()
+    p95 = lags[max(0, int(len(lags) * 0.95) - 1)] if lags else 0.0
+    worst = lags[-1] if lags else 0.0
+    print(
+        f"{str(mode or 'inline'):<8} total {elapsed:6.2f} s   frames {len(lags):4d}"
+        f"   p95 lag {p95 * 1000:8.1f} ms   worst lag {worst * 1000:8.1f} ms"
+    )
+
+
+async def _run(feeds: int, entries: int) -> None:
+    async with FeedServer(entries=entries, summary_size=1500) as server:
+        size = len(server._body("big0")) / 1e6
+        print(f"{feeds} feeds x {entries} entries (~{size:.1f} MB each)")
+        for mode in (None, "thread", "process"):
+            await _measure(server, mode, feeds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--feeds", type=int, default=50)
+    parser.add_argument("--entries", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(_run(args.feeds, args.entries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Refresh-all wall time against a slow local server.
+
+Every response is delayed by ``--latency`` seconds. Fetching feeds one at a
+time costs roughly ``feeds * latency``; FeedRefresher should finish in
+about ``feeds / min(concurrency, hosts * per_host) * latency``.
+
+Usage: python -m benchmarks.bench_refresh_all [--feeds 500] [--hosts 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.feedserver import FeedServer
+from src.async_feed import AsyncFeedLoader
+from src.refresh import FeedRefresher
+
+
+async def _run(feeds: int, hosts: int, latency: float, concurrency: int) -> None:
+    async with FeedServer(entries=20, latency=latency, hosts=hosts) as server:
+        table = {f"feed{i}": server.url(f"feed{i}", host=i) for i in range(feeds)}
+        async with AsyncFeedLoader() as loader:
+            refresher = FeedRefresher(loader, concurrency=concurrency)
+            start = time.perf_counter()
+            results = await refresher.refresh_all(table)
+            elapsed = time.perf_counter() - start
+
+    failed = sum(not result.ok for result in results)
+    slowest = max(result.elapsed for result in results)
+    print(f"{feeds} feeds on {hosts} hosts, {latency * 1000:.0f} ms per response")
+    print(f"sequential estimate  {feeds * latency:8.2f} s")
+    print(f"refresh_all          {elapsed:8.2f} s   ({failed} failed)")
+    print(f"slowest single feed  {slowest:8.2f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--feeds", type=int, default=500)
+    parser.add_argument("--hosts", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(_run(args.feeds, args.hosts, args.latency, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
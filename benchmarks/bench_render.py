@@ -0,0 +1,84 @@
+"""Article rendering cost over a corpus of typical feed HTML.
+
+The corpus in ``benchmarks/corpus`` mirrors common feed shapes: WordPress,
+Reddit, Hacker News, The Verge, NYT (plain text) and Medium. Each document
+is rendered ``--repeat`` times with the original uncached implementation,
+then through ``clean_html_content`` cold (cache cleared) and warm (as when
+an article is reopened or was pre-rendered).
+
+Usage: python -m benchmarks.bench_render [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import re
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import html2text
+
+from src import render
+from src.render import _SimpleHTMLParser, clean_html_content
+
+CORPUS = Path(__file__).parent / "corpus"
+
+
+def _original(content: str | None) -> str:
+    """clean_html_content as it was before the render cache."""
+    if not content:
+        return "No content available."
+    if not bool(re.search(r"<[^>]+>", content)):
+        return content.strip()
+    try:
+        h = html2text.HTML2Text()
+        h.ignore_links = True
+        h.ignore_images = True
+        h.ignore_tables = True
+        h.body_width = 0
+        cleaned = h.handle(content)
+        cleaned = re.sub(r"\[/?[^\]]*\]", "", cleaned)
+        cleaned = re.sub(r"\n\s*\n", "\n\n", cleaned)
+        cleaned = re.sub(r" +", " ", cleaned)
+        return cleaned.strip()
+    except Exception:
+        parser = _SimpleHTMLParser()
+        parser.feed(content)
+        return html.unescape(parser.get_text()).strip()
+
+
+def _time(func: Callable[[str], str], docs: List[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for doc in docs:
+            func(doc)
+    return (time.perf_counter() - start) / (repeat * len(docs))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    docs = [path.read_text(encoding="utf-8") for path in sorted(CORPUS.glob("*.html"))]
+    for doc in docs:
+        assert _original(doc) == clean_html_content(doc), "output changed"
+
+    def _cold(doc: str) -> str:
+        render._cache.clear()
+        return clean_html_content(doc)
+
+    original = _time(_original, docs, args.repeat)
+    cold = _time(_cold, docs, args.repeat)
+    warm = _time(clean_html_content, docs, args.repeat)
+
+    print(f"{len(docs)} documents, {sum(map(len, docs)) / 1024:.1f} KiB total")
+    print(f"original     {original * 1e6:9.1f} us/article")
+    print(f"cold cache   {cold * 1e6:9.1f} us/article")
+    print(f"warm cache   {warm * 1e6:9.1f} us/article  ({original / warm:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Many app sessions at once, with and without the shared fetch cache.
+
+This mimics ``web.py``, which runs one app process per browser session.
+``--sessions`` headless app processes share a home directory, as they do
+under one web server. Each one refreshes all ``--feeds`` feeds, which are
+served by a local ``FeedServer``. Each mode starts from an empty cache.
+
+The benchmark reports upstream requests (what the feed hosts see), each
+session's peak RSS and refresh time, with sharing on and then turned off
+through ``RSS_FEED_TUI_SHARED_CACHE=0``.
+
+Usage: python -m benchmarks.bench_shared_cache [--sessions 10] [--feeds 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.feedserver import FeedServer
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_SESSION = """
+import asyncio, json, resource, time
+from src.app import RssFeedTUI
+
+async def main():
+    app = RssFeedTUI()
+    async with app.run_test(size=(120, 40)) as pilot:
+        start = time.perf_counter()
+        app.action_refresh_all()
+        while app._refreshing:
+            await asyncio.sleep(0.02)
+        elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"refresh": elapsed, "peak_mib": peak / 1024}))
+
+asyncio.run(main())
+"""
+
+
+async def _session(home: str, shared: bool) -> Dict[str, Any]:
+    env = dict(
+        os.environ,
+        HOME=home,
+        PYTHONPATH=str(ROOT),
+        RSS_FEED_TUI_SHARED_CACHE="1" if shared else "0",
+    )
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        _SESSION,
+        env=env,
+        cwd=ROOT,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    out, err = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(err.decode())
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+async def _run_mode(args: argparse.Namespace, shared: bool) -> None:
+    async with FeedServer(entries=30, latency=args.latency, hosts=4) as server:
+        with tempfile.TemporaryDirectory() as home:
+            config = Path(home) / ".config" / "rss-feed-tui"
+            config.mkdir(parents=True)
+            feeds = {
+                f"Feed {i}": server.url(f"feed{i}", host=i) for i in range(args.feeds)
+            }
+            (config / "feeds.json").write_text(json.dumps(feeds), encoding="utf-8")
+            sessions: List[Dict[str, Any]] = await asyncio.gather(
+                *(_session(home, shared) for _ in range(args.sessions))
+            )
+        requests = server.requests
+
+    peaks = [session["peak_mib"] for session in sessions]
+    refreshes = [session["refresh"] for session in sessions]
+    print(f"shared cache {'on' if shared else 'off'}:")
+    print(
+        f"  upstream requests   {requests:6d}"
+        f"  ({requests / args.feeds:.1f} per feed)"
+    )
+    print(
+        f"  peak RSS per session  median {statistics.median(peaks):6.1f} MiB"
+        f"  max {max(peaks):6.1f} MiB"
+    )
+    print(
+        f"  refresh per session   median {statistics.median(refreshes):6.2f} s"
+        f"    max {max(refreshes):6.2f} s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--feeds", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+    print(f"{args.sessions} sessions, {args.feeds} feeds")
+    for shared in (True, False):
+        asyncio.run(_run_mode(args, shared))
+
+
+if __name__ == "__main__":
+    main()
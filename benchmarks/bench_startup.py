@@ -0,0 +1,143 @@
+"""Startup cost of the TUI: import time and time to first paint.
+
+Each run starts a fresh interpreter, so nothing is cached in-process:
+
+* ``python -X importtime -c "import src.app"`` gives the import cost and
+  shows whether any of the deferred libraries (aiohttp, aiofiles, feedparser,
+  html2text) sneaked back into the startup path.
+* A headless ``App.run_test()`` measures from interpreter start to the
+  welcome screen being mounted and painted, with an empty feed list so no
+  network traffic is involved.
+
+With ``--check`` it exits with status 1 if a deferred library is imported
+at startup or the median time to first paint exceeds ``--budget-ms``.
+``tests/test_startup.py`` runs the import half of that check.
+
+Usage: python -m benchmarks.bench_startup [--runs 5] [--check] [--budget-ms 1500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Libraries the welcome screen must not need.
+DEFERRED = ("aiohttp", "aiofiles", "feedparser", "html2text")
+
+_FIRST_PAINT = """
+import time
+start = time.perf_counter()
+import asyncio, json
+from src.app import RssFeedTUI
+imported = time.perf_counter()
+
+async def main():
+    app = RssFeedTUI()
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        painted = time.perf_counter()
+    print(json.dumps({"import": imported - start, "paint": painted - start}))
+
+asyncio.run(main())
+"""
+
+
+def _make_home(home: str) -> None:
+    """Give ``home`` an empty feed list, so startup makes no requests."""
+    config = Path(home) / ".config" / "rss-feed-tui"
+    config.mkdir(parents=True)
+    (config / "feeds.json").write_text("{}", encoding="utf-8")
+
+
+def _env(home: str) -> Dict[str, str]:
+    return dict(os.environ, HOME=home, PYTHONPATH=str(ROOT))
+
+
+def _importtime(home: str) -> Tuple[float, Dict[str, float]]:
+    """Cumulative import time of src.app and of each top-level package (s)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.app"],
+        cwd=ROOT,
+        env=_env(home),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0.0
+    packages: Dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        seconds = int(cumulative) / 1e6
+        name = name.strip()
+        if name == "src.app":
+            total = seconds
+        if "." not in name:
+            packages[name] = max(packages.get(name, 0.0), seconds)
+    return total, packages
+
+
+def _first_paint(home: str) -> Dict[str, float]:
+    proc = subprocess.run(
+        [sys.executable, "-c", _FIRST_PAINT],
+        cwd=ROOT,
+        env=_env(home),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--budget-ms", type=float, default=1500.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        _make_home(home)
+        total, packages = _importtime(home)
+        runs: List[Dict[str, float]] = [_first_paint(home) for _ in range(args.runs)]
+
+    print(f"import src.app: {total * 1000:7.1f} ms (-X importtime, cumulative)")
+    for name, seconds in sorted(packages.items(), key=lambda item: -item[1])[:8]:
+        print(f"  {name:<20} {seconds * 1000:7.1f} ms")
+    imported = [name for name in DEFERRED if name in packages]
+    print(f"deferred libraries imported at startup: {', '.join(imported) or 'none'}")
+
+    import_ms = statistics.median(run["import"] for run in runs) * 1000
+    paint_ms = statistics.median(run["paint"] for run in runs) * 1000
+    print(f"first paint (median of {args.runs}): {paint_ms:7.1f} ms")
+    print(f"  of which imports:              {import_ms:7.1f} ms")
+
+    if args.check:
+        failures = []
+        if imported:
+            failures.append(f"imported at startup: {', '.join(imported)}")
+        if paint_ms > args.budget_ms:
+            failures.append(
+                f"first paint {paint_ms:.0f} ms over budget {args.budget_ms:.0f} ms"
+            )
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        if failures:
+            sys.exit(1)
+        print("OK: within startup budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Streaming downloads: time to first entries and memory on endless feeds.
+
+* A large feed (``--entries`` items) is loaded with a preview listener. The
+  benchmark reports when the first preview batch arrived, when the download
+  finished, and when the full parse came back.
+* An endless response is loaded under ``--max-mb``. The download must stop
+  with ``FeedTooLargeError``, and tracemalloc's peak must stay close to the
+  limit instead of growing until memory runs out.
+
+Usage: python -m benchmarks.bench_stream [--entries 20000] [--max-mb 16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import List
+
+from benchmarks.feedserver import FeedServer
+from src.async_feed import AsyncFeedLoader, FeedTooLargeError
+from src.models import Entry
+
+
+async def _first_entries(server: FeedServer, entries: int) -> None:
+    size = len(server._body("big")) / 2**20
+    first: List[float] = []
+    previewed = 0
+
+    def _on_entries(batch: List[Entry]) -> None:
+        nonlocal previewed
+        if not first:
+            first.append(time.perf_counter())
+        previewed += len(batch)
+
+    async with AsyncFeedLoader() as loader:
+        start = time.perf_counter()
+        feed = await loader.load_feed(server.url("big"), on_entries=_on_entries)
+        done = time.perf_counter()
+
+    print(f"{entries} entries ({size:.1f} MiB)")
+    print(f"  first preview entries {(first[0] - start) * 1000:8.1f} ms")
+    print(f"  full parse            {(done - start) * 1000:8.1f} ms")
+    print(f"  previewed {previewed}, parsed {len(feed['entries'])}")
+
+
+async def _endless(server: FeedServer, max_mb: int) -> None:
+    async with AsyncFeedLoader(max_bytes=max_mb * 2**20) as loader:
+        tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            await loader.load_feed(server.url("forever", route="endless"))
+            outcome = "completed?!"
+        except FeedTooLargeError as exc:
+            outcome = str(exc)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(f"endless feed, limit {max_mb} MiB")
+    print(f"  stopped after {elapsed * 1000:.0f} ms: {outcome}")
+    print(f"  peak traced memory {peak / 2**20:.1f} MiB")
+
+
+async def _run(entries: int, max_mb: int) -> None:
+    async with FeedServer(entries=entries, summary_size=400) as server:
+        await _first_entries(server, entries)
+        await _endless(server, max_mb)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=20_000)
+    parser.add_argument("--max-mb", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(_run(args.entries, args.max_mb))
+
+
+if __name__ == "__main__":
+    main()
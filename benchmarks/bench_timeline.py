@@ -0,0 +1,106 @@
+"""Cross-feed timeline: first page and later pages against a full sort.
+
+A temporary store is filled with ``--feeds`` feeds of ``--per-feed``
+articles whose publication times interleave. The benchmark then compares:
+
+* the naive timeline, loading every feed's articles and sorting them all,
+  which is what the UI would need without the k-way merge;
+* ``Timeline.next_page`` for the first page, and the median of the next
+  ``--pages`` pages as the list is scrolled.
+
+Usage: python -m benchmarks.bench_timeline [--feeds 500] [--per-feed 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from src.models import Entry
+from src.store import AsyncArticleStore
+from src.timeline import Timeline
+
+
+async def _fill(
+    store: AsyncArticleStore, feeds: Dict[str, str], per_feed: int
+) -> None:
+    rng = random.Random(18)
+    for url in feeds.values():
+        # Feeds post at different rates, so their streams interleave unevenly.
+        interval = rng.uniform(600, 86_400)
+        start = 1_700_000_000 - rng.uniform(0, 86_400)
+        await store.merge(
+            url,
+            [
+                Entry(
+                    f"{url}/{i}",
+                    title=f"story {i}",
+                    link=f"{url}/{i}",
+                    summary="Lorem ipsum dolor sit amet.",
+                    published_ts=start - i * interval,
+                )
+                for i in range(per_feed)
+            ],
+        )
+
+
+async def _naive(store: AsyncArticleStore, feeds: Dict[str, str]) -> List[Entry]:
+    entries: List[Entry] = []
+    for url in feeds.values():
+        entries.extend(await store.entries(url))
+    entries.sort(key=lambda entry: -(entry.published_ts or 0.0))
+    return entries
+
+
+async def _run(feeds_count: int, per_feed: int, page: int, pages: int) -> None:
+    feeds = {f"Feed {n}": f"https://example.com/{n}" for n in range(feeds_count)}
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AsyncArticleStore(Path(tmp) / "articles.db")
+        try:
+            await _fill(store, feeds, per_feed)
+            print(f"{feeds_count} feeds, {feeds_count * per_feed} articles")
+
+            start = time.perf_counter()
+            everything = await _naive(store, feeds)
+            naive = time.perf_counter() - start
+
+            timeline = Timeline(store, feeds)
+            start = time.perf_counter()
+            first = await timeline.next_page(page)
+            first_time = time.perf_counter() - start
+
+            later = []
+            merged = list(first)
+            for _ in range(pages):
+                start = time.perf_counter()
+                merged.extend(await timeline.next_page(page))
+                later.append(time.perf_counter() - start)
+        finally:
+            await store.close()
+
+    expected = [entry.id for entry in everything[: len(merged)]]
+    same = [entry.id for entry in merged] == expected
+    print(f"  load all + sort         {naive * 1000:8.1f} ms")
+    print(f"  first page ({page:>4})       {first_time * 1000:8.1f} ms")
+    print(f"  later pages (median)    {statistics.median(later) * 1000:8.1f} ms")
+    print(f"  same order as full sort: {same}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--feeds", type=int, default=500)
+    parser.add_argument("--per-feed", type=int, default=200)
+    parser.add_argument("--page", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(_run(args.feeds, args.per_feed, args.page, args.pages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""Local aiohttp stand-in for real feed hosts, used by the benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+import time
+from email.utils import formatdate
+from typing import Dict, List
+
+from aiohttp import web
+
+
+def make_rss(
+    title: str,
+    entries: int = 20,
+    summary_size: int = 400,
+    authors: int = 0,
+    first: int = 0,
+) -> bytes:
+    """Build a synthetic RSS 2.0 document with ``entries`` items.
+
+    ``authors`` > 0 credits the items to that many rotating authors. Items
+    are numbered from ``first``, newest first; story ``n`` is always
+    published ``n`` hours before the same fixed time, so lowering ``first``
+    publishes newer stories.
+    """
+    body = "<p>" + ("Lorem ipsum dolor sit amet. " * (summary_size // 28 + 1))[
+        :summary_size
+    ] + "</p>"
+    items = []
+    for i in range(first, first + entries):
+        author = f"<dc:creator>Author {i % authors}</dc:creator>" if authors else ""
+        items.append(
+            "<item>"
+            f"<title>{title} story {i}</title>"
+            f"<link>https://example.com/{title}/{i}</link>"
+            f"<guid>https://example.com/{title}/{i}</guid>"
+            f"<pubDate>{formatdate(1_700_000_000 - i * 3600, usegmt=True)}</pubDate>"
+            f"{author}"
+            f"<description><![CDATA[{body}]]></description>"
+            "</item>"
+        )
+    doc = (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        "<channel>"
+        f"<title>{title}</title><link>https://example.com/{title}</link>"
+        "<description>Synthetic benchmark feed</description>"
+        + "".join(items)
+        + "</channel></rss>"
+    )
+    return doc.encode("utf-8")
+
+
+def make_atom(
+    title: str, entries: int = 20, summary_size: int = 400, first: int = 0
+) -> bytes:
+    """Build a synthetic Atom 1.0 document with ``entries`` entries.
+
+    Entries are numbered from ``first`` as in :func:`make_rss`.
+    """
+    body = ("Lorem ipsum dolor sit amet. " * (summary_size // 28 + 1))[:summary_size]
+    items = []
+    for i in range(first, first + entries):
+        updated = time.strftime(
+            "%Y-%m-%dT%H:%M:%SZ", time.gmtime(1_700_000_000 - i * 3600)
+        )
+        items.append(
+            "<entry>"
+            f"<title>{title} story {i}</title>"
+            f'<link href="https://example.com/{title}/{i}"/>'
+            f"<id>https://example.com/{title}/{i}</id>"
+            f"<updated>{updated}</updated>"
+            f'<content type="html">&lt;p&gt;{body}&lt;/p&gt;</content>'
+            "</entry>"
+        )
+    doc = (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>{title}</title>"
+        f'<link href="https://example.com/{title}"/>'
+        f"<id>https://example.com/{title}</id>"
+        + "".join(items)
+        + "</feed>"
+    )
+    return doc.encode("utf-8")
+
+
+def make_page(title: str, paragraphs: int = 12) -> bytes:
+    """Build a news-site style HTML page: navigation, an article, a sidebar."""
+    sentence = "The quick brown fox, as reported, jumps over the lazy dog. "
+    body = "".join(f"<p>{sentence * 6}</p>" for _ in range(paragraphs))
+    links = "".join(
+        f'<li><a href="/page/{title}-{i}">Story {i}</a></li>' for i in range(30)
+    )
+    doc = (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f"<title>{title}</title><script>var tracking = 1;</script>"
+        "<style>body { margin: 0 }</style></head><body>"
+        f"<header><nav><ul>{links}</ul></nav></header>"
+        '<div class="layout"><div class="main-column">'
+        f'<article class="post"><h1>{title}</h1>'
+        f'<div class="entry-content">{body}</div>'
+        '<div class="share-bar"><a href="#">Share</a> <a href="#">Tweet</a></div>'
+        "</article></div>"
+        f'<div class="sidebar"><h2>Most read</h2><ul>{links}</ul></div></div>'
+        "<footer><p>Copyright, all rights reserved, no reuse permitted.</p></footer>"
+        "</body></html>"
+    )
+    return doc.encode("utf-8")
+
+
+class FeedServer:
+    """Serves ``/feed/<name>`` from an in-memory table on loopback.
+
+    ``/endless/<name>`` streams items forever, for download-limit tests,
+    ``/moved/<name>`` (301) and ``/redirect/<name>`` (308) permanently
+    redirect to ``/feed/<name>``, and ``/page/<name>`` is an article page as
+    linked from a feed.
+
+    ``hosts`` > 1 listens on 127.0.0.1, 127.0.0.2, ... so clients see
+    distinct hosts (Linux routes all of 127.0.0.0/8 to loopback), and
+    ``latency`` delays every response to mimic a remote server.
+
+    ``fmt`` is ``"rss"`` or ``"atom"``. ``error_rate`` answers that share of
+    feed requests with a 503, drawn from a generator seeded with ``seed``
+    so runs repeat. With ``etag`` every feed carries an ETag and
+    ``Cache-Control: no-cache``, so a caching client revalidates each time
+    and gets a 304 until :meth:`publish` changes the feeds; ``max_age``
+    instead lets clients reuse a feed that many seconds without asking.
+    """
+
+    def __init__(
+        self,
+        entries: int = 20,
+        summary_size: int = 400,
+        latency: float = 0.0,
+        hosts: int = 1,
+        fmt: str = "rss",
+        error_rate: float = 0.0,
+        etag: bool = False,
+        max_age: int | None = None,
+        seed: int = 0,
+    ) -> None:
+        if fmt not in ("rss", "atom"):
+            raise ValueError(f"Unknown feed format: {fmt!r}")
+        self.entries = entries
+        self.summary_size = summary_size
+        self.latency = latency
+        self.hosts = hosts
+        self.fmt = fmt
+        self.error_rate = error_rate
+        self.etag = etag
+        self.max_age = max_age
+        self.requests = 0
+        self.errors = 0
+        self.not_modified = 0
+        self.pages = 0
+        self.first = 0
+        self._random = random.Random(seed)
+        self._bodies: Dict[str, bytes] = {}
+        self._runner: web.AppRunner | None = None
+        self._ports: List[int] = []
+
+    @property
+    def port(self) -> int:
+        return self._ports[0]
+
+    def url(self, name: str, host: int = 0, route: str = "feed") -> str:
+        host %= self.hosts
+        return f"http://127.0.0.{host + 1}:{self._ports[host]}/{route}/{name}"
+
+    def publish(self, stories: int = 1) -> None:
+        """Put ``stories`` new items at the top of every feed."""
+        self.first -= stories
+        self._bodies.clear()
+
+    def _body(self, name: str) -> bytes:
+        if name not in self._bodies:
+            make = make_atom if self.fmt == "atom" else make_rss
+            self._bodies[name] = make(
+                name, self.entries, self.summary_size, first=self.first
+            )
+        return self._bodies[name]
+
+    async def _handle_feed(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.errors += 1
+            return web.Response(status=503, text="Try again later")
+        body = self._body(request.match_info["name"])
+        headers = {}
+        if self.max_age is not None:
+            headers["Cache-Control"] = f"max-age={self.max_age}"
+        if self.etag:
+            tag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+            headers["ETag"] = tag
+            headers.setdefault("Cache-Control", "no-cache")
+            if request.headers.get("If-None-Match") == tag:
+                self.not_modified += 1
+                return web.Response(status=304, headers=headers)
+        resp = web.Response(
+            body=body,
+            headers=headers,
+            content_type=f"application/{self.fmt}+xml",
+            zlib_executor_size=1 << 16,
+        )
+        resp.enable_compression()
+        return resp
+
+    async def _handle_page(self, request: web.Request) -> web.Response:
+        self.pages += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        body = make_page(request.match_info["name"])
+        return web.Response(body=body, content_type="text/html", charset="utf-8")
+
+    async def _handle_moved(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        raise web.HTTPMovedPermanently(f"/feed/{request.match_info['name']}")
+
+    async def _handle_redirect(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        raise web.HTTPPermanentRedirect(f"/feed/{request.match_info['name']}")
+
+    async def _handle_endless(self, request: web.Request) -> web.StreamResponse:
+        """A feed that never ends, as a broken or hostile server might send."""
+        self.requests += 1
+        resp = web.StreamResponse(headers={"Content-Type": "application/rss+xml"})
+        await resp.prepare(request)
+        doc = make_rss(request.match_info["name"], 100, self.summary_size)
+        head, _, _ = doc.partition(b"<item>")
+        items = doc[len(head) : doc.rindex(b"</item>") + len(b"</item>")]
+        try:
+            await resp.write(head)
+            while True:
+                await resp.write(items)
+        except ConnectionError:
+            return resp  # The client gave up, as it should.
+
+    async def __aenter__(self) -> "FeedServer":
+        app = web.Application()
+        app.router.add_get("/feed/{name}", self._handle_feed)
+        app.router.add_get("/endless/{name}", self._handle_endless)
+        app.router.add_get("/moved/{name}", self._handle_moved)
+        app.router.add_get("/redirect/{name}", self._handle_redirect)
+        app.router.add_get("/page/{name}", self._handle_page)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        for host in range(self.hosts):
+            site = web.TCPSite(self._runner, f"127.0.0.{host + 1}", 0)
+            await site.start()
+            self._ports.append(site._server.sockets[0].getsockname()[1])
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+if __name__ == "__main__":
+
+    async def _serve() -> None:
+        async with FeedServer() as server:
+            print(f"Serving on {server.url('<name>')}")
+            await asyncio.Event().wait()
+
+    asyncio.run(_serve())
@@ -0,0 +1,160 @@
+"""Memory of a long session: simulated hours of background refreshes.
+
+Runs the app headless against ``--feeds`` local feeds, compressing
+``--hours`` of use into a few minutes. Every simulated hour, each feed
+publishes new stories ``--refreshes`` times and the app refreshes all
+feeds after each. A reader then opens one feed, the "All feeds" timeline
+and an article, as someone who leaves the reader open would. At the end of
+each hour the session's RSS is sampled after a garbage collection.
+
+Each mode runs in a fresh process: once under a memory budget (which the
+soak sets tighter than the defaults, so the caches fill within the
+simulated day) and once with the budget lifted. The script exits 1 if RSS
+under the budget grew by more than ``--tolerance`` MiB after the
+``--warmup`` hours.
+
+Usage: python -m benchmarks.soak_memory [--hours 24] [--feeds 40]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.feedserver import FeedServer
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _rss_mib() -> float:
+    """Current resident set size, from /proc (Linux)."""
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+async def _soak(args: argparse.Namespace) -> None:
+    from src.app import MainContent, RssFeedTUI
+
+    server = FeedServer(
+        entries=args.entries, summary_size=args.summary_size, hosts=4, etag=True
+    )
+    async with server:
+        config = Path.home() / ".config" / "rss-feed-tui"
+        config.mkdir(parents=True, exist_ok=True)
+        feeds = {f"Feed {i}": server.url(f"feed{i}", host=i) for i in range(args.feeds)}
+        (config / "feeds.json").write_text(json.dumps(feeds), encoding="utf-8")
+        titles = list(feeds)
+
+        app = RssFeedTUI()
+        async with app.run_test(size=(120, 40)) as pilot:
+            content = app.query_one(MainContent)
+            for hour in range(1, args.hours + 1):
+                for _ in range(args.refreshes):
+                    server.publish(args.stories)
+                    app.action_refresh_all()
+                    while app._refreshing:
+                        await asyncio.sleep(0.02)
+                # A reader dropping by: a feed, the timeline, an article.
+                await content.show_feed(titles[hour % len(titles)])
+                await pilot.pause(0.05)
+                await content.show_timeline()
+                await pilot.pause(0.05)
+                if content.current_entries:
+                    content.show_article(0)
+                    await pilot.pause(0.05)
+                await content.show_timeline(resume=True)
+                await pilot.pause(0.05)
+
+                gc.collect()
+                sample = {
+                    "hour": hour,
+                    "rss_mib": round(_rss_mib(), 1),
+                    "parsed_mib": round(content.loader._parsed.size / 2**20, 2),
+                    "lists_mib": round(content._snapshots.size / 2**20, 2),
+                    "rows": len(content.current_entries),
+                    "articles": server.first * -args.feeds + args.entries * args.feeds,
+                }
+                print(json.dumps(sample), flush=True)
+
+
+def _run_mode(args: argparse.Namespace, budget: bool) -> List[Dict[str, Any]]:
+    env = dict(
+        os.environ,
+        PYTHONPATH=str(ROOT),
+        RSS_FEED_TUI_SHARED_CACHE="0",
+        RSS_FEED_TUI_PREFETCH="0",
+        RSS_FEED_TUI_MEMORY_MB=str(args.budget_mb if budget else 1_000_000),
+        RSS_FEED_TUI_FEED_ENTRIES=str(args.feed_entries if budget else 10**9),
+    )
+    argv = [sys.executable, "-m", "benchmarks.soak_memory", "--child"]
+    for name in ("hours", "feeds", "entries", "summary_size", "refreshes", "stories"):
+        argv += [f"--{name.replace('_', '-')}", str(getattr(args, name))]
+    with tempfile.TemporaryDirectory() as home:
+        proc = subprocess.run(
+            argv,
+            env=dict(env, HOME=home),
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr)
+    return [json.loads(line) for line in proc.stdout.splitlines() if line]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hours", type=int, default=24)
+    parser.add_argument("--feeds", type=int, default=40)
+    parser.add_argument("--entries", type=int, default=30)
+    parser.add_argument("--summary-size", type=int, default=2000)
+    parser.add_argument("--refreshes", type=int, default=2, help="per hour")
+    parser.add_argument("--stories", type=int, default=5, help="per refresh")
+    parser.add_argument("--budget-mb", type=int, default=16)
+    parser.add_argument("--feed-entries", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=6)
+    parser.add_argument("--tolerance", type=float, default=8.0, help="MiB")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        asyncio.run(_soak(args))
+        return
+
+    budgeted = _run_mode(args, budget=True)
+    unbounded = _run_mode(args, budget=False)
+    print(
+        f"{'hour':>4} {'articles':>9} {'RSS MiB':>8} {'parsed':>7} {'lists':>7}"
+        f" {'rows':>5} | {'unbounded':>9} {'parsed':>7} {'lists':>7} {'rows':>5}"
+    )
+    for low, high in zip(budgeted, unbounded):
+        print(
+            f"{low['hour']:>4} {low['articles']:>9} {low['rss_mib']:>8.1f}"
+            f" {low['parsed_mib']:>7.1f} {low['lists_mib']:>7.1f} {low['rows']:>5}"
+            f" | {high['rss_mib']:>9.1f} {high['parsed_mib']:>7.1f}"
+            f" {high['lists_mib']:>7.1f} {high['rows']:>5}"
+        )
+
+    warm = min(args.warmup, len(budgeted)) - 1
+    growth = budgeted[-1]["rss_mib"] - budgeted[warm]["rss_mib"]
+    without = unbounded[-1]["rss_mib"] - unbounded[warm]["rss_mib"]
+    print(
+        f"growth after hour {warm + 1}: {growth:+.1f} MiB under the budget, "
+        f"{without:+.1f} MiB without"
+    )
+    if growth > args.tolerance:
+        print(f"RSS grew more than {args.tolerance:g} MiB", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+"""Benchmark suite: loading, rendering, the feed view and search at scale.
+
+Each scenario runs in a fresh interpreter with a temporary home directory,
+against a local ``FeedServer``, so its peak memory is its own and your
+feeds are never touched:
+
+* ``load_feed`` fetches ``feeds`` feeds through ``AsyncFeedLoader.load_feed``
+  with an HTTP cache, first cold and then again, revalidating by ETag.
+* ``render`` runs ``clean_html_content`` on distinct article bodies with the
+  render cache cleared (at most ``MAX_RENDERS``: the cost is per article).
+* ``show_feed`` opens a feed of ``entries`` stored articles with
+  ``MainContent.show_feed`` in a headless Textual app, first from the
+  store and then from the in-memory snapshot.
+* ``search`` runs ``MainContent._filter_articles`` over about twice
+  ``entries`` stored articles, for rare, common and prefix queries.
+
+Every result has throughput, p50/p95/p99 latency and the process's peak
+RSS. ``--save`` writes them as JSON; ``--baseline`` compares against such a
+file and exits with status 1 if throughput, p50, p95 or peak memory got
+worse by more than ``--tolerance``. Baselines only compare on the same
+machine and scale.
+
+Usage: python -m benchmarks.suite [--scale small|medium|large] [--only render]
+           [--save results.json] [--baseline results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS = Path(__file__).parent / "corpus"
+
+SCALES: Dict[str, Dict[str, Any]] = {
+    "small": {"feeds": 10, "entries": 10},
+    "medium": {"feeds": 500, "entries": 5_000},
+    "large": {"feeds": 5_000, "entries": 50_000},
+}
+MAX_RENDERS = 2_000
+# Figures compared against a baseline; throughput is the only one where
+# higher is better.
+COMPARED = ("throughput_per_s", "p50_ms", "p95_ms", "peak_rss_mib")
+
+Results = Dict[str, Dict[str, Any]]
+
+
+def _result(samples: List[float], elapsed: float, errors: int = 0) -> Dict[str, Any]:
+    ordered = sorted(samples) or [0.0]
+
+    def _ms(fraction: float) -> float:
+        index = min(len(ordered) - 1, int(fraction * len(ordered)))
+        return round(ordered[index] * 1000, 3)
+
+    return {
+        "count": len(samples),
+        "errors": errors,
+        "throughput_per_s": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": _ms(0.50),
+        "p95_ms": _ms(0.95),
+        "p99_ms": _ms(0.99),
+    }
+
+
+def _peak_rss_mib() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return round(peak / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+
+# -----------------------------------------------------------------------------
+# Scenarios (run in the child process)
+# -----------------------------------------------------------------------------
+
+
+def _server(config: Dict[str, Any], **overrides: Any) -> Any:
+    from benchmarks.feedserver import FeedServer
+
+    options = dict(
+        entries=config["feed_entries"],
+        latency=config["latency"],
+        hosts=config["hosts"],
+        fmt=config["fmt"],
+        error_rate=config["error_rate"],
+        etag=True,
+        seed=22,
+    )
+    options.update(overrides)
+    return FeedServer(**options)
+
+
+async def _load_feed(config: Dict[str, Any]) -> Results:
+    from src.async_feed import AsyncFeedLoader, HttpCache
+
+    results: Results = {}
+    async with _server(config) as server:
+        urls = [server.url(f"feed{i}", host=i) for i in range(config["feeds"])]
+        cache = HttpCache(Path.home() / "http-cache")
+        limit = asyncio.Semaphore(config["concurrency"])
+        async with AsyncFeedLoader(cache=cache) as loader:
+            for phase in ("cold", "revalidate"):
+                samples: List[float] = []
+                errors = 0
+
+                async def _one(url: str) -> None:
+                    nonlocal errors
+                    async with limit:
+                        start = time.perf_counter()
+                        try:
+                            await loader.load_feed(url)
+                        except Exception:
+                            errors += 1
+                            return
+                        samples.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                await asyncio.gather(*(_one(url) for url in urls))
+                elapsed = time.perf_counter() - start
+                results[f"load_feed.{phase}"] = _result(samples, elapsed, errors)
+    return results
+
+
+async def _render(config: Dict[str, Any]) -> Results:
+    from src import render
+
+    docs = [path.read_text(encoding="utf-8") for path in sorted(CORPUS.glob("*"))]
+    count = min(config["entries"], MAX_RENDERS)
+    # Distinct bodies, so every call converts instead of hitting the cache.
+    bodies = [f"{docs[i % len(docs)]}<p>{i}</p>" for i in range(count)]
+    render._cache.clear()
+    samples = []
+    start = time.perf_counter()
+    for body in bodies:
+        call = time.perf_counter()
+        render.clean_html_content(body)
+        samples.append(time.perf_counter() - call)
+    return {"render": _result(samples, time.perf_counter() - start)}
+
+
+def _articles(url: str, count: int, rng: random.Random) -> List[Any]:
+    """Distinct articles, newest first, with text the search can find."""
+    from src.models import Entry
+
+    vocabulary = [f"word{n}" for n in range(5_000)]
+    return [
+        Entry(
+            f"{url}/{i}",
+            title=" ".join(rng.choices(vocabulary, k=8)),
+            link=f"{url}/{i}",
+            summary="<p>" + " ".join(rng.choices(vocabulary, k=60)) + "</p>",
+            published_ts=1_700_000_000 - i * 60,
+        )
+        for i in range(count)
+    ]
+
+
+AppRun = Callable[[Any, Any, Dict[str, str]], Awaitable[Results]]
+
+
+async def _app_scenario(config: Dict[str, Any], run: AppRun) -> Results:
+    """Fill a store, start the app headless and hand it to ``run``."""
+    from src.async_feed import AsyncFileHandler
+    from src.store import AsyncArticleStore
+
+    rng = random.Random(22)
+    # The first feed holds ``entries`` articles for show_feed; up to 49
+    # more hold about as many again between them, for search.
+    async with _server(config, entries=20) as server:
+        feeds = {
+            f"Feed {n}": server.url(f"feed{n}", host=n)
+            for n in range(min(config["feeds"], 50))
+        }
+        store = AsyncArticleStore(AsyncFileHandler._config_dir() / "articles.db")
+        try:
+            for n, url in enumerate(feeds.values()):
+                count = config["entries"] if n == 0 else config["entries"] // 50
+                articles = _articles(url, count, rng)
+                for first in range(0, len(articles), 1_000):
+                    await store.merge(url, articles[first : first + 1_000])
+        finally:
+            await store.close()
+        await AsyncFileHandler.save_feeds(feeds)
+        await AsyncFileHandler.flush()
+
+        from src.app import MainContent, RssFeedTUI
+
+        app = RssFeedTUI()
+        async with app.run_test(size=(120, 40)) as pilot:
+            return await run(pilot, app.query_one(MainContent), feeds)
+
+
+async def _show_feed(config: Dict[str, Any]) -> Results:
+    async def run(pilot: Any, content: Any, feeds: Dict[str, str]) -> Results:
+        results: Results = {}
+        title = next(iter(feeds))
+        for phase in ("store", "snapshot"):
+            samples = []
+            start = time.perf_counter()
+            for _ in range(config["rounds"]):
+                if phase == "store":
+                    content._snapshots.clear()
+                call = time.perf_counter()
+                await content.show_feed(title)
+                await pilot.pause()
+                samples.append(time.perf_counter() - call)
+            elapsed = time.perf_counter() - start
+            results[f"show_feed.{phase}"] = _result(samples, elapsed)
+        return results
+
+    return await _app_scenario(config, run)
+
+
+async def _search(config: Dict[str, Any]) -> Results:
+    async def run(pilot: Any, content: Any, feeds: Dict[str, str]) -> Results:
+        content.SEARCH_DEBOUNCE = 0
+        await content.show_feed(next(iter(feeds)))
+        await pilot.pause()
+        # Rare and common words, two-word queries and prefixes as typed.
+        queries = [f"word{n}" for n in (4_999, 2_500, 10, 1)]
+        queries += ["word1 word2", "word12 word4000", "wor", "word", "word4"]
+        samples = []
+        start = time.perf_counter()
+        for _ in range(config["rounds"]):
+            for query in queries:
+                call = time.perf_counter()
+                await content._filter_articles(query)
+                samples.append(time.perf_counter() - call)
+        return {"search": _result(samples, time.perf_counter() - start)}
+
+    return await _app_scenario(config, run)
+
+
+SCENARIOS: Dict[str, Callable[[Dict[str, Any]], Awaitable[Results]]] = {
+    "load_feed": _load_feed,
+    "render": _render,
+    "show_feed": _show_feed,
+    "search": _search,
+}
+
+
+def _child(name: str, config: Dict[str, Any]) -> None:
+    results = asyncio.run(SCENARIOS[name](config))
+    peak = _peak_rss_mib()
+    for result in results.values():
+        result["peak_rss_mib"] = peak
+    print(json.dumps(results))
+
+
+# -----------------------------------------------------------------------------
+# Driver
+# -----------------------------------------------------------------------------
+
+
+def _run_scenario(name: str, config: Dict[str, Any]) -> Results:
+    with tempfile.TemporaryDirectory() as home:
+        proc = subprocess.run(
+            [sys.executable, "-m", "benchmarks.suite", "--child", name],
+            input=json.dumps(config),
+            capture_output=True,
+            text=True,
+            cwd=ROOT,
+            env=dict(os.environ, HOME=home, PYTHONPATH=str(ROOT)),
+        )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{name} failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _compare(
+    results: Results, baseline: Results, tolerance: float
+) -> List[str]:
+    """Print each compared figure next to the baseline; return regressions."""
+    regressions = []
+    print(
+        f"\n{'vs baseline':<24} {'figure':<18} {'before':>10} {'now':>10}"
+        f" {'change':>8}"
+    )
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        for figure in COMPARED:
+            old, new = before.get(figure), result.get(figure)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if figure == "throughput_per_s" else change
+            flag = "  REGRESSION" if worse > tolerance else ""
+            if flag:
+                regressions.append(f"{name} {figure}")
+            print(
+                f"{name:<24} {figure:<18} {old:>10.1f} {new:>10.1f}"
+                f" {change:>+8.0%}{flag}"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--feeds", type=int, help="override the scale's feeds")
+    parser.add_argument("--entries", type=int, help="override the scale's entries")
+    parser.add_argument("--only", help="comma-separated scenarios to run")
+    parser.add_argument("--feed-entries", type=int, default=20)
+    parser.add_argument("--fmt", choices=("rss", "atom"), default="rss")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--hosts", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--save", type=Path, help="write results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="compare against this file")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, json.loads(sys.stdin.read()))
+        return
+
+    config = dict(SCALES[args.scale])
+    if args.feeds is not None:
+        config["feeds"] = args.feeds
+    if args.entries is not None:
+        config["entries"] = args.entries
+    config.update(
+        feed_entries=args.feed_entries,
+        fmt=args.fmt,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        hosts=args.hosts,
+        concurrency=args.concurrency,
+        rounds=args.rounds,
+    )
+    names = args.only.split(",") if args.only else list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    print(f"scale {args.scale}: {config['feeds']} feeds, {config['entries']} entries")
+    print(
+        f"{'scenario':<24} {'count':>7} {'per s':>9} {'p50 ms':>9} {'p95 ms':>9}"
+        f" {'p99 ms':>9} {'errors':>6} {'peak MiB':>9}"
+    )
+    results: Results = {}
+    for name in names:
+        for key, result in _run_scenario(name, config).items():
+            results[key] = result
+            print(
+                f"{key:<24} {result['count']:>7} {result['throughput_per_s']:>9.1f}"
+                f" {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f}"
+                f" {result['p99_ms']:>9.2f} {result['errors']:>6}"
+                f" {result['peak_rss_mib'] or 0:>9.1f}"
+            )
+
+    document = {
+        "config": config,
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    if args.save:
+        args.save.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("config") != config:
+            print("warning: the baseline was run with a different configuration")
+        regressions = _compare(results, baseline["results"], args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,36 @@
 """RSS Feed TUI Application"""
 
-from .app import *
-from .async_feed import *
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "whaiman"
 __description__ = "RSS feed TUI application built with Textual"
+
+# Public names resolved on first access (PEP 562), so importing a submodule
+# such as src.cli doesn't drag in Textual through the package.
+_EXPORTS = {
+    "RssFeedTUI": ".app",
+    "Sidebar": ".app",
+    "MainContent": ".app",
+    "clean_html_content": ".render",
+    "AsyncFeedLoader": ".async_feed",
+    "AsyncFileHandler": ".async_feed",
+    "FeedHTTPError": ".async_feed",
+    "FeedTooLargeError": ".async_feed",
+    "HttpCache": ".async_feed",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
@@ -2,93 +2,36 @@
 
 from __future__ import annotations
 
-import html
-import re
-from html.parser import HTMLParser
+import asyncio
+import os
+import time
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List
 
-import html2text
 from textual import on
 from textual.app import App, ComposeResult
 from textual.containers import Center, Horizontal, Vertical, VerticalScroll
+from textual.css.query import NoMatches
 from textual.message import Message
 from textual.reactive import reactive
-from textual.widgets import Button, Footer, Header, Input, Static
-
-from .async_feed import AsyncFeedLoader, AsyncFileHandler
-
-# =============================================================================
-# HTML Cleaning Utilities
-# =============================================================================
-
-
-def _is_html_content(content: str | None) -> bool:
-    """Check if content likely contains HTML tags."""
-    if not content:
-        return False
-    return bool(re.search(r"<[^>]+>", content))
-
-
-class _SimpleHTMLParser(HTMLParser):
-    """Minimal fallback parser for basic HTML cleanup."""
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.text: List[str] = []
-
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        if tag in {"br", "p"}:
-            self.text.append("\n")
-        elif tag in {"h1", "h2", "h3", "h4", "h5", "h6"}:
-            self.text.append("\n## ")
-        elif tag == "a":
-            for attr, value in attrs:
-                if attr == "href" and value:
-                    self.text.append("[")
-                    break
-
-    def handle_endtag(self, tag: str) -> None:
-        if tag == "a":
-            self.text.append("]")
-        elif tag in {"p", "div"}:
-            self.text.append("\n")
-
-    def handle_data(self, data: str) -> None:
-        stripped = data.strip()
-        if stripped:
-            self.text.append(stripped)
-
-    def get_text(self) -> str:
-        return "".join(self.text)
-
-
-def clean_html_content(content: str | None) -> str:
-    """Convert HTML content to clean readable text."""
-    if not content:
-        return "No content available."
-
-    if not _is_html_content(content):
-        return content.strip()
-
-    try:
-        h = html2text.HTML2Text()
-        h.ignore_links = True
-        h.ignore_images = True
-        h.ignore_tables = True
-        h.body_width = 0
-
-        cleaned = h.handle(content)
-        cleaned = re.sub(r"\[/?[^\]]*\]", "", cleaned)  # remove leftover markdown
-        cleaned = re.sub(r"\n\s*\n", "\n\n", cleaned)  # normalize paragraphs
-        cleaned = re.sub(r" +", " ", cleaned)  # collapse spaces
-        return cleaned.strip()
-    except Exception:
-        # Fallback: strip tags manually
-        parser = _SimpleHTMLParser()
-        parser.feed(content)
-        return html.unescape(parser.get_text()).strip()
-
+from textual.screen import Screen
+from textual.widget import Widget
+from textual.widgets import Button, Header, Input, Static
+
+from . import metrics
+from .async_feed import AsyncFeedLoader, AsyncFileHandler, HttpCache
+from .budget import ByteLRU, MemoryBudget, entries_size
+from .fulltext import ArticleCache, FullTextFetcher
+from .models import Entry
+from .opml import build_opml, import_opml
+from .refresh import FeedRefresher, RefreshResult
+from .render import clean_html_content, prerender
+from .scheduler import PollScheduler
+from .shared_cache import SharedFetchCache
+from .store import AsyncArticleStore
+from .timeline import Timeline
+from .widgets import ArticleList, BindingsFooter
 
 # =============================================================================
 # Sidebar
@@ -110,10 +53,15 @@ class Sidebar(Vertical):
     class ModeSelected(Message):
         """Message posted when a management mode is selected."""
 
-        def __init__(self, mode: str) -> None:  # "add" | "manage" | "discover"
+        def __init__(self, mode: str) -> None:  # "timeline" | "add" | "manage" | ...
             self.mode = mode
             super().__init__()
 
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._feed_buttons: Dict[str, Button] = {}
+        self._next_button_id = 0
+
     async def on_mount(self) -> None:
         await self._refresh_feeds()
 
@@ -125,17 +73,44 @@ class Sidebar(Vertical):
 
     def compose(self) -> ComposeResult:
         yield Static("RSS Feeds", classes="sidebar-title")
+        yield Center(Button("All feeds", id="all-feeds", classes="action-btn"))
         yield Center(Button("Add feed", id="add-feed", classes="action-btn"))
         yield Center(Button("Manage feeds", id="manage-feeds", classes="action-btn"))
         yield Center(
             Button("Discover feeds", id="discover-feeds", classes="action-btn")
         )
 
+    def _feed_button(self, title: str) -> Button:
+        # Ids come from a counter rather than the title, so titles differing
+        # only in punctuation can't collide; the title itself is the name.
+        self._next_button_id += 1
+        button = Button(
+            title, id=f"feed-{self._next_button_id}", name=title, classes="feed-btn"
+        )
+        self._feed_buttons[title] = button
+        return button
+
     async def watch_feed_data(self, feeds: Dict[str, str]) -> None:
-        """Dynamically update feed buttons when feed_data changes."""
-        for node in self.query(".feed-btn, .no-feeds-message"):
-            await node.remove()
+        """Reconcile feed buttons with feed_data, touching only what changed."""
+        # Feed buttons are mounted alongside "Add feed", so live in its parent.
+        container = self.query_one("#add-feed", Button).parent
+        if not isinstance(container, Widget):
+            return
+
+        removed = [title for title in self._feed_buttons if title not in feeds]
+        if removed:
+            await container.remove_children(
+                [self._feed_buttons.pop(title) for title in removed]
+            )
+
+        kept = [title for title in feeds if title in self._feed_buttons]
+        if kept != list(self._feed_buttons):
+            # Existing feeds were reordered (e.g. feeds.json edited by hand).
+            await container.remove_children(list(self._feed_buttons.values()))
+            self._feed_buttons.clear()
 
+        for node in self.query(".no-feeds-message"):
+            await node.remove()
         if not feeds:
             await self.mount(
                 Static("No feeds yet – add one!", classes="no-feeds-message"),
@@ -143,24 +118,30 @@ class Sidebar(Vertical):
             )
             return
 
+        # Mount each run of new titles in one batch, before the next existing
+        # button (or the action buttons at the end).
+        batch: List[Button] = []
         for title in feeds:
-            safe_id = title.replace(" ", "_").translate(
-                str.maketrans("/.`'\"", "_____")
-            )
-            await self.mount(
-                Button(title, id=f"feed-{safe_id}", classes="feed-btn"),
-                before="#add-feed",
-            )
+            if title in self._feed_buttons:
+                if batch:
+                    await self.mount_all(batch, before=self._feed_buttons[title])
+                    batch = []
+            else:
+                batch.append(self._feed_button(title))
+        if batch:
+            await self.mount_all(batch, before="#add-feed")
 
     @on(Button.Pressed)
     def _handle_button_press(self, event: Button.Pressed) -> None:
         button_id = event.button.id or ""
 
         if button_id.startswith("feed-"):
-            title = event.button.label.plain if event.button.label else ""
+            title = event.button.name or ""
             if title in self.feed_data:
                 self.post_message(self.FeedSelected(title))
 
+        elif button_id == "all-feeds":
+            self.post_message(self.ModeSelected("timeline"))
         elif button_id == "add-feed":
             self.post_message(self.ModeSelected("add"))
         elif button_id == "manage-feeds":
@@ -182,15 +163,64 @@ class MainContent(VerticalScroll):
 
         pass
 
+    SEARCH_DEBOUNCE = 0.1
+    # Articles at the top of a freshly shown list to render in the background
+    # so opening them is instant; 0 disables pre-rendering.
+    PRERENDER_COUNT = 50
+    TIMELINE_PAGE = 100
+    # Older articles read from the store when a feed's list is scrolled
+    # past the entries kept in memory.
+    FEED_PAGE = 100
+    # Articles from the cursor down whose linked pages are fetched in the
+    # background, so "Full article" opens instantly and works offline. Off
+    # unless RSS_FEED_TUI_PREFETCH=1: it requests third-party pages the
+    # reader may never open.
+    PREFETCH_COUNT = 5
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self.loader = AsyncFeedLoader()
+        config_dir = AsyncFileHandler._config_dir()
+        self.budget = MemoryBudget.from_env()
+        self.loader = AsyncFeedLoader(
+            cache=HttpCache(config_dir / "http-cache"),
+            shared=SharedFetchCache.for_config_dir(config_dir),
+            budget=self.budget,
+        )
+        self.store = AsyncArticleStore(config_dir / "articles.db")
+        self.fulltext = FullTextFetcher(
+            self.loader, ArticleCache(config_dir / "full-text")
+        )
+        self.prefetch_count = 0
+        if os.environ.get("RSS_FEED_TUI_PREFETCH") == "1":
+            self.prefetch_count = self.PREFETCH_COUNT
         self.current_feed_title: str | None = None
-        self.current_entries: List[Dict[str, Any]] = []
+        self.current_feed_url: str | None = None
+        self.current_entries: List[Entry] = []
+        self.last_article_id: str | None = None
+        # The article on screen, if any.
+        self.current_article: Entry | None = None
+        # Bumped whenever the content area is cleared, so a screen that is
+        # still loading can tell it has been replaced.
+        self._view = 0
+        # The "All feeds" view: its merge state and the pages loaded so far.
+        self._timeline: Timeline | None = None
+        self._timeline_entries: List[Entry] = []
+        self._timeline_shown = False
+        # Feed URL -> its newest entries, newest first, for the feeds shown
+        # most recently that fit the budget; the rest reload from the store.
+        self._snapshots: ByteLRU[str, List[Entry]] = ByteLRU(
+            self.budget.share, entries_size
+        )
 
     def compose(self) -> ComposeResult:
         yield Vertical(id="content")
 
+    async def on_unmount(self) -> None:
+        await AsyncFileHandler.flush()
+        await self.fulltext.close()
+        await self.loader.close()
+        await self.store.close()
+
     # -------------------------------------------------------------------------
     # Screen Display Methods
     # -------------------------------------------------------------------------
@@ -223,63 +253,294 @@ A clean, modern terminal RSS reader.
         )
 
     async def show_feed(self, title: str) -> None:
+        start = time.perf_counter()
         self._clear_content()
+        view = self._view
         self.current_feed_title = title
+        self.current_feed_url = None
         self.current_entries = []
 
         container = self.query_one("#content")
+        articles = ArticleList(classes="articles-list")
+        # One mount call: anything attached after a later _clear_content()
+        # would leak into the next screen.
+        await container.mount_all([self._list_header(f"📻 {title}"), articles])
 
-        header = Horizontal(classes="feed-header-root")
-        await container.mount(header)
+        try:
+            url = (await AsyncFileHandler.load_feeds())[title]
+            # Show the last known entries at once and revalidate against the
+            # network in the background; the fetch never delays the list.
+            entries = list(await self._snapshot(url))
+        except Exception as exc:
+            if view == self._view:
+                await container.mount(
+                    Static(f"Error loading feed: {exc}", classes="error"),
+                    before=articles,
+                )
+            return
+        if view != self._view:
+            # Another screen was shown while this one was loading.
+            return
+        self.current_feed_url = url
+        self.current_entries = entries
+
+        self._show_entries(articles)
+        metrics.record("show_feed", time.perf_counter() - start, url)
+        if not self.current_entries:
+            await container.mount(
+                Static("Loading feed…", classes="loading"), before=articles
+            )
+        # Exclusive: switching feeds cancels the previous feed's revalidation,
+        # and with it the fetch unless something else is waiting on it.
+        self.run_worker(self._revalidate(url), group="revalidate", exclusive=True)
 
-        left_part = Vertical(
-            Static(f"📻 {title}", classes="feed-title-big"),
-            Static("Click article to read →", classes="feed-hint"),
-            Static("↑↓ - navigation, • Enter - open • q - exit", classes="feed-hint"),
-            classes="feed-info-left",
-        )
+    async def show_timeline(self, resume: bool = False) -> None:
+        """Show every feed's articles merged newest first, a page at a time.
 
-        search_part = Vertical(
-            # Horizontal(
-            #     Static(f"Feed: {title}", classes="feed-title"),
-            # ),
-            Horizontal(
-                Input(placeholder="Search articles…", id="search-input"),
-                Button("Search", id="search-btn", classes="search-btn"),
-                classes="search-box",
-            ),
-            classes="feed-header-right",
-        )
+        With ``resume`` (coming back from an article) the pages loaded so
+        far are shown again instead of starting over.
+        """
+        self._clear_content()
+        view = self._view
+        self.current_feed_title = None
+        self.current_feed_url = None
+        self.current_entries = []
 
-        await header.mount(left_part)
-        await header.mount(search_part)
+        container = self.query_one("#content")
+        articles = ArticleList(classes="articles-list")
+        await container.mount_all([self._list_header("📰 All feeds"), articles])
 
-        articles_area = VerticalScroll(classes="articles-list")
-        container.mount(articles_area)
-        articles_area.mount(Static("Loading feed…", classes="loading"))
+        if not resume or self._timeline is None:
+            feeds = await AsyncFileHandler.load_feeds()
+            self._timeline = Timeline(self.store, feeds)
+            self._timeline_entries = await self._timeline.next_page(
+                self.TIMELINE_PAGE
+            )
+        if view != self._view:
+            return
+        self._timeline_shown = True
+        self.current_entries = list(self._timeline_entries)
+        self._show_entries(articles)
+        if not self.current_entries:
+            await container.mount(
+                Static("No articles yet – press r to refresh.", classes="loading"),
+                before=articles,
+            )
 
+    async def _next_timeline_page(self) -> None:
+        timeline = self._timeline
+        if timeline is None or timeline.done:
+            return
+        page = await timeline.next_page(self.TIMELINE_PAGE)
+        if timeline is not self._timeline or not page:
+            return
+        self._timeline_entries.extend(page)
+        if not self._timeline_shown or self._searching():
+            return
+        try:
+            articles = self.query_one(ArticleList)
+        except NoMatches:
+            return
+        start = len(self.current_entries)
+        self.current_entries.extend(page)
+        articles.append(range(start, len(self.current_entries)))
+
+    async def _next_feed_page(self) -> None:
+        """Append stored articles older than those kept in memory."""
+        url = self.current_feed_url
+        snapshot = self._snapshots.peek(url) if url is not None else None
+        if url is None or (
+            snapshot is not None and len(snapshot) < self.budget.entries_per_feed
+        ):
+            # Everything stored for the feed is already listed.
+            return
+        view = self._view
+        page = await self.store.entries(
+            url, limit=self.FEED_PAGE, offset=len(self.current_entries)
+        )
+        if view != self._view or self._searching():
+            return
+        shown = {entry.id for entry in self.current_entries}
+        page = [entry for entry in page if entry.id not in shown]
+        try:
+            articles = self.query_one(ArticleList)
+        except NoMatches:
+            return
+        start = len(self.current_entries)
+        self.current_entries.extend(page)
+        articles.append(range(start, len(self.current_entries)))
+
+    async def _revalidate(self, url: str) -> None:
+        """Fetch ``url`` and apply what changed to the feed on screen."""
+        # A feed with nothing stored yet lists entries as they download; the
+        # stored result replaces those preview rows at the end.
+        previewed: List[Entry] = []
+        on_entries = None
+        if not self.current_entries:
+            on_entries = partial(self._preview_entries, url, previewed)
         try:
-            feed = await self.loader.load_feed(
-                (await AsyncFileHandler.load_feeds())[title]
+            feed = await self.loader.load_feed(url, on_entries=on_entries)
+            new_entries, changed_entries = await self.store.upsert(
+                url, feed.get("entries", [])
             )
-            await articles_area.query_one(".loading").remove()
+        except Exception as exc:
+            if url != self.current_feed_url:
+                return
+            try:
+                articles = self.query_one(ArticleList)
+            except NoMatches:
+                return
+            await self.query(".loading").remove()
+            if self.current_entries:
+                self.notify(f"Error refreshing feed: {exc}", severity="error")
+            else:
+                await self.query_one("#content").mount(
+                    Static(f"Error loading feed: {exc}", classes="error"),
+                    before=articles,
+                )
+            return
 
-            entries = feed.get("entries", [])
-            self.current_entries = entries
+        if url == self.current_feed_url:
+            await self.query(".loading").remove()
+        if not previewed:
+            await self.add_new_entries(url, new_entries, changed_entries)
+            return
+        self._snapshots.pop(url, None)
+        entries = list(await self._snapshot(url))
+        if url != self.current_feed_url or self._searching():
+            return
+        try:
+            articles = self.query_one(ArticleList)
+        except NoMatches:
+            return
+        # Keep the cursor on the same article while the rows are replaced.
+        highlighted = articles.highlighted
+        cursor_id = None
+        if highlighted is not None:
+            cursor_id = self.current_entries[highlighted].id
+        self.current_entries = entries
+        articles.set_entries(entries)
+        for idx, entry in enumerate(entries):
+            if entry.id == cursor_id:
+                articles.cursor = idx
+                break
+        self._prerender(entries)
 
-            for idx, entry in enumerate(entries):
-                articles_area.mount(
-                    Button(
-                        entry.get("title", "Untitled"),
-                        id=f"article-{idx}",
-                        classes="article-btn",
-                    )
-                )
-        except Exception as exc:
-            await articles_area.query_one(".loading").remove()
-            articles_area.mount(Static(f"Error loading feed: {exc}", classes="error"))
+    def _preview_entries(
+        self, url: str, previewed: List[Entry], entries: List[Entry]
+    ) -> None:
+        """Append entries parsed from a feed that is still downloading."""
+        if url != self.current_feed_url or self._searching():
+            return
+        try:
+            articles = self.query_one(ArticleList)
+        except NoMatches:
+            return
+        if not previewed:
+            self.query(".loading").remove()
+        previewed.extend(entries)
+        start = len(self.current_entries)
+        self.current_entries.extend(entries)
+        articles.append(range(start, len(self.current_entries)))
+
+    async def add_new_entries(
+        self,
+        url: str,
+        new_entries: List[Entry],
+        changed_entries: List[Entry] | None = None,
+    ) -> None:
+        """Apply freshly merged entries to ``url``'s snapshot and, if shown, the list.
+
+        New entries are added above the existing rows and changed ones are
+        updated in place, so the list is only rebuilt once it has grown past
+        twice the budget's entries per feed (see _trim_rows()).
+        """
+        cap = self.budget.entries_per_feed
+        changed = {entry.id: entry for entry in changed_entries or ()}
+        timeline_new: List[Entry] = []
+        snapshot = self._snapshots.peek(url)
+        if snapshot is not None:
+            if changed:
+                for entry in snapshot:
+                    if entry.id in changed:
+                        # Same objects as current_entries, so the view sees it too.
+                        entry.update_content(changed[entry.id])
+            if new_entries:
+                snapshot = (new_entries + snapshot)[:cap]
+            if new_entries or changed:
+                # Re-measured, but left in its place: a refresh is not a view.
+                self._snapshots.replace(url, snapshot)
+
+        if self._timeline is not None:
+            if changed:
+                for entry in self._timeline_entries:
+                    if entry.feed_url == url and entry.id in changed:
+                        entry.update_content(changed[entry.id])
+            timeline_new = self._timeline.take_new(url, new_entries)
+            timeline_new.sort(key=lambda entry: -(entry.published_ts or 0.0))
+            self._timeline_entries[:0] = timeline_new
+            if not self._timeline_shown and len(self._timeline_entries) > 2 * cap:
+                # Rebuilt from the store when it is shown again.
+                self._timeline = None
+                self._timeline_entries = []
+        if self._timeline_shown:
+            new_entries = timeline_new
+        elif url != self.current_feed_url:
+            return
+        if self._searching():
+            return
+        try:
+            articles = self.query_one(ArticleList)
+        except NoMatches:
+            return
+
+        if changed:
+            for idx, entry in enumerate(self.current_entries):
+                if entry.feed_url in (url, "") and entry.id in changed:
+                    articles.refresh_entry(idx)
+        if not new_entries:
+            return
+        # Rows refer to entries by index, so new entries are appended to
+        # current_entries but shown above the stored ones.
+        start = len(self.current_entries)
+        self.current_entries.extend(new_entries)
+        articles.prepend(range(start, len(self.current_entries)))
+        self._prerender(new_entries)
+        await self._trim_rows(articles)
+
+    async def _trim_rows(self, articles: ArticleList) -> None:
+        """Show a list that refreshes grew past twice the cap from scratch.
+
+        Only while the cursor is among the newest ``entries_per_feed`` rows,
+        so nobody loses their place. The rows come back from the capped
+        snapshot or a new timeline; older ones page in again on scrolling.
+        """
+        cap = self.budget.entries_per_feed
+        if len(articles.order) <= 2 * cap or articles.cursor >= cap:
+            return
+        view = self._view
+        cursor = self.current_entries[articles.order[articles.cursor]]
+        if self._timeline_shown and self._timeline is not None:
+            feeds = {title: url for url, title in self._timeline.titles.items()}
+            self._timeline = Timeline(self.store, feeds)
+            entries = await self._timeline.next_page(cap)
+            self._timeline_entries = list(entries)
+        elif self.current_feed_url is not None:
+            entries = list(await self._snapshot(self.current_feed_url))
+        else:
+            return
+        if view != self._view or self._searching():
+            return
+        self.current_entries = entries
+        articles.set_entries(entries)
+        for idx, entry in enumerate(entries):
+            if entry.id == cursor.id and entry.feed_url == cursor.feed_url:
+                articles.cursor = idx
+                break
+        metrics.count("rows_trimmed")
 
     def show_article(self, index: int) -> None:
+        start = time.perf_counter()
         self._clear_content()
         container = self.query_one("#content")
 
@@ -288,35 +549,47 @@ A clean, modern terminal RSS reader.
             return
 
         entry = self.current_entries[index]
+        self.current_article = entry
+        self.last_article_id = entry.id
+        feed_url = entry.feed_url or self.current_feed_url
+        if not entry.read and feed_url:
+            entry.read = True
+            self._mark_snapshot_read(feed_url, entry.id)
+            self.run_worker(self.store.mark_read(feed_url, entry.id))
+
+        back = Button("← Back to feed", id="back-btn", classes="back-btn")
+        if entry.link:
+            full = Button("📄 Full article", id="full-article-btn", classes="back-btn")
+            container.mount(Horizontal(back, full, classes="article-actions"))
+        else:
+            container.mount(back)
 
-        container.mount(Button("← Back to feed", id="back-btn", classes="back-btn"))
-
-        if title := entry.get("title"):
+        if title := entry.title:
             container.mount(Static(title, classes="article-title"))
 
-        # Extract content
-        content = ""
-        for key in ("summary", "description", "content"):
-            if raw := entry.get(key):
-                if isinstance(raw, list) and raw:
-                    content = raw[0].get("value", "")
-                else:
-                    content = str(raw)
-                break
-
-        cleaned = clean_html_content(content)
+        cleaned = clean_html_content(entry.summary)
         container.mount(VerticalScroll(Static(cleaned, classes="article-content")))
 
-        if link := entry.get("link"):
+        if link := entry.link:
             container.mount(Static(f"\nFull article: {link}", classes="article-link"))
 
         meta = []
-        if author := entry.get("author"):
+        if author := entry.author:
             meta.append(f"By {author}")
-        if published := entry.get("published"):
+        if published := entry.published:
             meta.append(f"Published {published}")
         if meta:
             container.mount(Static(" • ".join(meta), classes="article-meta"))
+        metrics.record("show_article", time.perf_counter() - start, feed_url or "")
+
+    def show_full_article(self) -> None:
+        """Swap the open article's summary for the text of its linked page."""
+        if self.current_article is not None and self.current_article.link:
+            self.run_worker(
+                self._load_full_article(self.current_article),
+                group="full-article",
+                exclusive=True,
+            )
 
     def show_add_feed(self) -> None:
         self._clear_content()
@@ -330,6 +603,16 @@ A clean, modern terminal RSS reader.
         )
         container.mount(Button("Add Feed", id="submit-add", classes="primary-btn"))
 
+        container.mount(Static("Import or Export OPML", classes="section-title"))
+        container.mount(Input(placeholder="~/subscriptions.opml", id="opml-input"))
+        container.mount(
+            Horizontal(
+                Button("Import OPML", id="opml-import", classes="primary-btn"),
+                Button("Export OPML", id="opml-export", classes="primary-btn"),
+                classes="opml-actions",
+            )
+        )
+
     async def show_manage_feeds(self) -> None:
         self._clear_content()
         container = self.query_one("#content")
@@ -384,10 +667,92 @@ A clean, modern terminal RSS reader.
     # Helpers
     # -------------------------------------------------------------------------
 
+    def _list_header(self, title: str) -> Horizontal:
+        left_part = Vertical(
+            Static(title, classes="feed-title-big"),
+            Static("Click article to read →", classes="feed-hint"),
+            Static("↑↓ - navigation, • Enter - open • q - exit", classes="feed-hint"),
+            classes="feed-info-left",
+        )
+
+        search_part = Vertical(
+            # Horizontal(
+            #     Static(f"Feed: {title}", classes="feed-title"),
+            # ),
+            Horizontal(
+                Input(placeholder="Search articles…", id="search-input"),
+                Button("Search", id="search-btn", classes="search-btn"),
+                classes="search-box",
+            ),
+            classes="feed-header-right",
+        )
+
+        return Horizontal(left_part, search_part, classes="feed-header-root")
+
+    def _show_entries(self, articles: ArticleList) -> None:
+        """Fill ``articles`` from current_entries and focus it."""
+        articles.set_entries(self.current_entries)
+        self._prerender(self.current_entries)
+        if self.last_article_id is not None:
+            # Coming back from an article: put the cursor back on it.
+            for idx, entry in enumerate(self.current_entries):
+                if entry.id == self.last_article_id:
+                    articles.cursor = idx
+                    break
+            self.last_article_id = None
+        articles.focus()
+
+    def _prerender(self, entries: List[Entry]) -> None:
+        if self.PRERENDER_COUNT and entries:
+            contents = [entry.summary for entry in entries[: self.PRERENDER_COUNT]]
+            self.run_worker(
+                partial(prerender, contents), thread=True, group="prerender"
+            )
+
+    async def _snapshot(self, url: str) -> List[Entry]:
+        """Entries of ``url`` newest first, from memory or else the store."""
+        entries = self._snapshots.get(url)
+        if entries is None:
+            entries = await self.store.entries(
+                url, limit=self.budget.entries_per_feed
+            )
+            self._snapshots.put(url, entries)
+        return entries
+
+    def _mark_snapshot_read(self, url: str, guid: str) -> None:
+        # Search results and the timeline are separate objects from the
+        # snapshot's.
+        for entries in (self._snapshots.peek(url) or (), self._timeline_entries):
+            for entry in entries:
+                if entry.id == guid and entry.feed_url in (url, ""):
+                    entry.read = True
+                    break
+
+    def _searching(self) -> bool:
+        try:
+            return bool(self.query_one("#search-input", Input).value.strip())
+        except NoMatches:
+            return False
+
     def _clear_content(self) -> None:
+        self._view += 1
+        self.current_article = None
+        self._timeline_shown = False
         container = self.query_one("#content")
+        # Textual (checked against 6.11) keeps the widgets of old screens
+        # alive in two places: an Input stays subscribed to the screen's text
+        # selection signal after it is removed, and each node remembers up to
+        # 1024 query_one() results, only ageing them out. Both are private,
+        # hence the getattr guards.
+        selection = getattr(self.screen, "text_selection_started_signal", None)
+        if selection is not None:
+            for field in container.query(Input):
+                selection.unsubscribe(field)
         for child in list(container.children):
             child.remove()
+        query_cache = getattr(self, "_query_one_cache", None)
+        if query_cache is not None:
+            query_cache.clear()
 
     # -------------------------------------------------------------------------
     # Event Handlers
@@ -397,8 +762,14 @@ A clean, modern terminal RSS reader.
     async def _handle_buttons(self, event: Button.Pressed) -> None:
         btn_id = event.button.id or ""
 
-        if btn_id == "back-btn" and self.current_feed_title:
-            await self.show_feed(self.current_feed_title)
+        if btn_id == "full-article-btn":
+            self.show_full_article()
+
+        elif btn_id == "back-btn":
+            if self.current_feed_title:
+                await self.show_feed(self.current_feed_title)
+            elif self._timeline is not None:
+                await self.show_timeline(resume=True)
 
         elif btn_id == "submit-add":
             name = self.query_one("#name-input").value.strip()
@@ -417,9 +788,16 @@ A clean, modern terminal RSS reader.
             self.post_message(self.FeedsChanged())
             self.show_welcome()
 
-        elif btn_id.startswith("article-"):
-            idx = int(btn_id.split("-")[-1])
-            self.show_article(idx)
+        elif btn_id in ("opml-import", "opml-export"):
+            path = self.query_one("#opml-input", Input).value.strip()
+            if path:
+                target = Path(path).expanduser()
+                work = (
+                    self._import_opml(target)
+                    if btn_id == "opml-import"
+                    else self._export_opml(target)
+                )
+                self.run_worker(work, group=btn_id, exclusive=True)
 
         elif btn_id.startswith("delete-"):
             idx = int(btn_id.split("-")[-1])
@@ -427,8 +805,12 @@ A clean, modern terminal RSS reader.
 
             keys = list(feeds.keys())
             if 0 <= idx < len(keys):
-                feeds.pop(keys[idx])
+                url = feeds.pop(keys[idx])
                 await AsyncFileHandler.save_feeds(feeds)
+                if url not in feeds.values():
+                    self._snapshots.pop(url, None)
+                    self.loader.forget(url)
+                    await self.store.delete_feed(url)
                 self.post_message(self.FeedsChanged())
                 await self.show_manage_feeds()
 
@@ -443,23 +825,275 @@ A clean, modern terminal RSS reader.
             await self.show_discover_feeds()
 
         elif btn_id == "search-btn":
-            query = self.query_one("#search-input").value.lower()
-            await self._filter_articles(query)
+            self._start_search(self.query_one("#search-input", Input).value)
 
-    async def _filter_articles(self, query: str) -> None:
-        articles_area = self.query_one(".articles-list")
-        for child in list(articles_area.children):
-            await child.remove()
-
-        for idx, entry in enumerate(self.current_entries):
-            if query in entry.get("title", "").lower():
-                articles_area.mount(
-                    Button(
-                        entry.get("title", "Untitled"),
-                        id=f"article-{idx}",
-                        classes="article-btn",
+    @on(Input.Changed, "#search-input")
+    @on(Input.Submitted, "#search-input")
+    def _on_search_input(self, event: Input.Changed | Input.Submitted) -> None:
+        self._start_search(event.value)
+
+    def _start_search(self, query: str) -> None:
+        # Exclusive: each keystroke cancels the previous, still-pending search.
+        self.run_worker(self._filter_articles(query), group="search", exclusive=True)
+
+    @on(ArticleList.Selected)
+    def _on_article_selected(self, message: ArticleList.Selected) -> None:
+        self.show_article(message.index)
+
+    @on(ArticleList.Highlighted)
+    def _on_article_highlighted(self) -> None:
+        if not self.prefetch_count:
+            return
+        try:
+            articles = self.query_one(ArticleList)
+        except NoMatches:
+            return
+        # Readers go down a list; the row above is the next most likely.
+        cursor = articles.cursor
+        positions = [*range(cursor, cursor + self.prefetch_count), cursor - 1]
+        self.fulltext.prefetch(
+            articles.entries[articles.order[position]].link
+            for position in positions
+            if 0 <= position < len(articles.order)
+        )
+
+    @on(ArticleList.EndReached)
+    def _on_end_reached(self) -> None:
+        if self._searching():
+            return
+        if self._timeline_shown:
+            self.run_worker(
+                self._next_timeline_page(), group="timeline", exclusive=True
+            )
+        elif self.current_feed_url is not None:
+            self.run_worker(self._next_feed_page(), group="feed-page", exclusive=True)
+
+    @on(FeedsChanged)
+    def _on_feeds_changed(self) -> None:
+        # Left to bubble up to the app, which reloads the sidebar.
+        self._timeline = None
+        self._timeline_entries = []
+
+    async def _load_full_article(self, entry: Entry) -> None:
+        start = time.perf_counter()
+        view = self._view
+        try:
+            button = self.query_one("#full-article-btn", Button)
+        except NoMatches:
+            return
+        button.label = "Loading full article…"
+        button.disabled = True
+        try:
+            content = await self.fulltext.get(entry.link)
+            # html2text takes a while on long articles; keep it off the loop.
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(None, clean_html_content, content)
+        except Exception as exc:
+            if view == self._view:
+                button.label = "📄 Full article"
+                button.disabled = False
+                self.notify(f"Could not load the full article: {exc}", severity="error")
+            return
+        if view != self._view:
+            return
+        self.query_one(".article-content", Static).update(text)
+        button.label = "📄 Full article"
+        feed_url = entry.feed_url or self.current_feed_url or ""
+        metrics.record("show_full_article", time.perf_counter() - start, feed_url)
+
+    async def _import_opml(self, path: Path) -> None:
+        """Check and add the feeds in an OPML file, then list what failed."""
+        import aiofiles
+
+        view = self._view
+
+        def _progress(done: int, total: int, result: RefreshResult) -> None:
+            self.app.sub_title = f"Checking imported feeds {done}/{total}…"
+
+        try:
+            async with aiofiles.open(path, "rb") as f:
+                data = await f.read()
+            report = await import_opml(data, self.loader, _progress)
+        except (OSError, ValueError) as exc:
+            self.notify(f"Import failed: {exc}", severity="error")
+            return
+        finally:
+            self.app.sub_title = ""
+
+        if report.added:
+            self.post_message(self.FeedsChanged())
+        self.notify(
+            report.summary(), severity="warning" if report.failed else "information"
+        )
+        if view != self._view or not report.failed:
+            return
+        container = self.query_one("#content")
+        container.mount(Static("Feeds that could not be imported", classes="info"))
+        container.mount(
+            VerticalScroll(
+                *(
+                    Vertical(
+                        Static(result.title, classes="manage-name"),
+                        Static(
+                            f"{result.url} – {result.error}", classes="manage-url"
+                        ),
+                        classes="manage-row",
                     )
-                )
+                    for result in report.failed
+                ),
+                classes="manage-list",
+            )
+        )
+
+    async def _export_opml(self, path: Path) -> None:
+        import aiofiles
+
+        feeds = await AsyncFileHandler.load_feeds()
+        try:
+            async with aiofiles.open(path, "wb") as f:
+                await f.write(build_opml(feeds))
+        except OSError as exc:
+            self.notify(f"Export failed: {exc}", severity="error")
+            return
+        self.notify(f"Exported {len(feeds)} feeds to {path}")
+
+    async def _filter_articles(self, query: str) -> None:
+        """Show full-text matches from every stored feed, or the feed again."""
+        await asyncio.sleep(self.SEARCH_DEBOUNCE)
+        if query.strip():
+            entries = await self.store.search(query)
+            feeds = await AsyncFileHandler.load_feeds()
+            titles = {url: title for title, url in feeds.items()}
+            for entry in entries:
+                entry.feed_title = titles.get(entry.feed_url, "")
+        elif self.current_feed_url is not None:
+            entries = list(await self._snapshot(self.current_feed_url))
+        elif self._timeline_shown:
+            entries = list(self._timeline_entries)
+        else:
+            return
+        self.current_entries = entries
+        try:
+            self.query_one(ArticleList).set_entries(entries)
+        except NoMatches:
+            pass
+
+
+# =============================================================================
+# Stats Screen
+# =============================================================================
+
+
+class StatsScreen(Screen):
+    """Where the time goes, per stage and per feed (see metrics.py)."""
+
+    BINDINGS = [
+        ("escape", "app.pop_screen", "Close"),
+        ("c", "toggle_collection", "Start/stop"),
+        ("e", "export", "Export JSON"),
+        ("x", "reset", "Reset"),
+    ]
+
+    # Feeds listed, those with the most refresh time first; the JSON export
+    # has every feed.
+    TOP_FEEDS = 30
+
+    def __init__(self, titles: Dict[str, str], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.titles = titles  # feed URL -> title
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield VerticalScroll(
+            Static(id="stats-status", classes="info"),
+            Static(id="stats-stages"),
+            Static(id="stats-feeds"),
+        )
+        yield BindingsFooter()
+
+    def on_mount(self) -> None:
+        self._update()
+        self.set_interval(1.0, self._update)
+
+    def _update(self) -> None:
+        from rich.table import Table
+
+        snapshot = metrics.snapshot()
+        if snapshot["enabled"]:
+            since = time.strftime("%H:%M:%S", time.localtime(snapshot["since"]))
+            status = f"Collecting since {since}. c stops, e exports, x resets."
+        else:
+            status = "Collection is off. Press c to start."
+        self.query_one("#stats-status", Static).update(status)
+
+        stages = Table(title="Stages", expand=True)
+        for column in ("Stage", "Count", "p50 ms", "p95 ms", "Max ms", "Total s"):
+            stages.add_column(column, justify="left" if column == "Stage" else "right")
+        for stage, s in sorted(snapshot["stages"].items()):
+            stages.add_row(
+                stage,
+                str(s["count"]),
+                f"{s['p50_ms']:.1f}",
+                f"{s['p95_ms']:.1f}",
+                f"{s['max_ms']:.1f}",
+                f"{s['total_ms'] / 1000:.2f}",
+            )
+        self.query_one("#stats-stages", Static).update(stages)
+
+        feeds = Table(title="Slowest feeds", expand=True)
+        feeds.add_column("Feed", ratio=1, no_wrap=True)
+        for column in (
+            "Fetches",
+            "Cache hits",
+            "Entries",
+            "KiB",
+            "p50 ms",
+            "p95 ms",
+            "Request p95",
+            "Parse p95",
+            "Errors",
+        ):
+            feeds.add_column(column, justify="right")
+        ranked = sorted(
+            (item for item in snapshot["feeds"].items() if item[0]),
+            key=lambda item: -item[1]["stages"].get("refresh", {}).get("total_ms", 0),
+        )
+
+        def _ms(stats: Dict[str, Dict[str, float]], stage: str, key: str) -> str:
+            return f"{stats[stage][key]:.0f}" if stage in stats else "–"
+
+        for url, feed in ranked[: self.TOP_FEEDS]:
+            stats, counters = feed["stages"], feed["counters"]
+            hit_rate = feed.get("cache_hit_rate")
+            feeds.add_row(
+                self.titles.get(url, url),
+                str(sum(counters.get(name, 0) for name in metrics.CACHE_COUNTERS)),
+                "–" if hit_rate is None else f"{hit_rate:.0%}",
+                str(feed.get("entries_per_fetch", "–")),
+                f"{counters.get('bytes', 0) / 1024:.0f}",
+                _ms(stats, "refresh", "p50_ms"),
+                _ms(stats, "refresh", "p95_ms"),
+                _ms(stats, "request", "p95_ms"),
+                _ms(stats, "parse", "p95_ms"),
+                str(counters.get("errors", 0)),
+            )
+        self.query_one("#stats-feeds", Static).update(feeds)
+
+    def action_toggle_collection(self) -> None:
+        if metrics.enabled():
+            metrics.disable()
+        else:
+            metrics.enable()
+        self._update()
+
+    def action_export(self) -> None:
+        path = AsyncFileHandler._config_dir() / "metrics.json"
+        metrics.export_json(path)
+        self.notify(f"Metrics written to {path}")
+
+    def action_reset(self) -> None:
+        metrics.reset()
+        self._update()
 
 
 # =============================================================================
@@ -477,18 +1111,43 @@ class RssFeedTUI(App):
         ("q", "quit", "Quit"),
         ("h", "go_home", "Home"),
         ("slash", "focus_search", "Focus search"),
+        ("r", "refresh_all", "Refresh all"),
+        ("s", "toggle_stats", "Stats"),
+        ("f", "full_article", "Full article"),
     ]
 
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._refreshing = False
+
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         yield Horizontal(Sidebar(id="sidebar"), MainContent(id="main-content"))
-        yield Footer()
+        yield BindingsFooter()
 
     def on_mount(self) -> None:
-        self.query_one(MainContent).show_welcome()
+        content = self.query_one(MainContent)
+        content.show_welcome()
         self.screen.remove_class("dark")
         self.screen.add_class("light")
 
+        self.refresher = FeedRefresher(content.loader, content.store)
+        self.scheduler = PollScheduler(self.refresher, on_result=self._on_poll_result)
+        self.run_worker(self._run_scheduler(), group="scheduler")
+
+    async def _run_scheduler(self) -> None:
+        self.scheduler.sync(await AsyncFileHandler.load_feeds())
+        await self.scheduler.run()
+
+    async def _on_poll_result(self, result: RefreshResult) -> None:
+        try:
+            content = self.query_one(MainContent)
+        except NoMatches:
+            return
+        await content.add_new_entries(
+            result.url, result.new_entries, result.changed_entries
+        )
+
     @on(Sidebar.FeedSelected)
     async def _on_feed_selected(self, message: Sidebar.FeedSelected) -> None:
         await self.query_one(MainContent).show_feed(message.title)
@@ -496,7 +1155,9 @@ class RssFeedTUI(App):
     @on(Sidebar.ModeSelected)
     async def _on_mode_selected(self, message: Sidebar.ModeSelected) -> None:
         content = self.query_one(MainContent)
-        if message.mode == "add":
+        if message.mode == "timeline":
+            await content.show_timeline()
+        elif message.mode == "add":
             content.show_add_feed()
         elif message.mode == "manage":
             await content.show_manage_feeds()
@@ -505,7 +1166,9 @@ class RssFeedTUI(App):
 
     @on(MainContent.FeedsChanged)
     async def _on_feeds_changed(self) -> None:
-        await self.query_one(Sidebar)._refresh_feeds()
+        sidebar = self.query_one(Sidebar)
+        await sidebar._refresh_feeds()
+        self.scheduler.sync(sidebar.feed_data)
 
     def action_toggle_dark(self) -> None:
         if "dark" in self.screen.classes:
@@ -515,6 +1178,44 @@ class RssFeedTUI(App):
             self.screen.remove_class("light")
             self.screen.add_class("dark")
 
+    def action_refresh_all(self) -> None:
+        if not self._refreshing:
+            self._refreshing = True
+            self.run_worker(self._refresh_all(), group="refresh")
+
+    async def _refresh_all(self) -> None:
+        content = self.query_one(MainContent)
+
+        def _progress(done: int, total: int, result: RefreshResult) -> None:
+            self.sub_title = f"Refreshing feeds {done}/{total}…"
+
+        try:
+            results = await self.refresher.refresh_all(progress=_progress)
+            for result in results:
+                await content.add_new_entries(
+                    result.url, result.new_entries, result.changed_entries
+                )
+        finally:
+            self._refreshing = False
+            self.sub_title = ""
+
+        failed = [result.title for result in results if not result.ok]
+        new = sum(len(result.new_entries) for result in results)
+        message = f"Refreshed {len(results)} feeds, {new} new articles"
+        if failed:
+            message += f"; {len(failed)} failed: {', '.join(failed[:5])}"
+        self.notify(message, severity="warning" if failed else "information")
+
+    def action_toggle_stats(self) -> None:
+        if isinstance(self.screen, StatsScreen):
+            self.pop_screen()
+            return
+        feeds = self.query_one(Sidebar).feed_data
+        self.push_screen(StatsScreen({url: title for title, url in feeds.items()}))
+
+    def action_full_article(self) -> None:
+        self.query_one(MainContent).show_full_article()
+
     def action_go_home(self) -> None:
         self.query_one(MainContent).show_welcome()
 
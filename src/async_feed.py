@@ -2,39 +2,772 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import os
+import pickle
+import re
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Set, Tuple
 
-import aiofiles
-import aiohttp
-import feedparser
+from . import metrics
+from .budget import ByteLRU, MemoryBudget, feed_size
+from .models import Entry
+from .parsing import EntryStream, parse_feed_bytes
+from .shared_cache import SharedFetchCache
+
+# aiohttp and aiofiles are imported where first used: together they cost a
+# quarter of a second at startup, before the UI needs either of them.
+if TYPE_CHECKING:
+    import aiohttp
+
+USER_AGENT = "rss-feed-tui/1.0 (+https://github.com/whaiman/rss-feed-tui)"
+
+
+class FeedHTTPError(RuntimeError):
+    """Non-200 feed response; ``retry_after`` is in seconds when sent."""
+
+    def __init__(
+        self, status: int, reason: str, retry_after: float | None = None
+    ) -> None:
+        super().__init__(f"HTTP {status}: {reason}")
+        self.status = status
+        self.reason = reason
+        self.retry_after = retry_after
+
+    def __reduce__(self) -> Tuple[type, Tuple[Any, ...]]:
+        # Picklable, so other processes can be given the same error.
+        return FeedHTTPError, (self.status, self.reason, self.retry_after)
+
+
+class FeedTooLargeError(RuntimeError):
+    """Feed body over the loader's ``max_bytes`` limit."""
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(f"Feed is larger than {limit / 2**20:g} MiB")
+        self.limit = limit
+
+    def __reduce__(self) -> Tuple[type, Tuple[Any, ...]]:
+        return FeedTooLargeError, (self.limit,)
+
+
+def _retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given as seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*\"?(\d+)")
+
+
+def _permanent_location(resp: aiohttp.ClientResponse) -> str | None:
+    """Where a feed has permanently moved, or None if it has not.
+
+    Follows the redirects that led to ``resp`` only while they are permanent
+    (301/308); a temporary hop after that keeps the URL reached so far.
+    """
+    hops = [*resp.history, resp]
+    location = None
+    for hop, following in zip(hops, hops[1:]):
+        if hop.status not in (301, 308):
+            break
+        location = str(following.url)
+    return location
+
+
+def _trace_config() -> aiohttp.TraceConfig:
+    """Reports DNS lookups and new connections (DNS included) to metrics."""
+    import aiohttp
+
+    def _start(stage: str) -> Callable[..., object]:
+        async def on_start(session: object, ctx: object, params: object) -> None:
+            setattr(ctx, stage, time.perf_counter())
+
+        return on_start
+
+    def _end(stage: str) -> Callable[..., object]:
+        async def on_end(session: object, ctx: object, params: object) -> None:
+            start = getattr(ctx, stage, None)
+            if start is not None:
+                feed = (ctx.trace_request_ctx or {}).get("feed", "")
+                metrics.record(stage, time.perf_counter() - start, feed)
+
+        return on_end
+
+    trace = aiohttp.TraceConfig()
+    trace.on_dns_resolvehost_start.append(_start("dns"))
+    trace.on_dns_resolvehost_end.append(_end("dns"))
+    trace.on_connection_create_start.append(_start("connect"))
+    trace.on_connection_create_end.append(_end("connect"))
+    return trace
+
+
+class CacheEntry:
+    """Validators, freshness and body of one cached feed response."""
+
+    def __init__(
+        self,
+        url: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        expires_at: float = 0.0,
+        fetched_at: float = 0.0,
+        body: bytes | None = None,
+    ) -> None:
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+        # When the body was last downloaded; unchanged by 304 revalidation.
+        self.fetched_at = fetched_at
+        self.body = body
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Refresh validators and freshness lifetime from response headers."""
+        self.etag = headers.get("ETag", self.etag)
+        self.last_modified = headers.get("Last-Modified", self.last_modified)
+        self.expires_at = time.time() + _freshness_lifetime(headers)
+
+    def meta(self) -> Dict[str, object]:
+        return {
+            "url": self.url,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "expires_at": self.expires_at,
+            "fetched_at": self.fetched_at,
+        }
+
+
+def _freshness_lifetime(headers: Mapping[str, str]) -> float:
+    """Seconds a response may be served without revalidation."""
+    cache_control = headers.get("Cache-Control", "").lower()
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return 0.0
+    match = _MAX_AGE_RE.search(cache_control)
+    if not match:
+        return 0.0
+    try:
+        age = float(headers.get("Age", 0))
+    except ValueError:
+        age = 0.0
+    return max(0.0, int(match.group(1)) - age)
+
+
+class HttpCache:
+    """On-disk store of feed bodies and their HTTP validators.
+
+    Each URL maps to ``<sha1>.json`` (validators and expiry) and
+    ``<sha1>.body`` (the raw response bytes) inside ``directory``. A parse
+    the loader dropped from memory is kept in ``<sha1>.parsed``, pickled,
+    until the body changes.
+
+    Every fetch or revalidation rewrites a URL's ``.json``, so files of feeds
+    not fetched for ``max_age`` seconds (unsubscribed ones, say) are removed,
+    once per cache, on its first write. :meth:`remove` drops a URL at once.
+    """
+
+    def __init__(self, directory: Path, max_age: float = 30 * 24 * 3600) -> None:
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+        self._pruned = False
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def _parsed_path(self, url: str) -> Path:
+        return self._paths(url)[1].with_suffix(".parsed")
+
+    async def get(self, url: str) -> CacheEntry | None:
+        """Load the validators for ``url``; the body is read on demand."""
+        import aiofiles
+
+        meta_path, body_path = self._paths(url)
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            async with aiofiles.open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.loads(await f.read())
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return CacheEntry(
+            url,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            expires_at=meta.get("expires_at", 0.0),
+            fetched_at=meta.get("fetched_at", 0.0),
+        )
+
+    async def read_body(self, entry: CacheEntry) -> bytes:
+        if entry.body is None:
+            import aiofiles
+
+            async with aiofiles.open(self._paths(entry.url)[1], "rb") as f:
+                entry.body = await f.read()
+        return entry.body
+
+    async def put(self, entry: CacheEntry, body_changed: bool = True) -> None:
+        """Persist ``entry``; the body is rewritten only when it changed."""
+        if not self._pruned:
+            self._pruned = True
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.prune, time.time() - self.max_age)
+        meta_path, body_path = self._paths(entry.url)
+        if body_changed and entry.body is not None:
+            await _atomic_write(body_path, entry.body)
+        await _atomic_write(meta_path, json.dumps(entry.meta()).encode("utf-8"))
+
+    async def put_parsed(self, url: str, fetched_at: float, feed: dict) -> None:
+        """Keep the parse of the body fetched at ``fetched_at``."""
+        data = pickle.dumps((url, fetched_at, feed), protocol=5)
+        await _atomic_write(self._parsed_path(url), data)
+
+    async def get_parsed(self, entry: CacheEntry) -> dict | None:
+        """The kept parse of ``entry``'s body, or None if there is none."""
+        import aiofiles
+
+        try:
+            async with aiofiles.open(self._parsed_path(entry.url), "rb") as f:
+                url, fetched_at, feed = pickle.loads(await f.read())
+        except Exception:
+            # Missing, or damaged; the body is parsed again instead.
+            return None
+        if url != entry.url or fetched_at != entry.fetched_at:
+            return None
+        return feed
+
+    def remove(self, url: str) -> None:
+        """Forget everything cached for ``url``."""
+        for path in (*self._paths(url), self._parsed_path(url)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def prune(self, cutoff: float) -> int:
+        """Remove the files of URLs last fetched before ``cutoff``; returns how many.
+
+        Another app process may be pruning the same directory, so files that
+        vanish meanwhile are skipped.
+        """
+        fetched: Dict[str, float] = {}
+        others = []
+        for item in os.scandir(self.directory):
+            key, _, suffix = item.name.rpartition(".")
+            try:
+                mtime = item.stat().st_mtime
+            except OSError:
+                continue
+            if suffix == "json":
+                fetched[key] = mtime
+            else:
+                others.append((key, mtime, item.path))
+        # A body or parse goes with its .json; strays age out by their own mtime.
+        stale = [
+            path for key, mtime, path in others if fetched.get(key, mtime) < cutoff
+        ]
+        stale += [
+            os.path.join(self.directory, f"{key}.json")
+            for key, mtime in fetched.items()
+            if mtime < cutoff
+        ]
+        removed = 0
+        for path in stale:
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            removed += 1
+        return removed
+
+
+async def _atomic_write(path: Path, data: bytes, fsync: bool = False) -> None:
+    """Write via a temporary file and rename, so readers never see a partial file."""
+    import aiofiles
+
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    async with aiofiles.open(tmp, "wb") as f:
+        await f.write(data)
+        if fsync:
+            await f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+EntryListener = Callable[[List[Entry]], None]
+
+
+class _SharedLoad:
+    """A fetch in progress, the callers waiting on it and their previews."""
+
+    def __init__(self, task: asyncio.Task, listeners: List[EntryListener]) -> None:
+        self.task = task
+        self.consumers = 0
+        self.listeners = listeners
 
 
 class AsyncFeedLoader:
-    """Loads RSS/Atom feeds asynchronously."""
+    """Loads RSS/Atom feeds asynchronously over one pooled HTTP session.
+
+    The session (and its connection pool, DNS cache and keep-alive sockets) is
+    created lazily on first use and reused for every fetch until :meth:`close`
+    is called, so repeated loads from the same host skip DNS/TCP/TLS setup.
+
+    Parsing runs off the event loop in ``parse_executor`` (``"thread"`` or
+    ``"process"``; ``None`` parses inline) so large feeds don't stall the UI.
+
+    Concurrent loads of the same URL share one fetch. A fetch is cancelled
+    once every caller waiting on it has been cancelled.
+
+    Bodies are read in chunks and a download stops with
+    :class:`FeedTooLargeError` once it passes ``max_bytes`` (after
+    decompression; ``None`` for no limit), so an oversized or endless response
+    can't exhaust memory.
+
+    With a ``shared`` cache, app processes on the same machine fetch each
+    feed once between them: a recent fetch by any of them is reused, and
+    concurrent loads wait for the one process fetching (see shared_cache.py).
+
+    Parses of cached bodies are kept in memory up to ``budget.share`` bytes;
+    the least recently loaded are spilled next to their body in the cache
+    and read back from there instead of being parsed again.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        timeout: int = 15,
+        pool_size: int = 100,
+        per_host: int = 8,
+        dns_ttl: int = 300,
+        keepalive: float = 30.0,
+        cache: HttpCache | None = None,
+        parse_executor: str | None = "thread",
+        parse_workers: int | None = None,
+        max_bytes: int | None = 16 * 2**20,
+        shared: SharedFetchCache | None = None,
+        budget: MemoryBudget | None = None,
+    ) -> None:
+        if parse_executor not in ("thread", "process", None):
+            raise ValueError(f"Unknown parse executor: {parse_executor!r}")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.per_host = per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive = keepalive
+        self.cache = cache
+        self.parse_executor = parse_executor
+        self.parse_workers = parse_workers
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self._executor: Executor | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._closed = False
+        budget = budget or MemoryBudget.from_env()
+        # URL -> (fetched_at, parse) of its cached body.
+        self._parsed: ByteLRU[str, Tuple[float, dict]] = ByteLRU(
+            budget.share, lambda hit: feed_size(hit[1]), on_evict=self._spill
+        )
+        self._spills: Set[asyncio.Task] = set()
+        # Parses submitted to the executor and not yet finished.
+        self._parses: Set[Future] = set()
+        self._inflight: Dict[str, _SharedLoad] = {}
+
+    async def __aenter__(self) -> "AsyncFeedLoader":
+        return self
 
-    def __init__(self, timeout: int = 15) -> None:
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
 
-    async def load_feed(self, url: str) -> dict:
-        """Fetch and parse a feed, raising clear exceptions on failure."""
-        async with aiohttp.ClientSession(timeout=self.timeout) as session:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    raise RuntimeError(f"HTTP {resp.status}: {resp.reason}")
-                text = await resp.text()
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._closed:
+            raise RuntimeError("Feed loader is closed")
+        if self._session is None or self._session.closed:
+            import aiohttp
 
-        feed = feedparser.parse(text)
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.per_host,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive,
+            )
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=connector,
+                headers={"Accept-Encoding": "gzip, deflate", "User-Agent": USER_AGENT},
+                # Tracing costs a little on every request, so it is only set
+                # up for sessions started while metrics are on.
+                trace_configs=[_trace_config()] if metrics.enabled() else None,
+            )
+        return self._session
 
-        if feed.bozo and getattr(feed, "bozo_exception", None):
-            raise RuntimeError(f"Parse error: {feed.bozo_exception}")
+    def _get_executor(self) -> Executor | None:
+        if self._executor is None and self.parse_executor is not None:
+            if self.parse_executor == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.parse_workers)
+            else:
+                # feedparser holds the GIL, so extra threads only compete with
+                # the UI loop; one worker keeps frames smooth.
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.parse_workers or 1,
+                    thread_name_prefix="feed-parse",
+                )
+        return self._executor
 
+    async def close(self) -> None:
+        """Close the shared session and shut down the parse workers."""
+        self._closed = True
+        for load in self._inflight.values():
+            load.task.cancel()
+        self._inflight.clear()
+        if self._spills:
+            await asyncio.gather(*self._spills, return_exceptions=True)
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._executor is not None:
+            # shutdown(cancel_futures=True) needs Python 3.9: drop queued
+            # parses by hand so closing doesn't wait behind them.
+            for future in list(self._parses):
+                future.cancel()
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self.shared is not None:
+            await self.shared.close()
+
+    def forget(self, url: str) -> None:
+        """Drop ``url``'s parse and cached response, e.g. on unsubscribing."""
+        self._parsed.pop(url)
+        if self.cache is not None:
+            self.cache.remove(url)
+
+    async def load_feed(
+        self, url: str, on_entries: EntryListener | None = None
+    ) -> dict:
+        """Fetch and parse a feed, raising clear exceptions on failure.
+
+        With a cache configured, a fresh entry is served without any request,
+        and a stale one is revalidated with a conditional GET; a ``304`` reuses
+        the cached parse. Callers loading a URL that is already being fetched
+        join that fetch and get the same result.
+
+        ``on_entries`` is called with batches of preview entries read from the
+        body while it downloads (plain RSS/Atom only, and not when the feed
+        comes from the cache). They are for display: the returned parse is
+        the authoritative result.
+
+        If the fetch followed permanent redirects (301/308), the feed's new
+        address is in ``feed["feed"]["url"]``.
+        """
+        load = self._inflight.get(url)
+        if load is None:
+            listeners: List[EntryListener] = []
+            load = self._inflight[url] = _SharedLoad(
+                asyncio.ensure_future(self._load_feed(url, listeners)), listeners
+            )
+            load.task.add_done_callback(partial(self._forget_load, url, load))
+        load.consumers += 1
+        if on_entries is not None:
+            load.listeners.append(on_entries)
+        try:
+            # Shielded so one caller's cancellation doesn't end the others' fetch.
+            return await asyncio.shield(load.task)
+        finally:
+            load.consumers -= 1
+            if on_entries is not None:
+                load.listeners.remove(on_entries)
+            if not load.consumers and not load.task.done():
+                load.task.cancel()
+
+    def _forget_load(self, url: str, load: _SharedLoad, task: asyncio.Task) -> None:
+        if self._inflight.get(url) is load:
+            del self._inflight[url]
+        if not task.cancelled():
+            # Mark the error retrieved even if every caller has gone away.
+            task.exception()
+
+    async def _load_feed(self, url: str, listeners: List[EntryListener]) -> dict:
+        shared = self.shared
+        if shared is None:
+            return await self._fetch(url, listeners)
+        while True:
+            feed = await shared.get(url)
+            if feed is not None:
+                metrics.count("shared_hit", feed=url)
+                return feed
+            if await shared.acquire(url):
+                break
+            metrics.count("shared_wait", feed=url)
+            await shared.wait(url)
+        try:
+            feed = await self._fetch(url, listeners)
+        except asyncio.CancelledError:
+            await shared.release(url)
+            raise
+        except Exception as exc:
+            await shared.put_error(url, exc)
+            raise
+        await shared.put(url, feed)
         return feed
 
+    async def _fetch(self, url: str, listeners: List[EntryListener]) -> dict:
+        cached = await self.cache.get(url) if self.cache is not None else None
+        if cached is not None and cached.is_fresh():
+            metrics.count("cache_fresh", feed=url)
+            return await self._parse_cached(cached)
+
+        headers = cached.conditional_headers() if cached is not None else None
+        start = time.perf_counter()
+        async with self._get_session().get(
+            url, headers=headers, trace_request_ctx={"feed": url}
+        ) as resp:
+            # Until the response headers: DNS, connect, and the server's time.
+            metrics.record("request", time.perf_counter() - start, url)
+            if resp.status == 304 and cached is not None:
+                metrics.count("cache_revalidated", feed=url)
+                cached.update_from_headers(resp.headers)
+                await self.cache.put(cached, body_changed=False)
+                return await self._parse_cached(cached)
+            if resp.status != 200:
+                raise FeedHTTPError(
+                    resp.status,
+                    resp.reason or "",
+                    _retry_after(resp.headers.get("Retry-After")),
+                )
+            with metrics.span("download", url):
+                body = await self._read_body(resp, listeners)
+            resp_headers = resp.headers
+            moved_to = _permanent_location(resp)
+
+        metrics.count("cache_miss", feed=url)
+        metrics.count("bytes", len(body), feed=url)
+        with metrics.span("parse", url):
+            feed = await self._parse(body)
+        metrics.count("entries", len(feed["entries"]), feed=url)
+        if moved_to is not None:
+            feed["feed"]["url"] = moved_to
+
+        if self.cache is not None and "no-store" not in resp_headers.get(
+            "Cache-Control", ""
+        ):
+            entry = CacheEntry(url, fetched_at=time.time(), body=body)
+            entry.update_from_headers(resp_headers)
+            if entry.etag or entry.last_modified or entry.is_fresh():
+                await self.cache.put(entry)
+                self._parsed.put(url, (entry.fetched_at, feed))
+
+        return feed
+
+    async def fetch_page(self, url: str) -> Tuple[str, bytes]:
+        """GET a web page over the feed session: its Content-Type and body.
+
+        For pages linked from feeds, e.g. full articles. Errors and the
+        ``max_bytes`` limit are as for feeds; nothing is cached here.
+        """
+        async with self._get_session().get(
+            url, headers={"Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.1"}
+        ) as resp:
+            if resp.status != 200:
+                raise FeedHTTPError(
+                    resp.status,
+                    resp.reason or "",
+                    _retry_after(resp.headers.get("Retry-After")),
+                )
+            body = await self._read_body(resp, [])
+            return resp.headers.get("Content-Type", ""), body
+
+    async def _read_body(
+        self, resp: aiohttp.ClientResponse, listeners: List[EntryListener]
+    ) -> bytes:
+        limit = self.max_bytes
+        if limit is not None and (resp.content_length or 0) > limit:
+            raise FeedTooLargeError(limit)
+        stream = EntryStream() if listeners else None
+        chunks: List[bytes] = []
+        size = 0
+        async for chunk in resp.content.iter_chunked(self.CHUNK_SIZE):
+            size += len(chunk)
+            if limit is not None and size > limit:
+                raise FeedTooLargeError(limit)
+            chunks.append(chunk)
+            if stream is not None and listeners:
+                entries = stream.feed(chunk)
+                if entries:
+                    for listener in list(listeners):
+                        listener(entries)
+        return b"".join(chunks)
+
+    async def _parse_cached(self, entry: CacheEntry) -> dict:
+        """Return the parse of a cached body, reusing it if already parsed."""
+        hit = self._parsed.get(entry.url)
+        if hit is None or hit[0] != entry.fetched_at:
+            feed = await self.cache.get_parsed(entry)
+            if feed is not None:
+                metrics.count("parse_reloaded", feed=entry.url)
+            else:
+                body = await self.cache.read_body(entry)
+                with metrics.span("parse", entry.url):
+                    feed = await self._parse(body)
+            hit = (entry.fetched_at, feed)
+            self._parsed.put(entry.url, hit)
+        metrics.count("entries", len(hit[1]["entries"]), feed=entry.url)
+        return hit[1]
+
+    def _spill(self, url: str, hit: Tuple[float, dict]) -> None:
+        """Write a parse dropped from memory to the cache, in the background."""
+        if self.cache is None or self._closed:
+            return
+        metrics.count("parse_spilled", feed=url)
+        task = asyncio.ensure_future(self.cache.put_parsed(url, *hit))
+        self._spills.add(task)
+        task.add_done_callback(self._spilled)
+
+    def _spilled(self, task: asyncio.Task) -> None:
+        self._spills.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # Only costs a parse when the feed is next loaded.
+            metrics.count("parse_spill_failed")
+
+    async def _parse(self, body: bytes) -> dict:
+        executor = self._get_executor()
+        if executor is None:
+            return parse_feed_bytes(body)
+        future = executor.submit(parse_feed_bytes, body)
+        self._parses.add(future)
+        future.add_done_callback(self._parses.discard)
+        return await asyncio.wrap_future(future)
+
+
+class _JsonDocument:
+    """In-memory copy of one JSON config file with coalesced atomic writes.
+
+    Reads are served from memory while the file's (mtime, size) signature is
+    unchanged, so external edits are still picked up by a single ``stat``.
+    Updates mark the copy dirty and schedule one delayed write; any further
+    updates before it fires are folded into it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.data: Dict[str, str] | None = None
+        self.signature: Tuple[int, int] | None = None
+        self.version = 0
+        self.written_version = 0
+        # Documents are cached per path for the whole process, which may run
+        # several event loops (fetch.py, tests); the lock and pending write
+        # belong to the loop that made them.
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+        self._flush_task: asyncio.Future | None = None
+
+    @property
+    def dirty(self) -> bool:
+        return self.version != self.written_version
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _pending_flush(self) -> asyncio.Future | None:
+        task = self._flush_task
+        if task is None or task.done():
+            return None
+        if task.get_loop() is not asyncio.get_running_loop():
+            return None  # Its loop is gone; the next write covers it.
+        return task
+
+    def _stat(self) -> Tuple[int, int] | None:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    async def load(self) -> Dict[str, str] | None:
+        if self.dirty:
+            return self.data
+        signature = self._stat()
+        if signature is None:
+            return None
+        if self.data is None or signature != self.signature:
+            import aiofiles
+
+            async with aiofiles.open(self.path, "r", encoding="utf-8") as f:
+                self.data = json.loads(await f.read())
+            self.signature = signature
+        return self.data
+
+    def update(self, data: Dict[str, str], delay: float) -> None:
+        self.data = dict(data)
+        self.version += 1
+        if self._pending_flush() is None:
+            self._flush_task = asyncio.ensure_future(self._flush_later(delay))
+
+    async def _flush_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        async with self._get_lock():
+            while self.dirty:
+                await self._write()
+
+    async def _write(self) -> None:
+        version = self.version
+        payload = json.dumps(self.data, indent=4, ensure_ascii=False)
+        await _atomic_write(self.path, payload.encode("utf-8"), fsync=True)
+        self.signature = self._stat()
+        self.written_version = version
+
+    async def flush(self) -> None:
+        """Write any pending update now."""
+        task = self._pending_flush()
+        if task is not None:
+            task.cancel()
+        async with self._get_lock():
+            if self.dirty:
+                await self._write()
+
 
 class AsyncFileHandler:
-    """Handles persistent JSON storage in ~/.config/rss-feed-tui."""
+    """Handles persistent JSON storage in ~/.config/rss-feed-tui.
+
+    The feed lists are loaded once and then served from memory; saves update
+    memory immediately and reach disk ``WRITE_DELAY`` seconds later as one
+    atomic write. Call :meth:`flush` before exiting.
+    """
+
+    WRITE_DELAY = 0.5
+
+    _documents: Dict[Path, _JsonDocument] = {}
 
     @staticmethod
     def _config_dir() -> Path:
@@ -50,29 +783,36 @@ class AsyncFileHandler:
     def _discover_path() -> Path:
         return AsyncFileHandler._config_dir() / "discover.json"
 
+    @staticmethod
+    def _document(path: Path) -> _JsonDocument:
+        if path not in AsyncFileHandler._documents:
+            AsyncFileHandler._documents[path] = _JsonDocument(path)
+        return AsyncFileHandler._documents[path]
+
     @staticmethod
     async def load_feeds() -> Dict[str, str]:
-        path = AsyncFileHandler._feeds_path()
-        if not path.exists():
-            return {}
-        async with aiofiles.open(path, "r", encoding="utf-8") as f:
-            content = await f.read()
-            return json.loads(content)
+        document = AsyncFileHandler._document(AsyncFileHandler._feeds_path())
+        feeds = await document.load()
+        return dict(feeds) if feeds is not None else {}
 
     @staticmethod
     async def save_feeds(feeds: Dict[str, str]) -> None:
-        path = AsyncFileHandler._feeds_path()
-        async with aiofiles.open(path, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(feeds, indent=4, ensure_ascii=False))
+        document = AsyncFileHandler._document(AsyncFileHandler._feeds_path())
+        document.update(feeds, AsyncFileHandler.WRITE_DELAY)
+
+    @staticmethod
+    async def flush() -> None:
+        """Write pending changes to disk immediately."""
+        for document in list(AsyncFileHandler._documents.values()):
+            await document.flush()
 
     @staticmethod
     async def load_discover_feeds() -> Dict[str, str]:
         path = AsyncFileHandler._discover_path()
         if not path.exists():
             await AsyncFileHandler._create_default_discover()
-        async with aiofiles.open(path, "r", encoding="utf-8") as f:
-            content = await f.read()
-            return json.loads(content)
+        discover = await AsyncFileHandler._document(path).load()
+        return dict(discover) if discover is not None else {}
 
     @staticmethod
     async def _create_default_discover() -> None:
@@ -87,5 +827,5 @@ class AsyncFileHandler:
             "NYT World": "https://rss.nytimes.com/services/xml/rss/nyt/World.xml",
         }
         path = AsyncFileHandler._discover_path()
-        async with aiofiles.open(path, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(default, indent=4, ensure_ascii=False))
+        payload = json.dumps(default, indent=4, ensure_ascii=False)
+        await _atomic_write(path, payload.encode("utf-8"))
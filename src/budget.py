@@ -0,0 +1,165 @@
+"""Memory budget for long-running sessions.
+
+A reader left open for days keeps refreshing, and every cache that holds
+entries would otherwise grow with each new article. :class:`MemoryBudget`
+bounds them two ways:
+
+* ``entries_per_feed`` caps how many entries of one feed (newest first) a
+  list, snapshot or timeline keeps in memory. Older entries stay in the
+  article store and are paged back in when scrolled to.
+* ``max_bytes`` bounds the parsed feeds the loader keeps and the entry
+  lists of recently viewed feeds, half each. Both live in a
+  :class:`ByteLRU`, which drops the least recently used past its share;
+  dropped parses are spilled to disk so they reload without parsing.
+
+``RSS_FEED_TUI_MEMORY_MB`` and ``RSS_FEED_TUI_FEED_ENTRIES`` override the
+defaults.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Iterable, Tuple, TypeVar
+
+from .models import Entry
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Fixed cost of a slotted Entry plus its float and bool fields.
+_ENTRY_OVERHEAD = 120 + 24
+
+
+def entry_size(entry: Entry) -> int:
+    """Approximate bytes held by ``entry``.
+
+    Counts the strings unique to it; author and feed names are interned
+    and shared by the whole feed.
+    """
+    getsizeof = sys.getsizeof
+    return (
+        _ENTRY_OVERHEAD
+        + getsizeof(entry.id)
+        + getsizeof(entry.title)
+        + getsizeof(entry.link)
+        + getsizeof(entry.summary)
+        + getsizeof(entry.published)
+    )
+
+
+def entries_size(entries: Iterable[Entry]) -> int:
+    return sum(map(entry_size, entries)) + 64
+
+
+def feed_size(feed: Dict) -> int:
+    """Approximate bytes held by a parse from :func:`parse_feed_bytes`."""
+    return entries_size(feed.get("entries", ())) + 1024
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class MemoryBudget:
+    """Limits on what a session keeps in memory."""
+
+    def __init__(
+        self, max_bytes: int = 64 * 2**20, entries_per_feed: int = 500
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.entries_per_feed = entries_per_feed
+
+    @classmethod
+    def from_env(cls) -> "MemoryBudget":
+        return cls(
+            max_bytes=_env_int("RSS_FEED_TUI_MEMORY_MB", 64) * 2**20,
+            entries_per_feed=_env_int("RSS_FEED_TUI_FEED_ENTRIES", 500),
+        )
+
+    @property
+    def share(self) -> int:
+        """Bytes for each of the two caches the budget covers."""
+        return self.max_bytes // 2
+
+
+class ByteLRU(Generic[K, V]):
+    """A mapping that drops its least recently used values past ``max_bytes``.
+
+    A value's size comes from ``sizeof`` when it is stored, so a value
+    changed in place must be stored again to be re-measured.
+    ``on_evict(key, value)`` is called for each value dropped to make room.
+    The newest value is always kept, however large.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        sizeof: Callable[[V], int],
+        on_evict: Callable[[K, V], None] | None = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.on_evict = on_evict
+        self.size = 0
+        self._items: OrderedDict[K, Tuple[V, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def get(self, key: K) -> V | None:
+        """The value for ``key``, now the most recently used, or None."""
+        item = self._items.get(key)
+        if item is None:
+            return None
+        self._items.move_to_end(key)
+        return item[0]
+
+    def peek(self, key: K) -> V | None:
+        """The value for ``key`` without counting it as used."""
+        item = self._items.get(key)
+        return None if item is None else item[0]
+
+    def put(self, key: K, value: V) -> None:
+        """Store ``value`` as the most recently used."""
+        self._store(key, value)
+        self._items.move_to_end(key)
+        self._evict()
+
+    def replace(self, key: K, value: V) -> None:
+        """Store ``value``, keeping ``key``'s place in the order if it has one."""
+        self._store(key, value)
+        self._evict()
+
+    def _store(self, key: K, value: V) -> None:
+        old = self._items.get(key)
+        if old is not None:
+            self.size -= old[1]
+        size = self.sizeof(value)
+        self._items[key] = (value, size)
+        self.size += size
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        item = self._items.pop(key, None)
+        if item is None:
+            return default
+        self.size -= item[1]
+        return item[0]
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.size = 0
+
+    def _evict(self) -> None:
+        while self.size > self.max_bytes and len(self._items) > 1:
+            key, (value, size) = self._items.popitem(last=False)
+            self.size -= size
+            if self.on_evict is not None:
+                self.on_evict(key, value)
@@ -0,0 +1,224 @@
+"""Headless feed fetching for cron jobs and services.
+
+Refreshes the saved feeds into the same article store and HTTP cache the TUI
+uses, writing one JSON object per line to stdout as each feed finishes::
+
+    {"type": "feed", "title": ..., "url": ..., "ok": true, "elapsed_ms": 412.5,
+     "entries": 20, "new": 3}
+
+followed by a ``"summary"`` line. The exit status is 1 if any feed failed.
+With ``--daemon`` it keeps polling on the adaptive schedule instead, until
+interrupted.
+
+``--import-opml FILE`` checks the new feeds in an OPML file the same way,
+one line per feed, and saves those that work; ``--export-opml FILE`` writes
+the feed list as OPML (``-`` for stdin/stdout). ``--metrics FILE`` writes
+per-feed and per-stage timings as JSON on exit. Nothing here imports Textual.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import signal
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from . import metrics
+from .async_feed import AsyncFeedLoader, AsyncFileHandler, HttpCache
+from .opml import build_opml, import_opml
+from .refresh import FeedRefresher, RefreshResult
+from .scheduler import PollScheduler
+from .shared_cache import SharedFetchCache
+from .store import AsyncArticleStore
+
+
+def _emit(record: Dict[str, Any]) -> None:
+    sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def _result_record(result: RefreshResult, with_entries: bool) -> Dict[str, Any]:
+    record: Dict[str, Any] = {
+        "type": "feed",
+        "title": result.title,
+        "url": result.url,
+        "ok": result.ok,
+        "elapsed_ms": round(result.elapsed * 1000, 1),
+    }
+    if result.ok:
+        record["entries"] = result.entry_count
+        record["new"] = len(result.new_entries)
+        if with_entries:
+            record["new_entries"] = [entry.to_dict() for entry in result.new_entries]
+    else:
+        record["error"] = result.error
+    return record
+
+
+def _select_feeds(feeds: Dict[str, str], names: List[str]) -> Dict[str, str]:
+    if not names:
+        return feeds
+    missing = [name for name in names if name not in feeds]
+    if missing:
+        raise ValueError(f"unknown feed(s): {', '.join(missing)}")
+    return {name: feeds[name] for name in names}
+
+
+async def _refresh_once(
+    refresher: FeedRefresher, feeds: Dict[str, str], args: argparse.Namespace
+) -> int:
+    start = time.perf_counter()
+    results = await refresher.refresh_all(
+        feeds,
+        progress=lambda done, total, result: _emit(
+            _result_record(result, args.entries)
+        ),
+    )
+    failed = [result for result in results if not result.ok]
+    _emit(
+        {
+            "type": "summary",
+            "feeds": len(results),
+            "failed": len(failed),
+            "new": sum(len(result.new_entries) for result in results),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+        }
+    )
+    return 1 if failed else 0
+
+
+async def _import(loader: AsyncFeedLoader, args: argparse.Namespace) -> int:
+    if args.import_opml == "-":
+        data = sys.stdin.buffer.read()
+    else:
+        with open(args.import_opml, "rb") as f:
+            data = f.read()
+    start = time.perf_counter()
+    report = await import_opml(
+        data,
+        loader,
+        progress=lambda done, total, result: _emit(_result_record(result, False)),
+        concurrency=args.concurrency,
+        per_host=args.per_host,
+        timeout=args.timeout,
+    )
+    await AsyncFileHandler.flush()
+    _emit(
+        {
+            "type": "summary",
+            "added": len(report.added),
+            "moved": report.moved,
+            "skipped": len(report.skipped),
+            "failed": len(report.failed),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+        }
+    )
+    return 1 if report.failed else 0
+
+
+def _export(feeds: Dict[str, str], path: str) -> int:
+    data = build_opml(feeds)
+    if path == "-":
+        sys.stdout.buffer.write(data)
+        sys.stdout.flush()
+    else:
+        with open(path, "wb") as f:
+            f.write(data)
+    return 0
+
+
+async def _daemon(
+    refresher: FeedRefresher, feeds: Dict[str, str], args: argparse.Namespace
+) -> int:
+    scheduler = PollScheduler(
+        refresher, on_result=lambda result: _emit(_result_record(result, args.entries))
+    )
+    scheduler.sync(feeds)
+    task = asyncio.ensure_future(scheduler.run())
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, task.cancel)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: Ctrl+C still raises KeyboardInterrupt.
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    return 0
+
+
+async def _run(args: argparse.Namespace) -> int:
+    feeds = _select_feeds(await AsyncFileHandler.load_feeds(), args.feeds)
+    if args.export_opml:
+        return _export(feeds, args.export_opml)
+    config_dir = AsyncFileHandler._config_dir()
+    loader = AsyncFeedLoader(
+        cache=HttpCache(config_dir / "http-cache"),
+        shared=SharedFetchCache.for_config_dir(config_dir),
+    )
+    store = AsyncArticleStore(config_dir / "articles.db")
+    refresher = FeedRefresher(
+        loader,
+        store,
+        concurrency=args.concurrency,
+        per_host=args.per_host,
+        timeout=args.timeout,
+    )
+    try:
+        if args.import_opml:
+            return await _import(loader, args)
+        if args.daemon:
+            return await _daemon(refresher, feeds, args)
+        return await _refresh_once(refresher, feeds, args)
+    finally:
+        await loader.close()
+        await store.close()
+        if args.metrics:
+            metrics.export_json(Path(args.metrics))
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="fetch.py",
+        description="Refresh saved feeds without the TUI, streaming NDJSON.",
+    )
+    parser.add_argument(
+        "feeds", nargs="*", metavar="FEED", help="feed titles (default: all)"
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--per-host", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=20.0, help="per feed")
+    parser.add_argument(
+        "--entries", action="store_true", help="include new entries in the output"
+    )
+    parser.add_argument(
+        "--metrics", metavar="FILE", help="write timings as JSON to FILE on exit"
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--daemon", action="store_true", help="keep polling until interrupted"
+    )
+    mode.add_argument(
+        "--import-opml", metavar="FILE", help="check and add the feeds in FILE"
+    )
+    mode.add_argument(
+        "--export-opml", metavar="FILE", help="write the feed list to FILE"
+    )
+    args = parser.parse_args(argv)
+    if args.metrics:
+        metrics.enable()
+    try:
+        return asyncio.run(_run(args))
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
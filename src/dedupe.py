@@ -0,0 +1,168 @@
+"""Near-duplicate detection for stories syndicated across feeds.
+
+Two checks run on every new article:
+
+* its link (and a URL-shaped guid) is canonicalized: scheme, ``www.``,
+  default ports, fragments, tracking parameters and trailing slashes are
+  dropped. Aggregators that re-post a link match exactly.
+* a MinHash signature of the words in its title and text catches the same
+  wire story published with a new headline or light edits. Articles whose
+  estimated word overlap (Jaccard similarity) reaches ``THRESHOLD`` count as
+  one story.
+
+Signatures use one-permutation hashing: each word is hashed once and lands
+in one of ``SLOTS`` slots, which keeps the smallest hash it sees. That is
+one pass over the words instead of one per hash function. Candidates are
+found through locality-sensitive hashing: signatures are cut into ``BANDS``
+bands, and only articles that agree on a whole band are compared, instead
+of every stored article. The store keeps the band and link keys of first
+copies in indexed tables.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from array import array
+from typing import Dict, List
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+SLOTS = 32
+BANDS = 8
+THRESHOLD = 0.6
+# Fewer distinct words than this say too little to compare by wording alone.
+MIN_WORDS = 12
+# Enough of a story to recognise it; long bodies only add cost.
+TEXT_CHARS = 2000
+
+_ROWS = SLOTS // BANDS
+_EMPTY = 0xFFFFFFFF
+_TAG_RE = re.compile(r"<[^>]*>")
+_WORD_RE = re.compile(r"\w{3,}", re.UNICODE)
+# Words every story shares would make unrelated stories look alike.
+_STOP_WORDS = frozenset(
+    "about after all also and any are been but can could did for from had has "
+    "have her his how its into more new not now one our out over said she than "
+    "that the their them then there these they this was were what when which "
+    "who will with would you your".split()
+)
+_TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "mc_cid",
+    "mc_eid",
+    "ref",
+    "ref_src",
+    "cmpid",
+    "smid",
+}
+_DEFAULT_PORTS = (":80", ":443")
+_HASH_CACHE_SIZE = 200_000
+_hash_cache: Dict[str, int] = {}
+
+
+def canonical_url(url: str) -> str:
+    """``url`` reduced to what identifies the page, or "" if it is not a URL."""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return ""
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
+        return ""
+    host = parts.netloc.lower().rpartition("@")[2]
+    for port in _DEFAULT_PORTS:
+        if host.endswith(port):
+            host = host[: -len(port)]
+    if host.startswith("www."):
+        host = host[4:]
+    query = parts.query
+    if query:
+        query = urlencode(
+            sorted(
+                (key, value)
+                for key, value in parse_qsl(query, keep_blank_values=True)
+                if not key.lower().startswith("utm_")
+                and key.lower() not in _TRACKING_PARAMS
+            )
+        )
+    return urlunsplit(("https", host, parts.path.rstrip("/"), query, ""))
+
+
+def link_keys(guid: str, link: str) -> List[str]:
+    """Canonical URLs an article is known by: its link and a URL-shaped guid."""
+    keys = []
+    for url in (link, guid) if guid != link else (link,):
+        key = canonical_url(url)
+        if key and key not in keys:
+            keys.append(key)
+    return keys
+
+
+def _word_hash(word: str) -> int:
+    # blake2b rather than hash(): signatures are stored, so they must not
+    # change with PYTHONHASHSEED. Words repeat a lot, hence the cache.
+    value = _hash_cache.get(word)
+    if value is None:
+        digest = hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        if len(_hash_cache) >= _HASH_CACHE_SIZE:
+            _hash_cache.clear()
+        _hash_cache[word] = value
+    return value
+
+
+def signature(title: str, text: str) -> bytes | None:
+    """MinHash signature of a story, or None if it is too short to judge.
+
+    ``text`` may be HTML. The signature is ``SLOTS`` 32-bit values, packed
+    as bytes for storage.
+    """
+    text = text[:TEXT_CHARS]
+    if "<" in text:
+        text = _TAG_RE.sub(" ", text)
+    words = set(_WORD_RE.findall(f"{title} {text}".lower()))
+    words -= _STOP_WORDS
+    if len(words) < MIN_WORDS:
+        return None
+    values = list(map(_hash_cache.get, words))
+    if None in values:
+        values = [_word_hash(word) for word in words]
+    # Descending, so each slot ends up with its smallest value.
+    minimums = {value % SLOTS: value >> 32 for value in sorted(values, reverse=True)}
+    slots = [minimums.get(slot, _EMPTY) for slot in range(SLOTS)]
+    return array("I", slots).tobytes()
+
+
+def similarity(first: bytes, second: bytes) -> float:
+    """Estimated Jaccard similarity of the stories behind two signatures.
+
+    Slots neither story has a word in say nothing about their overlap, so
+    they are left out; counting them as matches would make any two short
+    stories look half alike.
+    """
+    matches = compared = 0
+    for x, y in zip(array("I", first), array("I", second)):
+        if x == y == _EMPTY:
+            continue
+        compared += 1
+        matches += x == y
+    return matches / compared if compared else 0.0
+
+
+def band_keys(sig: bytes) -> List[int]:
+    """One signed 64-bit key per band of ``sig``, for an SQLite index.
+
+    Two stories at the threshold agree on at least one whole band with
+    high probability, and unrelated stories almost never do. Bands with
+    every slot empty are skipped: all short stories would share them.
+    """
+    size = len(sig) // BANDS
+    empty = _EMPTY.to_bytes(4, "little") * (size // 4)
+    keys = []
+    for band in range(BANDS):
+        rows = sig[band * size : (band + 1) * size]
+        if rows == empty:
+            continue
+        digest = hashlib.blake2b(bytes([band]) + rows, digest_size=8).digest()
+        keys.append(int.from_bytes(digest, "little", signed=True))
+    return keys
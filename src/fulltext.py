@@ -0,0 +1,508 @@
+"""Full article text: fetched from each entry's link, extracted and kept on disk.
+
+Feeds often carry only a teaser. :class:`FullTextFetcher` downloads the
+linked page over the feed loader's session, keeps the readable main content
+(see :func:`extract_article`) and stores it in an :class:`ArticleCache`, so
+an article fetched once opens instantly and can be read offline.
+
+:meth:`FullTextFetcher.prefetch` warms the cache in the background for the
+articles the reader is likely to open next, at most ``concurrency`` pages
+at a time. Each call replaces the links still waiting, so moving through a
+list never builds up a backlog of pages nobody is looking at any more.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import html
+import json
+import os
+import re
+import time
+import zlib
+from collections import OrderedDict, deque
+from functools import partial
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, Set, Tuple
+
+from . import metrics
+from .async_feed import AsyncFeedLoader, _atomic_write
+
+# Paragraphs shorter than this are captions, bylines and buttons.
+MIN_PARAGRAPH = 25
+
+# Elements that never hold article text; their contents are dropped.
+_SKIP_TAGS = frozenset(
+    "aside button footer form header iframe nav noscript script select style "
+    "svg template textarea".split()
+)
+_VOID_TAGS = frozenset(
+    "area base br col embed hr img input link meta param source track wbr".split()
+)
+# Kept in the extracted HTML; anything else is replaced by its contents.
+_KEEP_TAGS = frozenset(
+    "blockquote br code dd div dl dt em figcaption figure h1 h2 h3 h4 h5 h6 hr "
+    "i b li ol p pre strong table td th tr ul".split()
+)
+_BLOCK_TAGS = frozenset(
+    "article blockquote div dl figure h1 h2 h3 h4 h5 h6 main ol p pre section "
+    "table ul".split()
+)
+_SIBLING_TAGS = frozenset(("li", "dt", "dd", "tr", "td", "th"))
+_LIST_TAGS = frozenset(("ul", "ol", "dl", "table"))
+# Elements that are scored as a paragraph of their parent.
+_PARAGRAPH_TAGS = frozenset(("p", "pre", "td", "blockquote"))
+_TAG_WEIGHT = {"article": 10, "main": 10, "div": 5, "pre": 3, "td": 3, "blockquote": 3}
+_POSITIVE_RE = re.compile(
+    r"article|body|content|entry|main|page|post|story|text", re.IGNORECASE
+)
+_NEGATIVE_RE = re.compile(
+    r"ad-|banner|combx|comment|contact|footer|footnote|masthead|media|menu|meta|"
+    r"nav|outbrain|promo|related|share|shoutbox|sidebar|social|sponsor|subscribe|"
+    r"taboola|tags|widget",
+    re.IGNORECASE,
+)
+_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+_SPACE_RE = re.compile(r"\s+")
+
+
+class _Node:
+    __slots__ = ("tag", "attrs", "parent", "children", "score", "text_len", "link_len")
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: "_Node | None"):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children: List["_Node | str"] = []
+        self.score = 0.0
+        self.text_len = 0
+        self.link_len = 0
+
+    @property
+    def link_density(self) -> float:
+        return self.link_len / self.text_len if self.text_len else 0.0
+
+    def class_weight(self) -> int:
+        names = f"{self.attrs.get('class', '')} {self.attrs.get('id', '')}"
+        weight = 0
+        if _NEGATIVE_RE.search(names):
+            weight -= 25
+        if _POSITIVE_RE.search(names):
+            weight += 25
+        return weight
+
+
+class _TreeBuilder(HTMLParser):
+    """Builds a forgiving element tree of the parts of a page that can hold text."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.root = _Node("#root", {}, None)
+        self.title = ""
+        self._stack = [self.root]
+        self._skip: str | None = None
+        self._skip_depth = 0
+        self._in_title = False
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, str | None]]) -> None:
+        if self._skip is not None:
+            if tag == self._skip:
+                self._skip_depth += 1
+            return
+        attributes = {name: value or "" for name, value in attrs}
+        if (
+            tag in _SKIP_TAGS
+            or "hidden" in attributes
+            or attributes.get("aria-hidden") == "true"
+        ):
+            if tag not in _VOID_TAGS:
+                self._skip, self._skip_depth = tag, 1
+            return
+        if tag == "title":
+            self._in_title = True
+            return
+        if tag in _SIBLING_TAGS:
+            # A new item closes the previous one: <li>a<li>b, <td>1<td>2.
+            for depth in range(len(self._stack) - 1, 0, -1):
+                open_tag = self._stack[depth].tag
+                if open_tag == tag:
+                    del self._stack[depth:]
+                    break
+                if open_tag in _LIST_TAGS:
+                    break
+        top = self._stack[-1]
+        if top.tag == "p" and (tag in _BLOCK_TAGS or tag == "li"):
+            # <p> closes itself when a block starts, as in a browser.
+            self._stack.pop()
+            top = self._stack[-1]
+        node = _Node(tag, attributes, top)
+        top.children.append(node)
+        if tag not in _VOID_TAGS:
+            self._stack.append(node)
+
+    def handle_startendtag(
+        self, tag: str, attrs: List[Tuple[str, str | None]]
+    ) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS and self._skip is None:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._skip is not None:
+            if tag == self._skip:
+                self._skip_depth -= 1
+                if not self._skip_depth:
+                    self._skip = None
+            return
+        if tag == "title":
+            self._in_title = False
+            return
+        # Close up to the matching element; stray end tags are ignored.
+        for depth in range(len(self._stack) - 1, 0, -1):
+            if self._stack[depth].tag == tag:
+                del self._stack[depth:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        if self._skip is not None:
+            return
+        if self._in_title:
+            self.title += data
+        else:
+            self._stack[-1].children.append(data)
+
+
+def _measure(node: _Node) -> None:
+    """Fill in text and link lengths, children first."""
+    for child in node.children:
+        if isinstance(child, str):
+            node.text_len += len(_SPACE_RE.sub(" ", child).strip())
+        else:
+            _measure(child)
+            node.text_len += child.text_len
+            node.link_len += child.text_len if child.tag == "a" else child.link_len
+
+
+def _score(root: _Node) -> List[_Node]:
+    """Credit each paragraph's text to its parent and grandparent.
+
+    Returns the elements that were credited, i.e. the candidates for the
+    article's container.
+    """
+    candidates: Dict[int, _Node] = {}
+    pending = [root]
+    while pending:
+        node = pending.pop()
+        for child in node.children:
+            if isinstance(child, _Node):
+                pending.append(child)
+        if node.tag not in _PARAGRAPH_TAGS or node.text_len < MIN_PARAGRAPH:
+            continue
+        # Commas mark prose rather than menus and lists of links.
+        text = "".join(_text(node))
+        points = 1 + text.count(",") + min(node.text_len // 100, 3)
+        for ancestor, share in ((node.parent, 1.0), (_parent(node.parent), 0.5)):
+            if ancestor is None or ancestor is root:
+                break
+            if id(ancestor) not in candidates:
+                candidates[id(ancestor)] = ancestor
+                ancestor.score = _TAG_WEIGHT.get(ancestor.tag, 0)
+                ancestor.score += ancestor.class_weight()
+            ancestor.score += points * share
+    return list(candidates.values())
+
+
+def _parent(node: _Node | None) -> _Node | None:
+    return node.parent if node is not None else None
+
+
+def _text(node: _Node) -> Iterable[str]:
+    for child in node.children:
+        if isinstance(child, str):
+            yield child
+        else:
+            yield from _text(child)
+
+
+def _continues(sibling: _Node, threshold: float) -> bool:
+    if sibling.score * (1 - sibling.link_density) >= threshold:
+        return True
+    # A loose paragraph of prose next to the article's container.
+    return (
+        sibling.tag == "p" and sibling.text_len > 80 and sibling.link_density < 0.25
+    )
+
+
+def _render(node: _Node, out: List[str]) -> None:
+    for child in node.children:
+        if isinstance(child, str):
+            out.append(html.escape(child, quote=False))
+            continue
+        if child.tag in ("div", "section", "ul", "ol", "table") and (
+            child.class_weight() < 0 or child.link_density > 0.5
+        ):
+            # Link lists, share bars and "related" boxes inside the article.
+            continue
+        keep = child.tag in _KEEP_TAGS
+        if keep:
+            out.append(f"<{child.tag}>")
+        _render(child, out)
+        if keep and child.tag not in _VOID_TAGS:
+            out.append(f"</{child.tag}>")
+
+
+def extract_article(page: str) -> Tuple[str, str]:
+    """The title and main content (as simplified HTML) of a web page.
+
+    A small take on Readability's heuristics: every paragraph scores its
+    parent and grandparent by length and commas, containers gain or lose
+    points for class names like "content" or "sidebar", and link-heavy
+    containers are discounted. The best container is kept together with
+    siblings that scored nearly as well. Raises ``ValueError`` if the page
+    has no article text.
+    """
+    builder = _TreeBuilder()
+    builder.feed(page)
+    builder.close()
+    root = builder.root
+    try:
+        _measure(root)
+    except RecursionError:
+        raise ValueError("Page is too deeply nested to read") from None
+    candidates = _score(root)
+    if not candidates:
+        raise ValueError("No article text found on the page")
+    best = max(candidates, key=lambda node: node.score * (1 - node.link_density))
+    top_score = best.score * (1 - best.link_density)
+
+    # A story split over sibling containers (e.g. around an ad slot).
+    parts = [best]
+    if best.parent is not None and best.parent is not root:
+        threshold = max(10.0, top_score * 0.2)
+        parts = [
+            sibling
+            for sibling in best.parent.children
+            if sibling is best
+            or isinstance(sibling, _Node)
+            and _continues(sibling, threshold)
+        ]
+    out: List[str] = []
+    for part in parts:
+        wrapper = _Node("#part", {}, None)
+        wrapper.children = [part]
+        _render(wrapper, out)
+    return _SPACE_RE.sub(" ", builder.title).strip(), "".join(out)
+
+
+def _decode(body: bytes, content_type: str) -> str:
+    """Page text in the charset from its headers or <meta> tag, else UTF-8."""
+    match = re.search(r"charset=([\w-]+)", content_type, re.IGNORECASE)
+    charset = match.group(1) if match else None
+    if charset is None:
+        meta = _CHARSET_RE.search(body[:4096])
+        charset = meta.group(1).decode("ascii") if meta else "utf-8"
+    try:
+        return body.decode(charset, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _extract(body: bytes, content_type: str) -> str:
+    return extract_article(_decode(body, content_type))[1]
+
+
+class ArticleCache:
+    """Extracted articles on disk, least recently read dropped past ``max_bytes``.
+
+    Each link maps to ``<sha1>.article`` (zlib-compressed JSON) inside
+    ``directory``. Recency is the file's mtime, touched on every read, so
+    the order survives restarts; sizes are indexed from one directory scan
+    on first use. Several processes may share the directory: one evicting
+    a file another has indexed just turns that into a miss.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = 64 * 2**20) -> None:
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._index: OrderedDict[str, int] | None = None
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _key(link: str) -> str:
+        return hashlib.sha1(link.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.article"
+
+    def _scan(self) -> OrderedDict[str, int]:
+        files = []
+        for item in os.scandir(self.directory):
+            if item.name.endswith(".article"):
+                st = item.stat()
+                files.append((st.st_mtime, item.name[: -len(".article")], st.st_size))
+        files.sort()
+        return OrderedDict((key, size) for _, key, size in files)
+
+    async def _load_index(self) -> OrderedDict[str, int]:
+        if self._index is None:
+            async with self._lock:
+                if self._index is None:
+                    loop = asyncio.get_running_loop()
+                    index = await loop.run_in_executor(None, self._scan)
+                    self.size = sum(index.values())
+                    self._index = index
+        return self._index
+
+    async def has(self, link: str) -> bool:
+        return self._key(link) in await self._load_index()
+
+    async def get(self, link: str) -> str | None:
+        """The stored article for ``link``, or None."""
+        import aiofiles
+
+        index = await self._load_index()
+        key = self._key(link)
+        if key not in index:
+            return None
+        path = self._path(key)
+        try:
+            async with aiofiles.open(path, "rb") as f:
+                record = json.loads(zlib.decompress(await f.read()))
+            os.utime(path)
+        except (OSError, ValueError, zlib.error):
+            self._forget(key)
+            return None
+        if record.get("url") != link:
+            return None
+        index.move_to_end(key)
+        return record["content"]
+
+    async def put(self, link: str, content: str) -> None:
+        index = await self._load_index()
+        record = {"url": link, "fetched_at": time.time(), "content": content}
+        data = zlib.compress(json.dumps(record).encode("utf-8"))
+        key = self._key(link)
+        await _atomic_write(self._path(key), data)
+        self._forget(key)
+        index[key] = len(data)
+        self.size += len(data)
+        self._evict()
+
+    def _forget(self, key: str) -> None:
+        if self._index is not None and key in self._index:
+            self.size -= self._index.pop(key)
+
+    def _evict(self) -> None:
+        index = self._index
+        while index and self.size > self.max_bytes and len(index) > 1:
+            key, size = index.popitem(last=False)
+            self.size -= size
+            self._path(key).unlink(missing_ok=True)
+            metrics.count("fulltext_evicted")
+
+
+class FullTextFetcher:
+    """Full text of linked articles, from the disk cache or the web.
+
+    Concurrent requests for one link share a download. Prefetching runs on
+    at most ``concurrency`` background tasks; a link whose prefetch failed
+    is not prefetched again for ``retry_after`` seconds, though opening it
+    still tries.
+    """
+
+    def __init__(
+        self,
+        loader: AsyncFeedLoader,
+        cache: ArticleCache,
+        concurrency: int = 3,
+        retry_after: float = 600.0,
+    ) -> None:
+        self.loader = loader
+        self.cache = cache
+        self.concurrency = concurrency
+        self.retry_after = retry_after
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._queue: Deque[str] = deque()
+        self._workers: Set[asyncio.Task] = set()
+        # Link -> when its last prefetch failed.
+        self._failed: Dict[str, float] = {}
+
+    async def get(self, link: str) -> str:
+        """The article at ``link`` as simplified HTML.
+
+        Raises ``FeedHTTPError`` for error responses and ``ValueError`` for
+        pages without article text.
+        """
+        content = await self.cache.get(link)
+        if content is not None:
+            metrics.count("fulltext_cache_hit")
+            return content
+        task = self._inflight.get(link)
+        if task is None:
+            task = self._inflight[link] = asyncio.ensure_future(self._download(link))
+            task.add_done_callback(partial(self._forget, link))
+        # Shielded: an article closed before it arrived is still worth keeping.
+        return await asyncio.shield(task)
+
+    def _forget(self, link: str, task: asyncio.Task) -> None:
+        self._inflight.pop(link, None)
+        if not task.cancelled():
+            # Mark the error retrieved even if every caller has gone away.
+            task.exception()
+
+    async def _download(self, link: str) -> str:
+        metrics.count("fulltext_miss")
+        with metrics.span("fulltext_fetch"):
+            content_type, body = await self.loader.fetch_page(link)
+        if "html" not in content_type.lower():
+            raise ValueError(f"Not a web page ({content_type or 'no content type'})")
+        with metrics.span("extract"):
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(None, _extract, body, content_type)
+        await self.cache.put(link, content)
+        return content
+
+    def prefetch(self, links: Iterable[str]) -> None:
+        """Fetch ``links`` in the background, in order, instead of those pending."""
+        now = time.time()
+        self._failed = {
+            link: failed_at
+            for link, failed_at in self._failed.items()
+            if now - failed_at <= self.retry_after
+        }
+        self._queue = deque(
+            link
+            for link in dict.fromkeys(links)
+            if link and now - self._failed.get(link, 0.0) > self.retry_after
+        )
+        while self._queue and len(self._workers) < self.concurrency:
+            worker = asyncio.ensure_future(self._prefetch_worker())
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+
+    async def _prefetch_worker(self) -> None:
+        while self._queue:
+            link = self._queue.popleft()
+            if await self.cache.has(link):
+                continue
+            try:
+                await self.get(link)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._failed[link] = time.time()
+                metrics.count("fulltext_failed")
+            else:
+                metrics.count("fulltext_prefetched")
+
+    async def close(self) -> None:
+        """Stop prefetching and drop downloads in progress."""
+        self._queue.clear()
+        tasks = [*self._workers, *self._inflight.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,183 @@
+"""Timing spans and counters for the hot paths, aggregated per feed.
+
+Collection is off unless ``RSS_FEED_TUI_METRICS`` is set or :func:`enable`
+is called. While it is off, :func:`span` hands out one shared do-nothing
+context manager and :func:`record` and :func:`count` return at once, so
+instrumented code pays a function call and allocates nothing.
+
+Timings are kept per (feed URL, stage); work not tied to one feed, such as
+rendering an article, is filed under the feed ``""``. Each series keeps a
+count, a total and its last ``SAMPLES`` durations, from which p50/p95 are
+computed only when a snapshot is taken.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Deque, Dict, List
+
+SAMPLES = 512
+
+# Counters whose ratio is the cache hit rate; see _feed_summary().
+CACHE_COUNTERS = ("cache_fresh", "cache_revalidated", "cache_miss")
+
+_NULL_SPAN = nullcontext()
+_lock = threading.Lock()
+_enabled = bool(os.environ.get("RSS_FEED_TUI_METRICS"))
+_since: float | None = time.time() if _enabled else None
+# Feed URL -> stage -> timings, and feed URL -> counter -> value.
+_stages: Dict[str, Dict[str, "Series"]] = {}
+_counters: Dict[str, Dict[str, int]] = {}
+
+
+class Series:
+    """Durations recorded for one stage."""
+
+    __slots__ = ("count", "total", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.samples: Deque[float] = deque(maxlen=SAMPLES)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.samples.append(seconds)
+
+    def summary(self) -> Dict[str, float]:
+        return _summary(self.count, self.total, list(self.samples))
+
+
+class _Span:
+    __slots__ = ("stage", "feed", "start")
+
+    def __init__(self, stage: str, feed: str) -> None:
+        self.stage = stage
+        self.feed = feed
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        record(self.stage, time.perf_counter() - self.start, self.feed)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable() -> None:
+    global _enabled, _since
+    if not _enabled:
+        _enabled = True
+        _since = time.time()
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def reset() -> None:
+    """Drop everything collected so far."""
+    global _since
+    with _lock:
+        _stages.clear()
+        _counters.clear()
+        _since = time.time() if _enabled else None
+
+
+def span(stage: str, feed: str = "") -> ContextManager[Any]:
+    """Time the ``with`` block as ``stage`` of ``feed``."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(stage, feed)
+
+
+def record(stage: str, seconds: float, feed: str = "") -> None:
+    """Add a duration measured by the caller."""
+    if not _enabled:
+        return
+    with _lock:
+        stages = _stages.setdefault(feed, {})
+        series = stages.get(stage)
+        if series is None:
+            series = stages[stage] = Series()
+        series.add(seconds)
+
+
+def count(name: str, n: int = 1, feed: str = "") -> None:
+    if not _enabled:
+        return
+    with _lock:
+        counters = _counters.setdefault(feed, {})
+        counters[name] = counters.get(name, 0) + n
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _summary(count: int, total: float, samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples) or [0.0]
+    return {
+        "count": count,
+        "total_ms": round(total * 1000, 2),
+        "p50_ms": round(_percentile(ordered, 0.50) * 1000, 2),
+        "p95_ms": round(_percentile(ordered, 0.95) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+def _feed_summary(
+    stages: Dict[str, Series], counters: Dict[str, int]
+) -> Dict[str, Any]:
+    feed: Dict[str, Any] = {
+        "stages": {stage: series.summary() for stage, series in stages.items()},
+        "counters": dict(counters),
+    }
+    lookups = sum(counters.get(name, 0) for name in CACHE_COUNTERS)
+    if lookups:
+        hits = counters.get("cache_fresh", 0) + counters.get("cache_revalidated", 0)
+        feed["cache_hit_rate"] = round(hits / lookups, 3)
+        feed["entries_per_fetch"] = round(counters.get("entries", 0) / lookups, 1)
+    return feed
+
+
+def snapshot() -> Dict[str, Any]:
+    """Everything collected so far, as JSON-ready dicts.
+
+    ``stages`` sums each stage over all feeds; ``feeds`` breaks it down by
+    feed URL, with counters, the cache hit rate and entries per fetch.
+    """
+    with _lock:
+        totals: Dict[str, List[Any]] = {}
+        for stages in _stages.values():
+            for stage, series in stages.items():
+                total = totals.setdefault(stage, [0, 0.0, []])
+                total[0] += series.count
+                total[1] += series.total
+                total[2].extend(series.samples)
+        feeds = {
+            url: _feed_summary(_stages.get(url, {}), _counters.get(url, {}))
+            for url in sorted(set(_stages) | set(_counters))
+        }
+    return {
+        "enabled": _enabled,
+        "since": _since,
+        "stages": {stage: _summary(*total) for stage, total in totals.items()},
+        "feeds": feeds,
+    }
+
+
+def export_json(path: Path) -> None:
+    """Write :func:`snapshot` to ``path``."""
+    path.write_text(json.dumps(snapshot(), indent=2), encoding="utf-8")
@@ -0,0 +1,81 @@
+"""Compact in-memory representation of feed entries."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict, Tuple
+
+
+class Entry:
+    """One article, holding only the fields the UI shows.
+
+    Slotted rather than a dict, so an entry costs a fixed 120 bytes plus its
+    strings. Author, feed URL and feed title repeat across a feed and are
+    interned, so every entry of a feed shares one copy of each.
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "link",
+        "summary",
+        "author",
+        "published",
+        "published_ts",
+        "read",
+        "feed_url",
+        "feed_title",
+        "duplicate",
+    )
+
+    # Fields a re-fetch may change; read state and origin are kept as they are.
+    CONTENT_FIELDS = ("title", "link", "summary", "author", "published", "published_ts")
+
+    def __init__(
+        self,
+        id: str,
+        title: str = "Untitled",
+        link: str = "",
+        summary: str = "",
+        author: str = "",
+        published: str = "",
+        published_ts: float | None = None,
+        read: bool = False,
+        feed_url: str = "",
+        feed_title: str = "",
+        duplicate: bool = False,
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.link = link
+        self.summary = summary
+        self.author = sys.intern(author)
+        self.published = published
+        self.published_ts = published_ts
+        self.read = read
+        self.feed_url = sys.intern(feed_url)
+        self.feed_title = sys.intern(feed_title)
+        # Another feed carried this story first (see dedupe.py).
+        self.duplicate = duplicate
+
+    def __reduce__(self) -> Tuple[type, Tuple[Any, ...]]:
+        # Positional state pickles smaller than the default slot dict, which
+        # matters when entries come back from a parse worker process.
+        return Entry, tuple(getattr(self, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"Entry(id={self.id!r}, title={self.title!r})"
+
+    def copy(self, **changes: Any) -> "Entry":
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(changes)
+        return Entry(**values)
+
+    def update_content(self, other: "Entry") -> None:
+        """Take ``other``'s content fields, e.g. after the feed edited a post."""
+        for name in self.CONTENT_FIELDS:
+            setattr(self, name, getattr(other, name))
+        self.author = sys.intern(self.author)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
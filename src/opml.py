@@ -0,0 +1,158 @@
+"""OPML import and export of the feed list.
+
+Imports are checked before anything is saved: every new URL is fetched
+through :class:`FeedRefresher`, so validation runs with the same global
+and per-host concurrency caps and per-feed timeout as a refresh. Feeds that
+moved permanently are saved under their new address, feeds that fail are
+reported and left out, and the feed list is written once at the end.
+"""
+
+from __future__ import annotations
+
+from email.utils import formatdate
+from typing import Callable, Container, Dict, List, Tuple
+from xml.etree import ElementTree
+
+from .async_feed import AsyncFeedLoader, AsyncFileHandler
+from .dedupe import canonical_url
+from .refresh import FeedRefresher, RefreshResult
+
+# (title, url) of one subscription in an OPML file.
+Outline = Tuple[str, str]
+
+
+class ImportReport:
+    """Outcome of an OPML import."""
+
+    def __init__(self) -> None:
+        # Title -> URL of the feeds that were saved.
+        self.added: Dict[str, str] = {}
+        # Feeds that failed validation; each carries its error.
+        self.failed: List[RefreshResult] = []
+        # Outlines already subscribed, or listed twice in the file.
+        self.skipped: List[Outline] = []
+        # Original URL -> the address a feed permanently moved to.
+        self.moved: Dict[str, str] = {}
+
+    def summary(self) -> str:
+        parts = [f"Imported {len(self.added)} feeds"]
+        if self.moved:
+            parts.append(f"{len(self.moved)} moved")
+        if self.skipped:
+            parts.append(f"{len(self.skipped)} already subscribed")
+        if self.failed:
+            parts.append(f"{len(self.failed)} failed")
+        return ", ".join(parts)
+
+
+def parse_opml(data: bytes) -> List[Outline]:
+    """The feeds listed in an OPML document, in order.
+
+    Folders are flattened: any ``<outline>`` with an ``xmlUrl`` is a feed,
+    however deeply it is nested.
+    """
+    try:
+        root = ElementTree.fromstring(data)
+    except ElementTree.ParseError as exc:
+        raise ValueError(f"Not a valid OPML file: {exc}") from None
+    if root.tag != "opml":
+        raise ValueError("Not an OPML file")
+    outlines = []
+    for outline in root.iter("outline"):
+        url = (outline.get("xmlUrl") or outline.get("xmlurl") or "").strip()
+        if url:
+            title = outline.get("title") or outline.get("text") or ""
+            outlines.append((title.strip(), url))
+    return outlines
+
+
+def build_opml(feeds: Dict[str, str], title: str = "rss-feed-tui feeds") -> bytes:
+    """An OPML 2.0 document listing ``feeds`` (title -> URL)."""
+    root = ElementTree.Element("opml", version="2.0")
+    head = ElementTree.SubElement(root, "head")
+    ElementTree.SubElement(head, "title").text = title
+    ElementTree.SubElement(head, "dateCreated").text = formatdate(usegmt=True)
+    body = ElementTree.SubElement(root, "body")
+    for name, url in feeds.items():
+        ElementTree.SubElement(
+            body, "outline", type="rss", text=name, title=name, xmlUrl=url
+        )
+    # One element per line, so exports diff and merge cleanly.
+    root.text = head.text = body.text = "\n"
+    for element in root.iter():
+        element.tail = "\n"
+    return ElementTree.tostring(root, encoding="utf-8", xml_declaration=True)
+
+
+def _unique_title(title: str, taken: Container[str]) -> str:
+    name, n = title, 1
+    while name in taken:
+        n += 1
+        name = f"{title} ({n})"
+    return name
+
+
+async def import_opml(
+    data: bytes,
+    loader: AsyncFeedLoader,
+    progress: Callable[[int, int, RefreshResult], None] | None = None,
+    concurrency: int = 32,
+    per_host: int = 4,
+    timeout: float = 20.0,
+) -> ImportReport:
+    """Validate the new feeds in an OPML document and save those that work.
+
+    ``progress(done, total, result)`` is called as each feed is checked.
+    Raises ``ValueError`` if ``data`` is not OPML.
+    """
+    outlines = parse_opml(data)
+    feeds = await AsyncFileHandler.load_feeds()
+    known = {canonical_url(url) or url for url in feeds.values()}
+    report = ImportReport()
+
+    # Title -> URL, titled uniquely so no outline overwrites another.
+    pending: Dict[str, str] = {}
+    taken = set(feeds)
+    for title, url in outlines:
+        key = canonical_url(url) or url
+        if key in known:
+            report.skipped.append((title, url))
+            continue
+        known.add(key)
+        title = _unique_title(title or url, taken)
+        taken.add(title)
+        pending[title] = url
+
+    refresher = FeedRefresher(
+        loader, None, concurrency=concurrency, per_host=per_host, timeout=timeout
+    )
+    results = await refresher.refresh_all(pending, progress)
+
+    # Saved in file order, not in the order the checks finished.
+    order = {title: n for n, title in enumerate(pending)}
+    for result in sorted(results, key=lambda result: order[result.title]):
+        if result.ok and not result.entry_count and not result.feed_info["title"]:
+            # Parsed, but nothing in it looks like a feed (e.g. a web page).
+            result.error = "No feed found at this address"
+        if not result.ok:
+            report.failed.append(result)
+            continue
+        url = result.feed_info.get("url") or result.url
+        if url != result.url:
+            key = canonical_url(url) or url
+            # Two outlines may lead to one feed, or to one already saved.
+            if key != (canonical_url(result.url) or result.url) and key in known:
+                report.skipped.append((result.title, result.url))
+                continue
+            known.add(key)
+            report.moved[result.url] = url
+        title = result.title
+        if title == result.url and result.feed_info.get("title"):
+            title = _unique_title(result.feed_info["title"], taken)
+            taken.add(title)
+        feeds[title] = url
+        report.added[title] = url
+
+    if report.added:
+        await AsyncFileHandler.save_feeds(feeds)
+    return report
@@ -0,0 +1,217 @@
+"""Feed parsing that can run in worker threads or processes.
+
+Workers receive the raw response bytes and return a compact structure of
+plain dicts and slotted :class:`Entry` objects, which is cheap to pickle back
+across a process boundary, unlike feedparser's ``FeedParserDict`` tree.
+"""
+
+from __future__ import annotations
+
+import calendar
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List
+from xml.etree import ElementTree
+
+from .models import Entry
+
+_SKIP_HOURS_RE = re.compile(rb"<skipHours>(.*?)</skipHours>", re.S | re.I)
+_SKIP_DAYS_RE = re.compile(rb"<skipDays>(.*?)</skipDays>", re.S | re.I)
+_HOUR_RE = re.compile(rb"<hour>\s*(\d{1,2})\s*</hour>", re.I)
+_DAY_RE = re.compile(rb"<day>\s*([A-Za-z]+)\s*</day>", re.I)
+_SY_PERIODS = {
+    "hourly": 3600,
+    "daily": 86400,
+    "weekly": 7 * 86400,
+    "monthly": 30 * 86400,
+    "yearly": 365 * 86400,
+}
+
+
+def _entry_content(entry: Any) -> str:
+    """Pick the article body the same way the article view used to."""
+    for key in ("summary", "description", "content"):
+        if raw := entry.get(key):
+            if isinstance(raw, list) and raw:
+                return raw[0].get("value", "")
+            return str(raw)
+    return ""
+
+
+def _timestamp(entry: Any) -> float | None:
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if not parsed:
+        return None
+    try:
+        return float(calendar.timegm(parsed))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _skip_hours(body: bytes) -> List[int]:
+    # feedparser keeps only the last <hour>, so read the block directly.
+    if body.find(b"skipHours") < 0:
+        return []
+    match = _SKIP_HOURS_RE.search(body)
+    if not match:
+        return []
+    return sorted({int(h) % 24 for h in _HOUR_RE.findall(match.group(1))})
+
+
+def _skip_days(body: bytes) -> List[str]:
+    if body.find(b"skipDays") < 0:
+        return []
+    match = _SKIP_DAYS_RE.search(body)
+    if not match:
+        return []
+    days = _DAY_RE.findall(match.group(1))
+    return sorted({day.decode("ascii").capitalize() for day in days})
+
+
+def _update_period(info: Any) -> int | None:
+    """Seconds between updates announced via ``sy:updatePeriod``."""
+    period = _SY_PERIODS.get(str(info.get("sy_updateperiod", "")).strip().lower())
+    if period is None:
+        return None
+    try:
+        frequency = max(1, int(info.get("sy_updatefrequency", 1)))
+    except (TypeError, ValueError):
+        frequency = 1
+    return period // frequency
+
+
+def _ttl(info: Any) -> int | None:
+    try:
+        return int(info["ttl"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def parse_feed_bytes(body: bytes) -> Dict[str, Any]:
+    """Parse a raw feed document into ``{"feed": {...}, "entries": [...]}``."""
+    # Imported on first parse; feedparser is slow to import and the UI can
+    # draw its first frame without it.
+    import feedparser
+
+    feed = feedparser.parse(body)
+
+    if feed.bozo and getattr(feed, "bozo_exception", None):
+        raise RuntimeError(f"Parse error: {feed.bozo_exception}")
+
+    info = feed.get("feed", {})
+    entries = []
+    for entry in feed.get("entries", []):
+        link = entry.get("link", "")
+        entries.append(
+            Entry(
+                entry.get("id") or link,
+                title=entry.get("title", "Untitled"),
+                link=link,
+                summary=_entry_content(entry),
+                author=entry.get("author", ""),
+                published=entry.get("published") or entry.get("updated", ""),
+                published_ts=_timestamp(entry),
+            )
+        )
+
+    return {
+        "feed": {
+            "title": info.get("title", ""),
+            "link": info.get("link", ""),
+            "ttl": _ttl(info),
+            "skip_hours": _skip_hours(body),
+            "skip_days": _skip_days(body),
+            "update_period": _update_period(info),
+        },
+        "entries": entries,
+    }
+
+
+# -----------------------------------------------------------------------------
+# Incremental preview
+# -----------------------------------------------------------------------------
+
+_ENTRY_TAGS = {"item", "entry"}
+_CONTENT_TAGS = ("encoded", "content", "description", "summary")
+_DATE_TAGS = ("pubDate", "published", "updated", "date")
+
+
+def _local(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _date_ts(text: str) -> float | None:
+    try:
+        when = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            when = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+def _element_entry(item: ElementTree.Element) -> Entry:
+    fields: Dict[str, str] = {}
+    link = ""
+    for child in item:
+        name = _local(child.tag)
+        if name == "link" and not link:
+            # Atom links live in attributes; RSS links are element text.
+            if child.get("rel", "alternate") == "alternate":
+                link = (child.get("href") or child.text or "").strip()
+        elif name in ("author", "creator"):
+            # Atom nests the name; RSS and Dublin Core give it as text.
+            person = next((c for c in child if _local(c.tag) == "name"), child)
+            fields.setdefault("author", (person.text or "").strip())
+        elif child.text and name not in fields:
+            fields[name] = child.text.strip()
+    published = next((fields[tag] for tag in _DATE_TAGS if tag in fields), "")
+    return Entry(
+        fields.get("guid") or fields.get("id") or link,
+        title=fields.get("title") or "Untitled",
+        link=link,
+        summary=next((fields[tag] for tag in _CONTENT_TAGS if tag in fields), ""),
+        author=fields.get("author", ""),
+        published=published,
+        published_ts=_date_ts(published) if published else None,
+    )
+
+
+class EntryStream:
+    """Reads RSS/Atom entries out of a document as its bytes arrive.
+
+    Meant for showing the first entries of a large feed while it is still
+    downloading: only well-formed XML is understood, and the first error
+    silences the stream, leaving the result to ``parse_feed_bytes`` on the
+    complete body. Finished entries are dropped from the tree, so memory
+    stays flat however long the document is.
+    """
+
+    def __init__(self) -> None:
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self._open: List[ElementTree.Element] = []
+        self.failed = False
+
+    def feed(self, chunk: bytes) -> List[Entry]:
+        """Consume ``chunk`` and return the entries it completed."""
+        if self.failed:
+            return []
+        entries = []
+        try:
+            self._parser.feed(chunk)
+            for event, element in self._parser.read_events():
+                if event == "start":
+                    self._open.append(element)
+                    continue
+                self._open.pop()
+                if _local(element.tag) in _ENTRY_TAGS:
+                    entries.append(_element_entry(element))
+                    if self._open:
+                        self._open[-1].remove(element)
+        except ElementTree.ParseError:
+            self.failed = True
+        return entries
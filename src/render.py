@@ -0,0 +1,130 @@
+"""HTML-to-text rendering of article bodies with a bounded render cache."""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import re
+import threading
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING, Iterable, List
+
+from . import metrics
+from .budget import ByteLRU
+
+if TYPE_CHECKING:
+    import html2text
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_MARKDOWN_RE = re.compile(r"\[/?[^\]]*\]")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+_SPACES_RE = re.compile(r" +")
+
+# Bounded by size rather than count: a full article renders to far more
+# text than a feed summary.
+RENDER_CACHE_BYTES = 8 * 2**20
+
+_cache: ByteLRU[bytes, str] = ByteLRU(RENDER_CACHE_BYTES, lambda text: len(text) + 64)
+_cache_lock = threading.Lock()
+
+
+def _is_html_content(content: str | None) -> bool:
+    """Check if content likely contains HTML tags."""
+    if not content:
+        return False
+    return _TAG_RE.search(content) is not None
+
+
+class _SimpleHTMLParser(HTMLParser):
+    """Minimal fallback parser for basic HTML cleanup."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.text: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in {"br", "p"}:
+            self.text.append("\n")
+        elif tag in {"h1", "h2", "h3", "h4", "h5", "h6"}:
+            self.text.append("\n## ")
+        elif tag == "a":
+            for attr, value in attrs:
+                if attr == "href" and value:
+                    self.text.append("[")
+                    break
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "a":
+            self.text.append("]")
+        elif tag in {"p", "div"}:
+            self.text.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        stripped = data.strip()
+        if stripped:
+            self.text.append(stripped)
+
+    def get_text(self) -> str:
+        return "".join(self.text)
+
+
+def _make_converter() -> html2text.HTML2Text:
+    # Deferred to the first article render, which keeps it out of startup.
+    import html2text
+
+    h = html2text.HTML2Text()
+    h.ignore_links = True
+    h.ignore_images = True
+    h.ignore_tables = True
+    h.body_width = 0
+    return h
+
+
+def _convert(content: str) -> str:
+    if not _is_html_content(content):
+        return content.strip()
+
+    try:
+        # A converter is single-use (it keeps parser state between calls) and
+        # costs microseconds to build next to milliseconds to run.
+        cleaned = _make_converter().handle(content)
+        cleaned = _MARKDOWN_RE.sub("", cleaned)  # remove leftover markdown
+        cleaned = _BLANK_LINES_RE.sub("\n\n", cleaned)  # normalize paragraphs
+        cleaned = _SPACES_RE.sub(" ", cleaned)  # collapse spaces
+        return cleaned.strip()
+    except Exception:
+        # Fallback: strip tags manually
+        parser = _SimpleHTMLParser()
+        parser.feed(content)
+        return html.unescape(parser.get_text()).strip()
+
+
+def clean_html_content(content: str | None) -> str:
+    """Convert HTML content to clean readable text.
+
+    Results are kept in an LRU cache keyed by a hash of the content, so
+    reopening (or pre-rendering) an article costs a dictionary lookup.
+    """
+    if not content:
+        return "No content available."
+
+    key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+    with _cache_lock:
+        cleaned = _cache.get(key)
+        if cleaned is not None:
+            metrics.count("render_cache_hit")
+            return cleaned
+
+    with metrics.span("render"):
+        cleaned = _convert(content)
+    with _cache_lock:
+        _cache.put(key, cleaned)
+    return cleaned
+
+
+def prerender(contents: Iterable[str | None]) -> None:
+    """Warm the render cache, e.g. from a worker thread after a feed loads."""
+    for content in contents:
+        clean_html_content(content)
+
+
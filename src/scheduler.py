@@ -0,0 +1,208 @@
+"""Adaptive background polling of subscribed feeds."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Set, Tuple
+
+from .refresh import FeedRefresher, RefreshResult
+
+_DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+class FeedSchedule:
+    """Polling state of one feed."""
+
+    def __init__(
+        self, title: str, url: str, interval: float, next_due: float
+    ) -> None:
+        self.title = title
+        self.url = url
+        self.interval = interval
+        self.next_due = next_due
+        self.failures = 0
+
+
+class PollScheduler:
+    """Keeps feeds fresh by polling each one when it is next due.
+
+    Due times live in a heap, so between polls the scheduler sleeps until the
+    earliest one and costs nothing per feed. After each poll the feed's
+    interval adapts to how often it publishes, never dropping below the
+    channel's ``<ttl>`` or ``sy:updatePeriod`` and skipping the
+    ``skipHours``/``skipDays`` windows. Failures back off exponentially with
+    jitter, or wait out the server's ``Retry-After`` on 429/503.
+    """
+
+    def __init__(
+        self,
+        refresher: FeedRefresher,
+        on_result: Callable[[RefreshResult], object] | None = None,
+        min_interval: float = 5 * 60,
+        default_interval: float = 30 * 60,
+        max_interval: float = 24 * 3600,
+        startup_spread: float = 30.0,
+    ) -> None:
+        self.refresher = refresher
+        self.on_result = on_result
+        self.min_interval = min_interval
+        self.default_interval = default_interval
+        self.max_interval = max_interval
+        self.startup_spread = startup_spread
+        self._feeds: Dict[str, FeedSchedule] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._inflight: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._wake = asyncio.Event()
+
+    # -------------------------------------------------------------------------
+    # Feed set
+    # -------------------------------------------------------------------------
+
+    def sync(self, feeds: Dict[str, str]) -> None:
+        """Track exactly ``feeds``: poll new ones soon, forget removed ones."""
+        urls = set(feeds.values())
+        for url in list(self._feeds):
+            if url not in urls:
+                del self._feeds[url]
+
+        now = time.time()
+        for title, url in feeds.items():
+            if url in self._feeds:
+                self._feeds[url].title = title
+                continue
+            due = now + random.uniform(0, self.startup_spread)
+            self._feeds[url] = FeedSchedule(title, url, self.default_interval, due)
+            heapq.heappush(self._heap, (due, url))
+        self._wake.set()
+
+    def next_due(self, url: str) -> float | None:
+        state = self._feeds.get(url)
+        return state.next_due if state is not None else None
+
+    # -------------------------------------------------------------------------
+    # Main loop
+    # -------------------------------------------------------------------------
+
+    async def run(self) -> None:
+        """Poll due feeds until cancelled."""
+        try:
+            while True:
+                self._wake.clear()
+                now = time.time()
+                while self._heap and self._heap[0][0] <= now:
+                    due, url = heapq.heappop(self._heap)
+                    state = self._feeds.get(url)
+                    # Entries for removed or rescheduled feeds are stale.
+                    if state is None or state.next_due != due:
+                        continue
+                    if url in self._inflight:
+                        continue
+                    self._inflight.add(url)
+                    task = asyncio.create_task(self._poll(state))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+
+                timeout = self._heap[0][0] - now if self._heap else None
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in self._tasks:
+                task.cancel()
+
+    async def _poll(self, state: FeedSchedule) -> None:
+        try:
+            result = await self.refresher.refresh_one(state.title, state.url)
+        finally:
+            self._inflight.discard(state.url)
+
+        # A feed removed and re-added mid-poll has a new schedule; the heap
+        # entry that one pushed was dropped while this poll was in flight.
+        current = self._feeds.get(state.url)
+        if current is None:
+            return
+        self._reschedule(current, result)
+        if self.on_result is not None:
+            outcome = self.on_result(result)
+            if asyncio.iscoroutine(outcome):
+                await outcome
+
+    # -------------------------------------------------------------------------
+    # Interval policy
+    # -------------------------------------------------------------------------
+
+    def _reschedule(self, state: FeedSchedule, result: RefreshResult) -> None:
+        now = time.time()
+        if result.ok:
+            state.failures = 0
+            state.interval = self._success_interval(state, result)
+            delay = state.interval
+        else:
+            state.failures += 1
+            delay = self._failure_delay(state, result)
+
+        due = self._skip_windows(now + delay, result.feed_info)
+        state.next_due = due
+        heapq.heappush(self._heap, (due, state.url))
+        self._wake.set()
+
+    def _success_interval(self, state: FeedSchedule, result: RefreshResult) -> float:
+        interval = self._publish_interval(result.timestamps)
+        if interval is None:
+            interval = state.interval
+        if not result.new_entries:
+            # Nothing new: ease off gradually so quiet feeds drift to rare polls.
+            interval = max(interval, state.interval * 1.5)
+
+        info = result.feed_info
+        if info.get("ttl"):
+            interval = max(interval, info["ttl"] * 60)
+        if info.get("update_period"):
+            interval = max(interval, info["update_period"])
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    @staticmethod
+    def _publish_interval(timestamps: List[float]) -> float | None:
+        """Half the median gap between recent posts, or None if unknown."""
+        recent = sorted(timestamps, reverse=True)[:20]
+        gaps = [a - b for a, b in zip(recent, recent[1:]) if a > b]
+        if not gaps:
+            return None
+        return statistics.median(gaps) / 2
+
+    def _failure_delay(self, state: FeedSchedule, result: RefreshResult) -> float:
+        if result.retry_after is not None:
+            return min(self.max_interval, max(self.min_interval, result.retry_after))
+        backoff = min(self.max_interval, self.min_interval * 2 ** (state.failures - 1))
+        return random.uniform(backoff / 2, backoff)
+
+    @staticmethod
+    def _skip_windows(due: float, info: Dict[str, object]) -> float:
+        """Move ``due`` past any skipHours/skipDays window (UTC, per RSS 2.0)."""
+        skip_hours = set(info.get("skip_hours") or ())
+        skip_days = set(info.get("skip_days") or ())
+        if not skip_hours and not skip_days:
+            return due
+        if len(skip_hours) >= 24 or len(skip_days) >= 7:
+            return due
+
+        moment = datetime.fromtimestamp(due, timezone.utc)
+        for _ in range(24 * 7):
+            if _DAYS[moment.weekday()] in skip_days:
+                moment = (moment + timedelta(days=1)).replace(
+                    hour=0, minute=0, second=0, microsecond=0
+                )
+            elif moment.hour in skip_hours:
+                moment = (moment + timedelta(hours=1)).replace(
+                    minute=0, second=0, microsecond=0
+                )
+            else:
+                break
+        return moment.timestamp()
@@ -0,0 +1,201 @@
+"""Feed fetches shared between app processes on one machine.
+
+``web.py`` serves every browser session from its own app process, and
+each of them would otherwise fetch and parse the same feeds. Processes
+using the same config directory coordinate through ``fetches.db``:
+
+* a feed checked less than ``min_interval`` seconds ago is served from the
+  parse stored there, or fails again with the error its fetch raised;
+* otherwise one process takes a lease on the URL and fetches it, while the
+  others wait for its result instead of fetching too. A lease held longer
+  than ``lease_time`` (its process died) can be taken over.
+
+Parses are stored pickled, which is how parse workers already return them
+(see ``Entry.__reduce__``); loading one costs a fraction of parsing the
+feed again. Sharing is off unless ``RSS_FEED_TUI_SHARED_CACHE=1``, since
+a process then shows parses up to ``min_interval`` old that another one
+fetched; ``web.py`` turns it on for its sessions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import pickle
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fetches (
+    url TEXT PRIMARY KEY,
+    checked_at REAL NOT NULL DEFAULT 0,
+    parsed BLOB,
+    error BLOB,
+    lease_owner TEXT,
+    lease_until REAL NOT NULL DEFAULT 0
+);
+"""
+
+# Results nobody has asked for in this long are dropped on startup.
+_KEEP_SECONDS = 7 * 24 * 3600
+
+
+class SharedFetchCache:
+    """Recent feed parses and fetch leases in an SQLite file."""
+
+    def __init__(
+        self,
+        path: Path,
+        min_interval: float = 60.0,
+        lease_time: float = 30.0,
+        poll_interval: float = 0.1,
+    ) -> None:
+        self.path = path
+        self.min_interval = min_interval
+        self.lease_time = lease_time
+        self.poll_interval = poll_interval
+        self.owner = f"{os.getpid()}-{os.urandom(4).hex()}"
+        self._conn: sqlite3.Connection | None = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="shared-cache"
+        )
+
+    @classmethod
+    def for_config_dir(cls, config_dir: Path) -> "SharedFetchCache | None":
+        """The cache for ``config_dir``, or None unless sharing is turned on."""
+        if os.environ.get("RSS_FEED_TUI_SHARED_CACHE") != "1":
+            return None
+        return cls(config_dir / "fetches.db")
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            # Autocommit: every statement below is its own atomic step.
+            conn = sqlite3.connect(
+                self.path, timeout=10, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            conn.execute(
+                "DELETE FROM fetches WHERE checked_at < ? AND lease_until < ?",
+                (time.time() - _KEEP_SECONDS, time.time()),
+            )
+            self._conn = conn
+        return self._conn
+
+    async def close(self) -> None:
+        def _close() -> None:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+        await self._run(_close)
+        self._executor.shutdown(wait=False)
+
+    async def get(self, url: str) -> dict | None:
+        """The feed's recent parse, or None if it is due for a fetch.
+
+        Raises the exception its recent fetch failed with, if it did.
+        """
+        return await self._run(self._get, url)
+
+    def _get(self, url: str) -> dict | None:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT parsed, error FROM fetches WHERE url = ? AND checked_at > ?",
+                (url, time.time() - self.min_interval),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        parsed, error = row
+        if error is not None:
+            raise pickle.loads(error)
+        return pickle.loads(parsed)
+
+    async def acquire(self, url: str) -> bool:
+        """Take the lease on fetching ``url``; False if someone else has it."""
+        return await self._run(self._acquire, url)
+
+    def _acquire(self, url: str) -> bool:
+        conn = self._connect()
+        now = time.time()
+        until = now + self.lease_time
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO fetches (url, lease_owner, lease_until) "
+            "VALUES (?, ?, ?)",
+            (url, self.owner, until),
+        )
+        if cursor.rowcount:
+            return True
+        cursor = conn.execute(
+            "UPDATE fetches SET lease_owner = ?, lease_until = ? "
+            "WHERE url = ? AND (lease_owner IS NULL OR lease_until < ?) "
+            "AND checked_at <= ?",
+            (self.owner, until, url, now, now - self.min_interval),
+        )
+        return bool(cursor.rowcount)
+
+    async def wait(self, url: str) -> None:
+        """Return once nobody holds the lease on ``url`` any more."""
+        deadline = time.monotonic() + self.lease_time
+        while time.monotonic() < deadline:
+            if not await self._run(self._leased, url):
+                return
+            await asyncio.sleep(self.poll_interval)
+
+    def _leased(self, url: str) -> bool:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT 1 FROM fetches WHERE url = ? AND lease_owner IS NOT NULL "
+                "AND lease_until >= ?",
+                (url, time.time()),
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    async def put(self, url: str, feed: dict) -> None:
+        """Publish a fetch's parse and give up the lease."""
+        await self._run(self._finish, url, feed, None)
+
+    async def put_error(self, url: str, exc: Exception) -> None:
+        """Publish a failed fetch, so other processes don't retry it at once."""
+        try:
+            error = pickle.dumps(exc, protocol=5)
+            pickle.loads(error)
+        except Exception:
+            # Not every library exception survives a round trip.
+            error = pickle.dumps(RuntimeError(str(exc) or type(exc).__name__))
+        await self._run(self._finish, url, None, error)
+
+    def _finish(self, url: str, feed: dict | None, error: bytes | None) -> None:
+        parsed = None if feed is None else pickle.dumps(feed, protocol=5)
+        self._connect().execute(
+            "UPDATE fetches SET checked_at = ?, parsed = ?, error = ?, "
+            "lease_owner = NULL, lease_until = 0 WHERE url = ? AND lease_owner = ?",
+            (time.time(), parsed, error, url, self.owner),
+        )
+
+    async def release(self, url: str) -> None:
+        """Give up the lease without a result, e.g. when the fetch was cancelled."""
+        await self._run(self._release, url)
+
+    def _release(self, url: str) -> None:
+        self._connect().execute(
+            "UPDATE fetches SET lease_owner = NULL, lease_until = 0 "
+            "WHERE url = ? AND lease_owner = ?",
+            (url, self.owner),
+        )
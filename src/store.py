@@ -0,0 +1,550 @@
+"""SQLite-backed persistent article store."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, TypeVar
+
+from .dedupe import THRESHOLD, band_keys, link_keys, signature, similarity
+from .models import Entry
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    feed_url TEXT NOT NULL,
+    guid TEXT NOT NULL,
+    title TEXT NOT NULL,
+    link TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    author TEXT NOT NULL,
+    published TEXT NOT NULL,
+    published_ts REAL,
+    sort_ts REAL NOT NULL,
+    read INTEGER NOT NULL DEFAULT 0,
+    minhash BLOB,
+    dup_of INTEGER,
+    UNIQUE (feed_url, guid)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_feed_sort
+    ON articles (feed_url, sort_ts DESC, id DESC);
+CREATE TABLE IF NOT EXISTS story_links (
+    link TEXT PRIMARY KEY,
+    article_id INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS story_bands (
+    band INTEGER NOT NULL,
+    article_id INTEGER NOT NULL,
+    PRIMARY KEY (band, article_id)
+) WITHOUT ROWID;
+"""
+
+# External-content FTS5 index over title/summary/author. Summaries are HTML,
+# so they are indexed through strip_tags() to keep markup out of the index.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE articles_fts USING fts5(
+    title, summary, author,
+    content='articles', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, summary, author)
+    VALUES (new.id, new.title, strip_tags(new.summary), new.author);
+END;
+CREATE TRIGGER articles_fts_delete AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, summary, author)
+    VALUES ('delete', old.id, old.title, strip_tags(old.summary), old.author);
+END;
+CREATE TRIGGER articles_fts_update AFTER UPDATE OF title, summary, author
+ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, summary, author)
+    VALUES ('delete', old.id, old.title, strip_tags(old.summary), old.author);
+    INSERT INTO articles_fts (rowid, title, summary, author)
+    VALUES (new.id, new.title, strip_tags(new.summary), new.author);
+END;
+INSERT INTO articles_fts (rowid, title, summary, author)
+    SELECT id, title, strip_tags(summary), author FROM articles;
+"""
+
+# Added after the first release; older databases get them via ALTER TABLE.
+# minhash is NULL until an article has been through deduplication, and empty
+# if it was too short for a signature.
+_DEDUPE_COLUMNS = (("minhash", "BLOB"), ("dup_of", "INTEGER"))
+
+_COLUMNS = (
+    "guid, title, link, summary, author, published, published_ts, read, dup_of"
+)
+
+_TAG_RE = re.compile(r"<[^>]*>")
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _strip_tags(text: str | None) -> str:
+    return _TAG_RE.sub(" ", text) if text else ""
+
+
+def _fts_query(text: str) -> str | None:
+    """Turn typed input into an FTS5 query; the last word is a prefix."""
+    tokens = [f'"{token}"' for token in _TOKEN_RE.findall(text)]
+    if not tokens:
+        return None
+    tokens[-1] += "*"
+    return " ".join(tokens)
+
+
+def _guid(entry: Entry) -> str:
+    """Stable identity for an entry: its guid, then link, then a title hash."""
+    guid = entry.id or entry.link
+    if guid:
+        return guid
+    title = entry.title + entry.published
+    return "sha1:" + hashlib.sha1(title.encode("utf-8")).hexdigest()
+
+
+def _row_to_entry(row: sqlite3.Row, feed_url: str = "") -> Entry:
+    return Entry(
+        row["guid"],
+        title=row["title"],
+        link=row["link"],
+        summary=row["summary"],
+        author=row["author"],
+        published=row["published"],
+        published_ts=row["published_ts"],
+        read=bool(row["read"]),
+        feed_url=feed_url,
+        duplicate=row["dup_of"] is not None,
+    )
+
+
+def _select_in(
+    conn: sqlite3.Connection, sql: str, values: Iterable[Any]
+) -> Iterator[sqlite3.Row]:
+    """Run ``sql + " (?, ...)"`` over ``values`` in chunks of bound parameters."""
+    values = list(values)
+    # Stay below SQLite's bound-parameter limit.
+    for start in range(0, len(values), 500):
+        chunk = values[start : start + 500]
+        yield from conn.execute(f"{sql} ({','.join('?' * len(chunk))})", chunk)
+
+
+class _StoryMatcher:
+    """Finds the first copies of a batch of articles' stories in other feeds.
+
+    Everything the batch could match is read up front with a few queries:
+    first copies sharing a canonical link or a MinHash band, and their feeds
+    and signatures. Articles of the batch itself are matched as they are
+    added. Articles of the same feed never match: episodes sharing
+    boilerplate, or posts that all link to a homepage, are distinct stories.
+    """
+
+    def __init__(
+        self, conn: sqlite3.Connection, batch: List[Tuple[str, str, str, str, str]]
+    ) -> None:
+        self._conn = conn
+        self._feed_urls = [feed_url for feed_url, _, _, _, _ in batch]
+        self._links = [link_keys(guid, link) for _, guid, link, _, _ in batch]
+        self._sigs = [signature(title, summary) for _, _, _, title, summary in batch]
+        self._bands = [band_keys(sig) if sig else [] for sig in self._sigs]
+        self._by_link: Dict[str, int] = dict(
+            _select_in(
+                conn,
+                "SELECT link, article_id FROM story_links WHERE link IN",
+                {link for links in self._links for link in links},
+            )
+        )
+        self._by_band: Dict[int, List[int]] = {}
+        for band, article_id in _select_in(
+            conn,
+            "SELECT band, article_id FROM story_bands WHERE band IN",
+            {band for bands in self._bands for band in bands},
+        ):
+            self._by_band.setdefault(band, []).append(article_id)
+        self._feeds: Dict[int, str] = {}
+        self._signatures: Dict[int, bytes] = {}
+        for article_id, feed_url, minhash in _select_in(
+            conn,
+            "SELECT id, feed_url, minhash FROM articles WHERE id IN",
+            {article_id for ids in self._by_band.values() for article_id in ids}
+            | set(self._by_link.values()),
+        ):
+            self._feeds[article_id] = feed_url
+            self._signatures[article_id] = minhash
+        self._new_links: List[Tuple[str, int]] = []
+        self._new_bands: List[Tuple[int, int]] = []
+
+    def signature(self, n: int) -> bytes:
+        """Article ``n``'s signature as stored: empty if it has none."""
+        return self._sigs[n] or b""
+
+    def find(self, n: int) -> int | None:
+        """Id of the first copy of article ``n``'s story in another feed."""
+        feed_url = self._feed_urls[n]
+        for link in self._links[n]:
+            article_id = self._by_link.get(link)
+            if article_id is not None and self._feeds[article_id] != feed_url:
+                return article_id
+        sig = self._sigs[n]
+        if sig is None:
+            return None
+        candidates = {
+            article_id
+            for band in self._bands[n]
+            for article_id in self._by_band.get(band, ())
+            if self._feeds[article_id] != feed_url
+        }
+        for article_id in sorted(candidates):
+            if similarity(self._signatures[article_id], sig) >= THRESHOLD:
+                return article_id
+        return None
+
+    def add(self, n: int, article_id: int) -> None:
+        """Record article ``n``, now stored as ``article_id``, as a first copy."""
+        self._feeds[article_id] = self._feed_urls[n]
+        for link in self._links[n]:
+            if link not in self._by_link:
+                self._by_link[link] = article_id
+                self._new_links.append((link, article_id))
+        if self._sigs[n] is None:
+            return
+        self._signatures[article_id] = self._sigs[n]
+        for band in self._bands[n]:
+            self._by_band.setdefault(band, []).append(article_id)
+            self._new_bands.append((band, article_id))
+
+    def save(self) -> None:
+        """Write the first copies added so far to the index tables."""
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO story_links (link, article_id) VALUES (?, ?)",
+            self._new_links,
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO story_bands (band, article_id) VALUES (?, ?)",
+            self._new_bands,
+        )
+        self._new_links.clear()
+        self._new_bands.clear()
+
+
+class AsyncArticleStore:
+    """Persists fetched entries per feed in ``articles.db``.
+
+    Entries are keyed by ``(feed_url, guid)`` so re-fetching a feed only
+    inserts what is new. All SQLite work runs on one dedicated thread that
+    owns the connection, keeping queries off the event loop.
+
+    New articles that repeat a story another feed already stored (see
+    :mod:`.dedupe`) keep a ``dup_of`` link to its first copy. A feed still
+    lists them, marked as repeats; the cross-feed timeline hides them. First
+    copies are indexed by canonical link in ``story_links`` and by MinHash
+    band in ``story_bands``, so a lookup reads a few index pages.
+    """
+
+    SEARCH_WINDOW = 2000
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="article-store"
+        )
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.create_function("strip_tags", 1, _strip_tags, deterministic=True)
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(articles)")}
+            for name, kind in _DEDUPE_COLUMNS:
+                if name not in columns:
+                    conn.execute(f"ALTER TABLE articles ADD COLUMN {name} {kind}")
+            has_fts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'"
+            ).fetchone()
+            if not has_fts:
+                with conn:
+                    conn.executescript(_FTS_SCHEMA)
+            self._dedupe_backlog(conn)
+            self._conn = conn
+        return self._conn
+
+    async def close(self) -> None:
+        def _close() -> None:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+        await self._run(_close)
+        self._executor.shutdown(wait=False)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    async def entries(
+        self, feed_url: str, limit: int | None = None, offset: int = 0
+    ) -> List[Entry]:
+        """Return a feed's articles, newest first, skipping the first ``offset``."""
+        return await self._run(self._entries, feed_url, limit, offset)
+
+    def _entries(self, feed_url: str, limit: int | None, offset: int) -> List[Entry]:
+        rows = self._connect().execute(
+            f"SELECT {_COLUMNS} FROM articles WHERE feed_url = ? "
+            "ORDER BY sort_ts DESC, id DESC LIMIT ? OFFSET ?",
+            (feed_url, -1 if limit is None else limit, offset),
+        )
+        return [_row_to_entry(row, feed_url) for row in rows]
+
+    async def feed_pages(
+        self, after: Dict[str, Tuple[float, int] | None], limit: int
+    ) -> Dict[str, List[Tuple[float, int, Entry]]]:
+        """The next ``limit`` articles of several feeds, newest first.
+
+        ``after`` maps each feed URL to the ``(sort_ts, id)`` key of the last
+        article already read from it, or None to start at the newest. Pages
+        are keyset-paginated along ``idx_articles_feed_sort``, so a deep page
+        costs the same as the first. Rows come back as ``(sort_ts, id, entry)``.
+        Repeats of stories stored earlier are left out.
+        """
+        return await self._run(self._feed_pages, after, limit)
+
+    def _feed_pages(
+        self, after: Dict[str, Tuple[float, int] | None], limit: int
+    ) -> Dict[str, List[Tuple[float, int, Entry]]]:
+        conn = self._connect()
+        select = (
+            f"SELECT id, sort_ts, {_COLUMNS} FROM articles "
+            "WHERE feed_url = ? AND dup_of IS NULL"
+        )
+        order = " ORDER BY sort_ts DESC, id DESC LIMIT ?"
+        pages = {}
+        for feed_url, key in after.items():
+            if key is None:
+                rows = conn.execute(select + order, (feed_url, limit))
+            else:
+                rows = conn.execute(
+                    select + " AND (sort_ts, id) < (?, ?)" + order,
+                    (feed_url, *key, limit),
+                )
+            pages[feed_url] = [
+                (row["sort_ts"], row["id"], _row_to_entry(row, feed_url))
+                for row in rows
+            ]
+        return pages
+
+    async def search(self, text: str, limit: int = 200) -> List[Entry]:
+        """Full-text search over stored articles, best matches first.
+
+        Titles weigh more than authors and summaries. Only the newest
+        ``SEARCH_WINDOW`` matches are ranked, which bounds the cost of broad
+        prefixes typed early on. Results carry their ``feed_url``.
+        """
+        return await self._run(self._search, text, limit)
+
+    def _search(self, text: str, limit: int) -> List[Entry]:
+        query = _fts_query(text)
+        if query is None:
+            return []
+        columns = ", ".join(f"a.{column}" for column in _COLUMNS.split(", "))
+        sql = (
+            f"SELECT a.feed_url, {columns} FROM ("
+            "  SELECT rowid, bm25(articles_fts, 10.0, 1.0, 2.0) AS score"
+            "  FROM articles_fts WHERE articles_fts MATCH ?"
+            "  ORDER BY rowid DESC LIMIT ?"
+            ") AS m JOIN articles AS a ON a.id = m.rowid "
+            "ORDER BY m.score LIMIT ?"
+        )
+        rows = self._connect().execute(sql, (query, self.SEARCH_WINDOW, limit))
+        return [_row_to_entry(row, row["feed_url"]) for row in rows]
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    async def merge(
+        self, feed_url: str, entries: Iterable[Entry]
+    ) -> List[Entry]:
+        """Upsert a fetched entry list in one transaction.
+
+        Returns the entries that were not stored before, in feed order.
+        """
+        new_entries, _ = await self.upsert(feed_url, entries)
+        return new_entries
+
+    async def upsert(
+        self, feed_url: str, entries: Iterable[Entry]
+    ) -> Tuple[List[Entry], List[Entry]]:
+        """Like ``merge``, but also return the stored entries whose content changed.
+
+        The read flag of changed entries is meaningless; callers keep their own
+        (see ``Entry.update_content``).
+        """
+        return await self._run(self._merge, feed_url, list(entries))
+
+    def _merge(
+        self, feed_url: str, entries: List[Entry]
+    ) -> Tuple[List[Entry], List[Entry]]:
+        conn = self._connect()
+        now = time.time()
+        rows = {}
+        firsts = {}
+        for entry in entries:
+            guid = _guid(entry)
+            if guid in rows:
+                continue
+            firsts[guid] = entry
+            published_ts = entry.published_ts
+            rows[guid] = (
+                entry.title,
+                entry.link,
+                entry.summary,
+                entry.author,
+                entry.published,
+                published_ts,
+                published_ts if published_ts is not None else now,
+                feed_url,
+                guid,
+            )
+
+        existing = {}
+        guids = list(rows)
+        # Stay below SQLite's bound-parameter limit.
+        for start in range(0, len(guids), 500):
+            chunk = guids[start : start + 500]
+            existing.update(
+                (row[0], tuple(row[1:]))
+                for row in conn.execute(
+                    "SELECT guid, title, link, summary, author, published "
+                    "FROM articles WHERE feed_url = ? AND guid IN "
+                    f"({','.join('?' * len(chunk))})",
+                    (feed_url, *chunk),
+                )
+            )
+
+        new_guids = [guid for guid in guids if guid not in existing]
+        changed_guids = [
+            guid
+            for guid in guids
+            if guid in existing and existing[guid] != rows[guid][:5]
+        ]
+        matcher = _StoryMatcher(
+            conn,
+            [
+                (feed_url, guid, rows[guid][1], rows[guid][0], rows[guid][2])
+                for guid in new_guids
+            ],
+        )
+        dup_of = {}
+        with conn:
+            for n, guid in enumerate(new_guids):
+                original = matcher.find(n)
+                cursor = conn.execute(
+                    "INSERT INTO articles (title, link, summary, author, "
+                    "published, published_ts, sort_ts, feed_url, guid, "
+                    "minhash, dup_of) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (*rows[guid], matcher.signature(n), original),
+                )
+                if original is None:
+                    matcher.add(n, cursor.lastrowid)
+                else:
+                    dup_of[guid] = original
+            matcher.save()
+            conn.executemany(
+                "UPDATE articles SET title = ?, link = ?, summary = ?, "
+                "author = ?, published = ?, published_ts = ? "
+                "WHERE feed_url = ? AND guid = ?",
+                (rows[guid][:6] + rows[guid][7:] for guid in changed_guids),
+            )
+
+        # Copies: the parsed entries may be shared through the loader's cache.
+        return (
+            [
+                firsts[guid].copy(
+                    id=guid, read=False, feed_url=feed_url, duplicate=guid in dup_of
+                )
+                for guid in new_guids
+            ],
+            [firsts[guid].copy(id=guid, feed_url=feed_url) for guid in changed_guids],
+        )
+
+    def _dedupe_backlog(self, conn: sqlite3.Connection) -> None:
+        """Deduplicate articles stored without it, in insertion order.
+
+        These are articles from before deduplication existed, and repeats
+        whose first copy was deleted.
+        """
+        rows = conn.execute(
+            "SELECT id, feed_url, guid, title, link, summary FROM articles "
+            "WHERE minhash IS NULL ORDER BY id"
+        ).fetchall()
+        for start in range(0, len(rows), 500):
+            chunk = rows[start : start + 500]
+            matcher = _StoryMatcher(
+                conn,
+                [
+                    (
+                        row["feed_url"],
+                        row["guid"],
+                        row["link"],
+                        row["title"],
+                        row["summary"],
+                    )
+                    for row in chunk
+                ],
+            )
+            with conn:
+                for n, row in enumerate(chunk):
+                    original = matcher.find(n)
+                    conn.execute(
+                        "UPDATE articles SET minhash = ?, dup_of = ? WHERE id = ?",
+                        (matcher.signature(n), original, row["id"]),
+                    )
+                    if original is None:
+                        matcher.add(n, row["id"])
+                matcher.save()
+
+    async def mark_read(self, feed_url: str, guid: str, read: bool = True) -> None:
+        def _mark() -> None:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE articles SET read = ? WHERE feed_url = ? AND guid = ?",
+                    (int(read), feed_url, guid),
+                )
+
+        await self._run(_mark)
+
+    async def delete_feed(self, feed_url: str) -> None:
+        def _delete() -> None:
+            conn = self._connect()
+            ids = "SELECT id FROM articles WHERE feed_url = ?"
+            with conn:
+                # Repeats of the deleted articles are deduplicated again, so
+                # one of them takes over as the story's first copy.
+                conn.execute(
+                    "UPDATE articles SET minhash = NULL, dup_of = NULL "
+                    f"WHERE dup_of IN ({ids})",
+                    (feed_url,),
+                )
+                for table in ("story_links", "story_bands"):
+                    conn.execute(
+                        f"DELETE FROM {table} WHERE article_id IN ({ids})",
+                        (feed_url,),
+                    )
+                conn.execute("DELETE FROM articles WHERE feed_url = ?", (feed_url,))
+            self._dedupe_backlog(conn)
+
+        await self._run(_delete)
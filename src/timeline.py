@@ -0,0 +1,101 @@
+"""Cross-feed timeline merged lazily from per-feed article streams."""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from typing import Deque, Dict, List, Set, Tuple
+
+from .models import Entry
+from .store import AsyncArticleStore
+
+
+class Timeline:
+    """Articles of many feeds, newest first, produced one page at a time.
+
+    Every feed is already sorted in the store, so the timeline is a k-way
+    merge. A heap holds the head of each feed's stream and yields the next
+    newest article. Streams are read in small keyset-paginated batches and
+    refilled as they drain. A page of ``n`` articles from ``k`` feeds costs
+    O(n log k), and only the pages handed out plus one batch per feed are
+    ever loaded.
+    """
+
+    def __init__(
+        self, store: AsyncArticleStore, feeds: Dict[str, str], batch: int = 20
+    ) -> None:
+        self.store = store
+        self.titles = {url: title for title, url in feeds.items()}
+        self.batch = batch
+        self._buffers: Dict[str, Deque[Tuple[float, int, Entry]]] = {}
+        self._after: Dict[str, Tuple[float, int]] = {}
+        self._exhausted: Set[str] = set()
+        # (-sort_ts, -id, feed_url) of each non-empty buffer's head.
+        self._heap: List[Tuple[float, int, str]] = []
+        self._started = False
+
+    @property
+    def done(self) -> bool:
+        return self._started and not self._heap
+
+    async def next_page(self, size: int = 100) -> List[Entry]:
+        """The next ``size`` articles, or fewer once every feed is drained."""
+        if not self._started:
+            self._started = True
+            await self._refill(list(self.titles))
+            for url in self.titles:
+                self._push(url)
+
+        page = []
+        while self._heap and len(page) < size:
+            _, _, url = heapq.heappop(self._heap)
+            buffer = self._buffers[url]
+            _, _, entry = buffer.popleft()
+            entry.feed_title = self.titles[url]
+            page.append(entry)
+            if not buffer and url not in self._exhausted:
+                await self._refill([url])
+            self._push(url)
+        return page
+
+    def take_new(self, url: str, entries: List[Entry]) -> List[Entry]:
+        """Copies of ``url``'s freshly stored ``entries`` that paging will miss.
+
+        New rows get the highest ids, so one is still ahead of the feed's
+        cursor only if it sorts older than the last row read; that one turns
+        up in a later page and is left out here, as are repeats of stories
+        another feed carried first. The rest belong above everything handed
+        out so far.
+        """
+        title = self.titles.get(url)
+        if title is None:
+            return []
+        key = self._after.get(url)
+        pending = key is not None and url not in self._exhausted
+        return [
+            entry.copy(feed_title=title)
+            for entry in entries
+            if not entry.duplicate
+            and not (
+                pending
+                and entry.published_ts is not None
+                and entry.published_ts < key[0]
+            )
+        ]
+
+    def _push(self, url: str) -> None:
+        buffer = self._buffers.get(url)
+        if buffer:
+            sort_ts, row_id, _ = buffer[0]
+            heapq.heappush(self._heap, (-sort_ts, -row_id, url))
+
+    async def _refill(self, urls: List[str]) -> None:
+        pages = await self.store.feed_pages(
+            {url: self._after.get(url) for url in urls}, self.batch
+        )
+        for url, rows in pages.items():
+            if len(rows) < self.batch:
+                self._exhausted.add(url)
+            if rows:
+                self._after[url] = rows[-1][:2]
+            self._buffers.setdefault(url, deque()).extend(rows)
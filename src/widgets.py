@@ -0,0 +1,284 @@
+"""Custom widgets for rss-feed-tui."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Iterable, List, Sequence
+
+from rich.cells import set_cell_size
+from rich.segment import Segment
+from rich.style import Style
+from textual import events
+from textual.binding import Binding
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.widgets import Footer
+
+from .models import Entry
+
+
+class ArticleList(ScrollView, can_focus=True):
+    """Virtualized list of feed entries.
+
+    No widget exists per article: rows are drawn on demand through the line
+    API and only the rows in the viewport (plus ``overscan`` rows either side)
+    are kept rendered, so a feed of 50,000 entries costs the same to show
+    and scroll as one of 50.
+
+    Rows refer to entries by their index in the ``entries`` list, which
+    ``Selected`` reports back, while ``order`` controls what is shown where.
+    """
+
+    COMPONENT_CLASSES = {
+        "article-list--title",
+        "article-list--meta",
+        "article-list--read",
+        "article-list--cursor",
+    }
+
+    BINDINGS = [
+        Binding("up", "cursor_up", "Up", show=False),
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("pageup", "page_up", "Page up", show=False),
+        Binding("pagedown", "page_down", "Page down", show=False),
+        Binding("home", "first", "First", show=False),
+        Binding("end", "last", "Last", show=False),
+        Binding("enter", "select", "Open", show=False),
+    ]
+
+    ROW_HEIGHT = 3
+
+    cursor: reactive[int] = reactive(0, always_update=True)
+
+    class Selected(Message):
+        """Posted when an article row is opened."""
+
+        def __init__(self, index: int) -> None:
+            self.index = index
+            super().__init__()
+
+    class Highlighted(Message):
+        """Posted when the cursor moves to another row."""
+
+        def __init__(self, index: int) -> None:
+            self.index = index
+            super().__init__()
+
+    class EndReached(Message):
+        """Posted once per length when rows near the end are drawn."""
+
+    def __init__(
+        self,
+        entries: List[Entry] | None = None,
+        overscan: int = 10,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.entries: List[Entry] = entries if entries is not None else []
+        self.order: List[int] = list(range(len(self.entries)))
+        self.overscan = overscan
+        self._rows: OrderedDict[int, List[Strip]] = OrderedDict()
+        self._rows_width = 0
+        self._end_reported = -1
+
+    # -------------------------------------------------------------------------
+    # Content updates
+    # -------------------------------------------------------------------------
+
+    def set_entries(
+        self, entries: List[Entry], order: Sequence[int] | None = None
+    ) -> None:
+        self.entries = entries
+        self.set_order(range(len(entries)) if order is None else order)
+
+    def set_order(self, order: Iterable[int]) -> None:
+        """Show the entries at ``order`` indices, top to bottom."""
+        self.order = list(order)
+        self._rows.clear()
+        self._end_reported = -1
+        self._update_virtual_size()
+        self.cursor = 0
+        self.refresh()
+
+    def prepend(self, indices: Sequence[int]) -> None:
+        """Show ``indices`` above the current rows, keeping the cursor's entry."""
+        if not indices:
+            return
+        had_rows = bool(self.order)
+        self.order[:0] = indices
+        self._rows.clear()
+        if had_rows:
+            self.cursor += len(indices)
+        self._update_virtual_size()
+        self.refresh()
+
+    def append(self, indices: Sequence[int]) -> None:
+        """Show ``indices`` below the current rows."""
+        if not indices:
+            return
+        self.order.extend(indices)
+        self._update_virtual_size()
+        self.refresh()
+
+    def refresh_entry(self, index: int) -> None:
+        """Redraw the row showing entry ``index`` (e.g. after it was read)."""
+        for position in list(self._rows):
+            if self.order[position] == index:
+                del self._rows[position]
+                self._refresh_row(position)
+
+    @property
+    def highlighted(self) -> int | None:
+        """Entry index under the cursor."""
+        if not self.order:
+            return None
+        return self.order[self.cursor]
+
+    def _update_virtual_size(self) -> None:
+        self.virtual_size = Size(self.size.width, len(self.order) * self.ROW_HEIGHT)
+
+    # -------------------------------------------------------------------------
+    # Rendering
+    # -------------------------------------------------------------------------
+
+    def on_resize(self) -> None:
+        self._update_virtual_size()
+
+    def render_line(self, y: int) -> Strip:
+        scroll_y = self.scroll_offset.y
+        line = scroll_y + y
+        position, offset = divmod(line, self.ROW_HEIGHT)
+        width = self.scrollable_content_region.width
+        if position >= len(self.order) - self.overscan:
+            # Lets the owner load more before the user scrolls off the end.
+            if self._end_reported != len(self.order):
+                self._end_reported = len(self.order)
+                self.post_message(self.EndReached())
+        if position >= len(self.order):
+            return Strip.blank(width, self.rich_style)
+        if self._rows_width != width:
+            self._rows.clear()
+            self._rows_width = width
+        self._evict(scroll_y // self.ROW_HEIGHT)
+        row = self._rows.get(position)
+        if row is None:
+            row = self._rows[position] = self._render_row(position, width)
+        return row[offset]
+
+    def _evict(self, top: int) -> None:
+        """Drop rendered rows outside the viewport plus the overscan margin."""
+        visible = self.size.height // self.ROW_HEIGHT + 1
+        low, high = top - self.overscan, top + visible + self.overscan
+        for position in [p for p in self._rows if not low <= p <= high]:
+            del self._rows[position]
+
+    def _render_row(self, position: int, width: int) -> List[Strip]:
+        entry = self.entries[self.order[position]]
+        base = self.rich_style
+        title_style = base + self.get_component_rich_style("article-list--title")
+        meta_style = base + self.get_component_rich_style("article-list--meta")
+        if entry.read:
+            read_style = self.get_component_rich_style("article-list--read")
+            title_style += read_style
+            meta_style += read_style
+        if position == self.cursor:
+            cursor_style = self.get_component_rich_style("article-list--cursor")
+            title_style += cursor_style
+            meta_style += cursor_style
+
+        marker = "  " if entry.read else "● "
+        title = marker + entry.title
+        # Repeats of a story another feed carried first stay listed, marked.
+        repeat = "also in another feed" if entry.duplicate else ""
+        meta = "  " + " • ".join(
+            part
+            for part in (entry.feed_title, entry.author, entry.published, repeat)
+            if part
+        )
+        return [
+            self._line(title, width, title_style),
+            self._line(meta, width, meta_style),
+            Strip.blank(width, base),
+        ]
+
+    @staticmethod
+    def _line(text: str, width: int, style: Style) -> Strip:
+        return Strip([Segment(set_cell_size(" " + text, width), style)], width)
+
+    def _refresh_row(self, position: int) -> None:
+        region = Region(0, position * self.ROW_HEIGHT, self.size.width, self.ROW_HEIGHT)
+        self.refresh(region.translate(-self.scroll_offset))
+
+    # -------------------------------------------------------------------------
+    # Cursor and selection
+    # -------------------------------------------------------------------------
+
+    def validate_cursor(self, cursor: int) -> int:
+        return max(0, min(cursor, len(self.order) - 1))
+
+    def watch_cursor(self, old: int, new: int) -> None:
+        for position in (old, new):
+            self._rows.pop(position, None)
+            self._refresh_row(position)
+        self.scroll_to_region(
+            Region(0, new * self.ROW_HEIGHT, 1, self.ROW_HEIGHT),
+            animate=False,
+            force=True,
+        )
+        if self.highlighted is not None:
+            self.post_message(self.Highlighted(self.highlighted))
+
+    def action_cursor_up(self) -> None:
+        self.cursor -= 1
+
+    def action_cursor_down(self) -> None:
+        self.cursor += 1
+
+    def action_page_up(self) -> None:
+        self.cursor -= max(1, self.size.height // self.ROW_HEIGHT)
+
+    def action_page_down(self) -> None:
+        self.cursor += max(1, self.size.height // self.ROW_HEIGHT)
+
+    def action_first(self) -> None:
+        self.cursor = 0
+
+    def action_last(self) -> None:
+        self.cursor = len(self.order) - 1
+
+    def action_select(self) -> None:
+        if self.highlighted is not None:
+            self.post_message(self.Selected(self.highlighted))
+
+    def on_click(self, event: events.Click) -> None:
+        offset = event.get_content_offset(self)
+        if offset is None:
+            return
+        position = (offset.y + self.scroll_offset.y) // self.ROW_HEIGHT
+        if 0 <= position < len(self.order):
+            self.cursor = position
+            self.action_select()
+
+
+class BindingsFooter(Footer):
+    """A :class:`Footer` that lets go of the keys it replaces.
+
+    Every key the footer composes binds to its ``compact`` reactive, and
+    Textual only drops the bindings of removed keys when ``compact`` changes.
+    The footer recomposes whenever focus moves, so a long session would keep
+    every key it ever showed.
+
+    The bindings live in a private attribute (checked against Textual
+    6.11); where it is missing this footer behaves like :class:`Footer`.
+    """
+
+    async def recompose(self) -> None:
+        await super().recompose()
+        # Textual stores the watchers with setattr() under this literal name,
+        # so it is not mangled and is read the same way.
+        watchers = getattr(self, "__watchers", {}).get("compact")
+        if watchers:
+            watchers[:] = [watcher for watcher in watchers if watcher[0].is_attached]
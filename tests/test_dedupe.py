@@ -0,0 +1,49 @@
+from array import array
+
+from src.dedupe import SLOTS, THRESHOLD, _EMPTY, band_keys, signature, similarity
+from src.models import Entry
+from src.store import AsyncArticleStore
+
+from .test_store import _run
+
+# Two short, unrelated stories that share a few everyday news words. With
+# empty slots counted as matches they scored 0.66.
+COUNCIL = (
+    "Mayor approves repairs",
+    "City officials told residents Tuesday flooded downtown streets reopen soon.",
+)
+MUSEUM = (
+    "Museum reopens",
+    "City officials told residents Tuesday donated paintings and rare "
+    "manuscripts arrive soon.",
+)
+
+
+def test_short_unrelated_stories_are_not_similar():
+    first, second = signature(*COUNCIL), signature(*MUSEUM)
+
+    assert first is not None and second is not None
+    assert similarity(first, second) < THRESHOLD
+
+
+def test_short_unrelated_stories_are_not_marked_duplicates(tmp_path):
+    async def scenario(store):
+        await store.merge(
+            "https://city.example/feed.xml",
+            [Entry("council", title=COUNCIL[0], summary=COUNCIL[1])],
+        )
+        return await store.merge(
+            "https://arts.example/feed.xml",
+            [Entry("museum", title=MUSEUM[0], summary=MUSEUM[1])],
+        )
+
+    (museum,) = _run(tmp_path, scenario)
+    assert not museum.duplicate
+
+
+def test_empty_bands_have_no_key():
+    slots = array("I", [_EMPTY] * SLOTS)
+    assert band_keys(slots.tobytes()) == []
+
+    slots[0] = 1
+    assert len(band_keys(slots.tobytes())) == 1
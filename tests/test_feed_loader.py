@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from benchmarks.feedserver import FeedServer
+from src.async_feed import AsyncFeedLoader, FeedTooLargeError
+
+
+def test_concurrent_loads_share_one_request():
+    async def main():
+        async with FeedServer(entries=5, latency=0.1) as server:
+            url = server.url("news")
+            async with AsyncFeedLoader() as loader:
+                first, second = await asyncio.gather(
+                    loader.load_feed(url), loader.load_feed(url)
+                )
+            return server.requests, first, second
+
+    requests, first, second = asyncio.run(main())
+
+    assert requests == 1
+    assert second is first
+
+
+def test_cancelling_one_caller_leaves_the_shared_load_running():
+    async def main():
+        async with FeedServer(entries=5, latency=0.2) as server:
+            url = server.url("news")
+            async with AsyncFeedLoader() as loader:
+                cancelled = asyncio.ensure_future(loader.load_feed(url))
+                kept = asyncio.ensure_future(loader.load_feed(url))
+                await asyncio.sleep(0.05)
+                cancelled.cancel()
+                feed = await kept
+            return server.requests, cancelled.cancelled(), feed
+
+    requests, was_cancelled, feed = asyncio.run(main())
+
+    assert was_cancelled
+    assert requests == 1
+    assert len(feed["entries"]) == 5
+
+
+def test_endless_body_is_cut_off_and_reported():
+    async def main():
+        async with FeedServer() as server:
+            async with AsyncFeedLoader(max_bytes=2**20) as loader:
+                with pytest.raises(FeedTooLargeError) as info:
+                    await loader.load_feed(server.url("news", route="endless"))
+        return info.value
+
+    error = asyncio.run(main())
+
+    assert error.limit == 2**20
+
+
+def test_oversized_feed_is_reported():
+    async def main():
+        async with FeedServer(entries=50) as server:
+            async with AsyncFeedLoader(max_bytes=1000) as loader:
+                with pytest.raises(FeedTooLargeError):
+                    await loader.load_feed(server.url("news"))
+
+    asyncio.run(main())
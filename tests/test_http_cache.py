@@ -0,0 +1,86 @@
+import asyncio
+import os
+import time
+
+from benchmarks.feedserver import FeedServer
+from src.async_feed import AsyncFeedLoader, CacheEntry, HttpCache
+
+
+def _load_twice(tmp_path, server: FeedServer, between=None):
+    async def main():
+        async with server:
+            url = server.url("news")
+            async with AsyncFeedLoader(cache=HttpCache(tmp_path)) as loader:
+                first = await loader.load_feed(url)
+                if between is not None:
+                    between()
+                second = await loader.load_feed(url)
+        return first, second
+
+    return asyncio.run(main())
+
+
+def test_unchanged_feed_is_revalidated_and_parse_reused(tmp_path):
+    server = FeedServer(entries=5, etag=True)
+    first, second = _load_twice(tmp_path, server)
+
+    assert server.requests == 2
+    assert server.not_modified == 1
+    assert second is first
+
+
+def test_changed_feed_is_downloaded_again(tmp_path):
+    server = FeedServer(entries=5, etag=True)
+    first, second = _load_twice(tmp_path, server, between=server.publish)
+
+    assert server.requests == 2
+    assert server.not_modified == 0
+    assert second["entries"][0].title == "news story -1"
+    assert first["entries"][0].title == "news story 0"
+
+
+def test_fresh_feed_is_served_without_a_request(tmp_path):
+    server = FeedServer(entries=5, max_age=60)
+    first, second = _load_twice(tmp_path, server)
+
+    assert server.requests == 1
+    assert second is first
+
+
+def test_prune_removes_feeds_not_fetched_since_cutoff(tmp_path):
+    cache = HttpCache(tmp_path)
+
+    async def main():
+        for url in ("https://old.example/feed", "https://new.example/feed"):
+            await cache.put(CacheEntry(url, etag='"1"', body=b"<rss/>"))
+            await cache.put_parsed(url, 0.0, {"entries": []})
+
+    asyncio.run(main())
+    month_ago = time.time() - 31 * 24 * 3600
+    for path in cache._paths("https://old.example/feed"):
+        os.utime(path, (month_ago, month_ago))
+
+    assert cache.prune(time.time() - 30 * 24 * 3600) == 3
+    remaining = sorted(path.name for path in tmp_path.iterdir())
+    assert remaining == sorted(
+        path.name
+        for path in (
+            *cache._paths("https://new.example/feed"),
+            cache._parsed_path("https://new.example/feed"),
+        )
+    )
+
+
+def test_remove_drops_all_files_of_a_url(tmp_path):
+    cache = HttpCache(tmp_path)
+    url = "https://example.com/feed"
+
+    async def main():
+        await cache.put(CacheEntry(url, etag='"1"', body=b"<rss/>"))
+        await cache.put_parsed(url, 0.0, {"entries": []})
+
+    asyncio.run(main())
+    cache.remove(url)
+    cache.remove(url)  # Already gone: nothing to do.
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,62 @@
+import asyncio
+import json
+import os
+
+from src import async_feed
+from src.async_feed import _JsonDocument
+
+
+def test_updates_are_coalesced_into_one_atomic_write(tmp_path, monkeypatch):
+    writes = []
+    atomic_write = async_feed._atomic_write
+
+    async def counting_write(path, data, fsync=False):
+        writes.append(path)
+        await atomic_write(path, data, fsync)
+
+    monkeypatch.setattr(async_feed, "_atomic_write", counting_write)
+    path = tmp_path / "feeds.json"
+    document = _JsonDocument(path)
+
+    async def main():
+        for i in range(5):
+            document.update({"Feed": f"https://example.com/{i}"}, delay=0.05)
+        # Served from memory before the write lands.
+        assert await document.load() == {"Feed": "https://example.com/4"}
+        assert not path.exists()
+        await asyncio.sleep(0.2)
+
+    asyncio.run(main())
+
+    assert writes == [path]
+    assert json.loads(path.read_text("utf-8")) == {"Feed": "https://example.com/4"}
+    assert not document.dirty
+
+
+def test_external_edit_is_picked_up(tmp_path):
+    path = tmp_path / "feeds.json"
+    path.write_text(json.dumps({"A": "https://a.example/feed"}), "utf-8")
+    document = _JsonDocument(path)
+
+    assert asyncio.run(document.load()) == {"A": "https://a.example/feed"}
+
+    # Same size, so only the mtime tells the edit apart.
+    path.write_text(json.dumps({"B": "https://b.example/feed"}), "utf-8")
+    mtime = path.stat().st_mtime_ns + 10**9
+    os.utime(path, ns=(mtime, mtime))
+
+    assert asyncio.run(document.load()) == {"B": "https://b.example/feed"}
+
+
+def test_document_is_usable_from_successive_event_loops(tmp_path):
+    path = tmp_path / "feeds.json"
+    document = _JsonDocument(path)
+
+    async def save(url):
+        document.update({"Feed": url}, delay=60)
+        await document.flush()
+
+    asyncio.run(save("https://example.com/1"))
+    asyncio.run(save("https://example.com/2"))
+
+    assert json.loads(path.read_text("utf-8")) == {"Feed": "https://example.com/2"}
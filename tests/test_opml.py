@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from benchmarks.feedserver import FeedServer
+from src.async_feed import AsyncFeedLoader, AsyncFileHandler
+from src.opml import build_opml, import_opml, parse_opml
+
+NESTED = b"""<?xml version="1.0"?>
+<opml version="1.0">
+  <head><title>Subscriptions</title></head>
+  <body>
+    <outline text="News">
+      <outline text="Wire" xmlUrl=" https://wire.example/rss "/>
+      <outline text="Tech">
+        <outline title="Deep" text="ignored" xmlurl="https://deep.example/atom"/>
+      </outline>
+    </outline>
+    <outline text="Just a folder"/>
+  </body>
+</opml>
+"""
+
+
+def test_parse_flattens_folders():
+    assert parse_opml(NESTED) == [
+        ("Wire", "https://wire.example/rss"),
+        ("Deep", "https://deep.example/atom"),
+    ]
+
+
+@pytest.mark.parametrize("data", [b"<opml><body>", b"<rss version='2.0'/>"])
+def test_parse_rejects_other_documents(data):
+    with pytest.raises(ValueError):
+        parse_opml(data)
+
+
+def test_export_round_trips():
+    feeds = {
+        "Ben & Jerry's \"blog\"": "https://example.com/feed?a=1&b=2",
+        "Ünïcode": "https://example.org/rss",
+    }
+
+    assert parse_opml(build_opml(feeds)) == list(feeds.items())
+
+
+def test_import_skips_duplicates_and_follows_permanent_moves(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    async def main():
+        async with FeedServer(entries=3) as server:
+            existing = server.url("a")
+            await AsyncFileHandler.save_feeds({"A": existing})
+            opml = build_opml(
+                {
+                    "A again": existing.replace("http://", "https://") + "/",
+                    "B": server.url("b"),
+                    "B tracked": server.url("b") + "?utm_source=newsletter",
+                    "Moved": server.url("c", route="moved"),
+                    "Redirected": server.url("d", route="redirect"),
+                    "Moved onto A": server.url("a", route="moved"),
+                    "Broken": server.url("e", route="missing"),
+                }
+            )
+            async with AsyncFeedLoader() as loader:
+                report = await import_opml(opml, loader)
+            await AsyncFileHandler.flush()
+            return server, report, await AsyncFileHandler.load_feeds()
+
+    server, report, feeds = asyncio.run(main())
+
+    assert feeds == {
+        "A": server.url("a"),
+        "B": server.url("b"),
+        "Moved": server.url("c"),
+        "Redirected": server.url("d"),
+    }
+    assert report.added == {title: feeds[title] for title in feeds if title != "A"}
+    assert report.moved == {
+        server.url("c", route="moved"): server.url("c"),
+        server.url("d", route="redirect"): server.url("d"),
+    }
+    assert [title for title, _ in report.skipped] == [
+        "A again",
+        "B tracked",
+        "Moved onto A",
+    ]
+    assert [result.title for result in report.failed] == ["Broken"]
+    assert (tmp_path / ".config" / "rss-feed-tui" / "feeds.json").exists()
@@ -0,0 +1,49 @@
+import asyncio
+import time
+
+from src.refresh import RefreshResult
+from src.scheduler import PollScheduler
+
+
+class _BlockingRefresher:
+    """Counts polls and holds each one until ``release`` is set."""
+
+    def __init__(self) -> None:
+        self.polls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def refresh_one(self, title: str, url: str) -> RefreshResult:
+        self.polls += 1
+        self.started.set()
+        await self.release.wait()
+        return RefreshResult(title, url)
+
+
+def test_feed_readded_during_poll_is_polled_again():
+    async def scenario() -> None:
+        refresher = _BlockingRefresher()
+        scheduler = PollScheduler(
+            refresher, min_interval=0.05, default_interval=0.05, startup_spread=0
+        )
+        feeds = {"Feed": "https://example.com/feed.xml"}
+        scheduler.sync(feeds)
+        runner = asyncio.create_task(scheduler.run())
+        try:
+            await asyncio.wait_for(refresher.started.wait(), 1)
+            # Removed and added back while its first poll is still running.
+            scheduler.sync({})
+            scheduler.sync(feeds)
+            refresher.release.set()
+
+            deadline = time.monotonic() + 2
+            while refresher.polls < 2 and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+        finally:
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
+
+        assert refresher.polls >= 2
+        assert scheduler.next_due(feeds["Feed"]) is not None
+
+    asyncio.run(scenario())
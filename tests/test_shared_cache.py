@@ -0,0 +1,55 @@
+import asyncio
+
+from src.shared_cache import SharedFetchCache
+
+URL = "https://example.com/feed.xml"
+
+
+def test_sharing_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.delenv("RSS_FEED_TUI_SHARED_CACHE", raising=False)
+    assert SharedFetchCache.for_config_dir(tmp_path) is None
+
+    monkeypatch.setenv("RSS_FEED_TUI_SHARED_CACHE", "1")
+    assert isinstance(SharedFetchCache.for_config_dir(tmp_path), SharedFetchCache)
+
+
+def test_lease_is_handed_over_with_the_result(tmp_path):
+    # Two caches on one file stand in for two app processes.
+    async def main():
+        first = SharedFetchCache(tmp_path / "fetches.db", poll_interval=0.01)
+        second = SharedFetchCache(tmp_path / "fetches.db", poll_interval=0.01)
+        try:
+            assert await first.acquire(URL)
+            assert not await second.acquire(URL)
+            assert await second.get(URL) is None
+
+            waiting = asyncio.ensure_future(second.wait(URL))
+            await asyncio.sleep(0.05)
+            assert not waiting.done()
+            await first.put(URL, {"entries": ["story"]})
+            await asyncio.wait_for(waiting, 1)
+
+            assert await second.get(URL) == {"entries": ["story"]}
+            # Checked within min_interval: nobody fetches it again yet.
+            assert not await second.acquire(URL)
+        finally:
+            await first.close()
+            await second.close()
+
+    asyncio.run(main())
+
+
+def test_expired_lease_can_be_taken_over(tmp_path):
+    async def main():
+        crashed = SharedFetchCache(tmp_path / "fetches.db", lease_time=0.05)
+        other = SharedFetchCache(tmp_path / "fetches.db")
+        try:
+            assert await crashed.acquire(URL)
+            assert not await other.acquire(URL)
+            await asyncio.sleep(0.1)
+            assert await other.acquire(URL)
+        finally:
+            await crashed.close()
+            await other.close()
+
+    asyncio.run(main())
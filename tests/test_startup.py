@@ -0,0 +1,13 @@
+from benchmarks.bench_startup import DEFERRED, _importtime, _make_home
+
+# Several times the usual cost, so only a real regression (say, Textual's
+# widgets or a deferred library imported eagerly again) trips it.
+IMPORT_BUDGET = 2.0
+
+
+def test_app_imports_quickly_without_deferred_libraries(tmp_path):
+    _make_home(str(tmp_path))
+    total, packages = _importtime(str(tmp_path))
+
+    assert [name for name in DEFERRED if name in packages] == []
+    assert 0 < total < IMPORT_BUDGET
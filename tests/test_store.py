@@ -0,0 +1,116 @@
+import asyncio
+from pathlib import Path
+
+from src.models import Entry
+from src.store import AsyncArticleStore
+
+BOILERPLATE = (
+    "Subscribe to our weekly podcast wherever you listen, leave a review, "
+    "follow the hosts on social media and join the listener community forum "
+    "for bonus episodes, transcripts, merchandise discounts and live events."
+)
+WIRE_STORY = (
+    "Central bank officials raised benchmark interest rates by a quarter point "
+    "on Wednesday, citing persistent inflation in housing, energy and services "
+    "while signalling further increases remain possible later this year."
+)
+
+
+def _run(tmp_path: Path, scenario):
+    async def main():
+        store = AsyncArticleStore(tmp_path / "articles.db")
+        try:
+            return await scenario(store)
+        finally:
+            await store.close()
+
+    return asyncio.run(main())
+
+
+def test_same_feed_articles_are_never_hidden(tmp_path):
+    podcast = "https://podcast.example/feed.xml"
+    blog = "https://blog.example/feed.xml"
+
+    async def scenario(store):
+        await store.merge(
+            podcast,
+            [
+                Entry(
+                    f"ep{i}",
+                    title=f"Episode {i}",
+                    link=f"https://podcast.example/{i}",
+                    summary=BOILERPLATE,
+                    published_ts=1000.0 + i,
+                )
+                for i in range(4)
+            ],
+        )
+        await store.merge(
+            blog,
+            [
+                Entry(
+                    f"post{i}",
+                    title=f"Post {i}",
+                    link="https://blog.example/",
+                    published_ts=1000.0 + i,
+                )
+                for i in range(3)
+            ],
+        )
+        return await store.entries(podcast), await store.entries(blog)
+
+    episodes, posts = _run(tmp_path, scenario)
+    assert [entry.title for entry in episodes] == [f"Episode {i}" for i in (3, 2, 1, 0)]
+    assert [entry.title for entry in posts] == ["Post 2", "Post 1", "Post 0"]
+    assert not any(entry.duplicate for entry in episodes + posts)
+
+
+def test_cross_feed_repeat_is_marked_in_feed_and_hidden_in_timeline(tmp_path):
+    wire = "https://wire.example/feed.xml"
+    paper = "https://paper.example/feed.xml"
+
+    async def scenario(store):
+        await store.merge(
+            wire,
+            [
+                Entry(
+                    "rates",
+                    title="Central bank raises rates",
+                    link="https://wire.example/rates",
+                    summary=WIRE_STORY,
+                    published_ts=1000.0,
+                )
+            ],
+        )
+        new = await store.merge(
+            paper,
+            [
+                Entry(
+                    "paper-rates",
+                    title="Rates go up again",
+                    link="https://paper.example/rates",
+                    summary=WIRE_STORY,
+                    published_ts=1001.0,
+                ),
+                Entry(
+                    "local",
+                    title="Local team wins",
+                    link="https://paper.example/local",
+                    published_ts=1002.0,
+                ),
+            ],
+        )
+        pages = await store.feed_pages({wire: None, paper: None}, 10)
+        return new, await store.entries(paper), pages
+
+    new, listed, pages = _run(tmp_path, scenario)
+    assert [(entry.id, entry.duplicate) for entry in new] == [
+        ("paper-rates", True),
+        ("local", False),
+    ]
+    assert [(entry.id, entry.duplicate) for entry in listed] == [
+        ("local", False),
+        ("paper-rates", True),
+    ]
+    timeline = [entry.id for rows in pages.values() for _, _, entry in rows]
+    assert sorted(timeline) == ["local", "rates"]
@@ -1,3 +1,4 @@
+import os
 import socket
 
 from textual_serve.server import Server
@@ -5,5 +6,8 @@ from textual_serve.server import Server
 ip = socket.gethostbyname(socket.gethostname())
 port = 8000
 print(ip)
-server = Server(r"python .\src\app.py", host=ip, port=port)
+# One app process per browser session; they share feed fetches through
+# ~/.config/rss-feed-tui/fetches.db (see src/shared_cache.py).
+os.environ.setdefault("RSS_FEED_TUI_SHARED_CACHE", "1")
+server = Server("python index.py", host=ip, port=port)
 server.serve(debug=False)